@@ -4,11 +4,38 @@ from src.services.speaker_service import SpeakerService
 from src.services.vendor_service import VendorService
 from src.services.feedback_service import FeedbackService
 from src.services.event_service import EventService
+from src.services.event_purger import PURGE_SCHEDULED
+from src.services.participant_import_service import ParticipantImportService, detect_format
+from src.services.search_service import SearchService
+from src.database.unit_of_work import init_app as init_unit_of_work
+from src.database.query_metrics import query_metrics
+from src.metrics import flask_metrics
+from src.notifications.listeners import email_listeners, log_listeners  # noqa: F401 - registra os ouvintes
+from src.notifications.outbox import outbox_relay
+from src.controllers.api import register_api
+from src.controllers.pagination import page_args
+from src.repositories.pagination import next_cursor
 
 def create_app():
     app = Flask(__name__)
     app.secret_key = 'sua_chave_secreta'
 
+    # Duração por rota e /metrics (Prometheus). Os after_request rodam em ordem inversa:
+    # registrada primeiro, a medição inclui o commit do fim da requisição
+    flask_metrics.init_app(app)
+    # Consultas SQL por requisição (cabeçalhos X-DB-*); registrada antes da unidade de trabalho
+    # para contar também o que é gravado no commit do fim da requisição
+    query_metrics.init_app(app)
+    # Uma sessão e uma transação por requisição, compartilhadas por todos os repositórios
+    init_unit_of_work(app)
+    # API JSON versionada (src/controllers) em /api/v1
+    register_api(app)
+
+    # Entrega as notificações pendentes no outbox (inclusive as deixadas por um processo que caiu)
+    @app.before_request
+    def _start_outbox_relay():
+        outbox_relay.ensure_started()
+
     @app.route("/")
     def index():
         return render_template("index.html")
@@ -28,10 +55,42 @@ def create_app():
                 flash(f"Erro ao criar evento: {e}", "danger")
         return render_template("criar_evento.html")
 
+    # Busca
+    @app.route("/buscar")
+    def buscar():
+        termo = (request.args.get("q") or "").strip()
+        tipo = request.args.get("tipo") or None
+        resultado = None
+        if termo:
+            try:
+                resultado = SearchService().search(
+                    termo, kinds=[tipo] if tipo else None,
+                    offset=safe_int(request.args.get("offset"), 0)
+                )
+            except ValueError as e:
+                flash(str(e), "danger")
+        return render_template("buscar.html", termo=termo, tipo=tipo, resultado=resultado)
+
+    @app.route("/painel")
+    def painel():
+        limite, after_id = page_args()
+        painel = EventService().get_dashboard(limite, after_id)
+        return render_template("painel.html", eventos=painel["events"], totais=painel["totals"],
+                               limite=limite,
+                               pagina_inicial=after_id is None,
+                               proximo_cursor=next_cursor(painel["events"], limite))
+
     @app.route("/eventos")
     def listar_eventos():
-        eventos = EventService().list_events()
-        return render_template("eventos.html", eventos=eventos)
+        limite, after_id = page_args()
+        service = EventService()
+        eventos = service.list_events(limite, after_id)
+        # Contagens da página inteira em um lote, sem carregar participantes etc.
+        estatisticas = service.get_stats([evento["id"] for evento in eventos])
+        return render_template("eventos.html", eventos=eventos, estatisticas=estatisticas,
+                               limite=limite,
+                               pagina_inicial=after_id is None,
+                               proximo_cursor=next_cursor(eventos, limite))
 
     @app.route("/editar_evento/<int:event_id>", methods=["GET", "POST"])
     def editar_evento(event_id):
@@ -48,25 +107,20 @@ def create_app():
             except Exception as e:
                 flash(f"Erro ao atualizar: {e}", "danger")
         
-        evento = service.repo.get_by_id(event_id)
+        evento = service.get_event(event_id)
         
         if not evento:
             flash("Evento não encontrado!", "danger")
             return redirect(url_for("listar_eventos"))
-         
-        evento_dict = {
-            "id": evento.id,
-            "display_name": f"{evento.id}: {evento.name}",
-            "name": evento.name,
-            "date": evento.date,
-            "budget": evento.budget
-        }
             
-        return render_template("editar_evento.html", evento=evento_dict)
+        return render_template("editar_evento.html", evento=evento)
 
     @app.route("/excluir_evento/<int:event_id>")
     def excluir_evento(event_id):
-        if EventService().delete(event_id):
+        resultado = EventService().delete(event_id)
+        if resultado == PURGE_SCHEDULED:
+            flash("Exclusão do evento iniciada; ele some da lista quando terminar.", "success")
+        elif resultado:
             flash("Evento excluído com sucesso!", "success")
         else:
             flash("Evento não encontrado!", "danger")
@@ -97,17 +151,41 @@ def create_app():
     def listar_participantes():
         participantes = None
         event_id = safe_int(request.args.get("event_id"))
+        limite, after_id = page_args()
         
         eventos = EventService().list_events()
         
         if event_id:
-            participantes = ParticipantService().get_attendees(event_id)
+            participantes = ParticipantService().get_attendees(event_id, limite, after_id)
             
         return render_template("participantes.html", 
                             participantes=participantes, 
                             eventos=eventos,
-                            evento_selecionado=event_id)
+                            evento_selecionado=event_id,
+                            limite=limite,
+                            pagina_inicial=after_id is None,
+                            proximo_cursor=next_cursor(participantes, limite))
     
+    @app.route("/importar_participantes", methods=["GET", "POST"])
+    def importar_participantes():
+        relatorio = None
+        if request.method == "POST":
+            arquivo = request.files.get("arquivo")
+            if not arquivo or not arquivo.filename:
+                flash("Selecione um arquivo CSV ou JSONL.", "danger")
+                return redirect(url_for("importar_participantes"))
+            event_id = safe_int(request.form.get("event_id"))
+            try:
+                relatorio = ParticipantImportService().import_stream(
+                    arquivo.stream, detect_format(arquivo.filename), event_id
+                )
+                flash(f"{relatorio.rows_imported} participantes importados!", "success")
+            except Exception as e:
+                flash(f"Erro na importação: {e}", "danger")
+
+        eventos = EventService().list_events()
+        return render_template("importar_participantes.html", eventos=eventos, relatorio=relatorio)
+
     @app.route("/editar_participante/<int:participant_id>", methods=["GET", "POST"])
     def editar_participante(participant_id):
         if request.method == "POST":
@@ -152,17 +230,21 @@ def create_app():
     def listar_palestrantes():
         palestrantes = None
         event_id = safe_int(request.args.get("event_id"))
+        limite, after_id = page_args()
         
         # Buscar eventos para o dropdown
         eventos = EventService().list_events()
         
         if event_id:
-            palestrantes = SpeakerService().list_speakers(event_id)
+            palestrantes = SpeakerService().list_speakers(event_id, limite, after_id)
         
         return render_template("palestrantes.html", 
                             palestrantes=palestrantes, 
                             eventos=eventos,  
-                            evento_selecionado=event_id)
+                            evento_selecionado=event_id,
+                            limite=limite,
+                            pagina_inicial=after_id is None,
+                            proximo_cursor=next_cursor(palestrantes, limite))
 
     @app.route("/editar_palestrante/<int:speaker_id>", methods=["GET", "POST"])
     def editar_palestrante(speaker_id):
@@ -203,16 +285,20 @@ def create_app():
     def listar_fornecedores():
         fornecedores = None
         event_id = safe_int(request.args.get("event_id"))
+        limite, after_id = page_args()
         
         eventos = EventService().list_events()
         
         if event_id:
-            fornecedores = VendorService().list_vendors(event_id)
+            fornecedores = VendorService().list_vendors(event_id, limite, after_id)
         
         return render_template("fornecedores.html", 
                             fornecedores=fornecedores, 
                             eventos=eventos,
-                            evento_selecionado=event_id)
+                            evento_selecionado=event_id,
+                            limite=limite,
+                            pagina_inicial=after_id is None,
+                            proximo_cursor=next_cursor(fornecedores, limite))
 
     @app.route("/editar_fornecedor/<int:vendor_id>", methods=["GET", "POST"])
     def editar_fornecedor(vendor_id):
@@ -235,20 +321,31 @@ def create_app():
             event_id = safe_int(request.form.get("event_id"))
             amount = request.form.get("amount")
             try:
-                EventService().update_budget(event_id, int(amount))
+                evento = EventService().update_budget(event_id, float(amount))
+                if evento is None:
+                    raise ValueError("Evento não encontrado.")
                 flash("Orçamento atualizado!", "success")
-                return redirect(url_for("ver_orcamento"))
+                return redirect(url_for("ver_orcamento", event_id=event_id))
             except Exception as e:
                 flash(f"Erro: {e}", "danger")
         return render_template("atualizar_orcamento.html")
 
     @app.route("/ver_orcamento", methods=["GET"])
     def ver_orcamento():
-        budget = None
+        budget, totais, lancamentos = None, None, []
         event_id = safe_int(request.args.get("event_id"))
+        limite, after_id = page_args()
         if event_id:
-            budget = EventService().get_budget(event_id)
-        return render_template("ver_orcamento.html", budget=budget)
+            service = EventService()
+            totais = service.get_budget_totals(event_id)
+            if totais is not None:
+                budget = totais["budget"]
+                lancamentos = service.get_budget_history(event_id, limite, after_id)
+        return render_template(
+            "ver_orcamento.html", budget=budget, totais=totais, lancamentos=lancamentos,
+            event_id=event_id, limite=limite, pagina_inicial=after_id is None,
+            proximo_cursor=next_cursor(lancamentos, limite)
+        )
 
     @app.route("/editar_orcamento", methods=["GET", "POST"])
     def editar_orcamento():
@@ -256,9 +353,11 @@ def create_app():
             event_id = safe_int(request.form.get("event_id"))
             novo_orcamento = request.form.get("novo_orcamento")
             try:
-                EventService().edit_budget(event_id, int(novo_orcamento))
+                evento = EventService().edit_budget(event_id, float(novo_orcamento))
+                if evento is None:
+                    raise ValueError("Evento não encontrado.")
                 flash("Orçamento alterado!", "success")
-                return redirect(url_for("ver_orcamento"))
+                return redirect(url_for("ver_orcamento", event_id=event_id))
             except Exception as e:
                 flash(f"Erro: {e}", "danger")
         return render_template("editar_orcamento.html")
@@ -283,17 +382,21 @@ def create_app():
     def ver_feedbacks():
         feedbacks = None
         event_id = safe_int(request.args.get("event_id"))
+        limite, after_id = page_args()
         
         # Buscar eventos para o dropdown
         eventos = EventService().list_events()
         
         if event_id:
-            feedbacks = FeedbackService().get_feedback(event_id)
+            feedbacks = FeedbackService().get_feedback(event_id, limite, after_id)
         
         return render_template("ver_feedbacks.html", 
                             feedbacks=feedbacks, 
                             eventos=eventos,
-                            evento_selecionado=event_id)
+                            evento_selecionado=event_id,
+                            limite=limite,
+                            pagina_inicial=after_id is None,
+                            proximo_cursor=next_cursor(feedbacks, limite))
 
     return app
 
@@ -0,0 +1,287 @@
+"""
+EXPERIMENTAL: ponto de entrada ASGI sobre a pilha assíncrona
+(src/services/async_services.py), para medir o ganho de um loop de eventos com
+clientes lentos. Não é a API: a API JSON completa (/api/v1) é a do app WSGI
+(wsgi.py), e este app só responde sob /api/experimental/async.
+
+Uso (requer uvicorn e o driver assíncrono do banco, em requirements-async.txt):
+    pip install -r requirements-async.txt
+    uvicorn asgi_experimental:app --workers 4
+
+Cobre só um subconjunto das rotas (leituras de eventos e cadastro/listagem de
+participantes, palestrantes, fornecedores e feedbacks), sem ETag nem gzip; as
+demais respondem 404. Os handlers repetem os do Flask e não têm garantia de
+acompanhá-los.
+"""
+import json
+import logging
+import re
+from urllib.parse import parse_qsl
+
+from src.database.async_db import dispose_async_engine, get_async_engine
+from src.database.async_unit_of_work import AsyncUnitOfWork
+from src.database.db import DATABASE_URL, is_memory_database
+from src.repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, clamp_limit, cursor_headers
+from src.services.async_services import (
+    AsyncEventService, AsyncFeedbackService, AsyncParticipantService,
+    AsyncSpeakerService, AsyncVendorService,
+)
+
+logger = logging.getLogger(__name__)
+
+# Prefixo próprio, para o app experimental nunca ser confundido com /api/v1
+API_PREFIX = "/api/experimental/async"
+# Corpo máximo aceito nos POST (os cadastros são objetos JSON pequenos)
+MAX_BODY_SIZE = 1024 * 1024
+
+event_service = AsyncEventService()
+participant_service = AsyncParticipantService()
+speaker_service = AsyncSpeakerService()
+vendor_service = AsyncVendorService()
+feedback_service = AsyncFeedbackService()
+
+
+class Request:
+    """O mínimo de uma requisição que os handlers usam: query string e corpo JSON"""
+
+    def __init__(self, scope, body):
+        self.method = scope["method"]
+        self.path = scope["path"]
+        self.args = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+        self.body = body
+
+    def get_json(self):
+        """Como request.get_json(silent=True): None se o corpo não for JSON válido"""
+        try:
+            return json.loads(self.body) if self.body else None
+        except ValueError:
+            return None
+
+    def get_int(self, name):
+        try:
+            return int(self.args[name])
+        except (KeyError, ValueError):
+            return None
+
+    def page_args(self, default_limit=DEFAULT_PAGE_SIZE):
+        """Ver src/controllers/pagination.page_args"""
+        return clamp_limit(self.get_int("limit"), default_limit), self.get_int("after_id")
+
+
+def _error(message, status):
+    return status, {"error": message}
+
+
+# Rotas: (método, padrão do caminho sem o prefixo, handler)
+ROUTES = []
+
+
+def route(method, pattern):
+    def decorator(handler):
+        ROUTES.append((method, re.compile(f"^{pattern}$"), handler))
+        return handler
+    return decorator
+
+
+@route("GET", "/events")
+async def list_events(request):
+    limit, after_id = request.page_args()
+    start, end = request.args.get("start"), request.args.get("end")
+    events = await event_service.list_events(limit, after_id, start, end, request.args.get("after_date"))
+    return 200, events, cursor_headers(events, limit, start is not None or end is not None)
+
+
+@route("GET", "/events/stats")
+async def event_stats(request):
+    try:
+        ids = [int(value) for value in request.args.get("ids", "").split(",") if value.strip()]
+    except ValueError:
+        return _error("ids must be a comma-separated list of integers", 400)
+    if len(ids) > MAX_PAGE_SIZE:
+        return _error(f"At most {MAX_PAGE_SIZE} ids per request", 400)
+    stats = await event_service.get_stats(ids)
+    return 200, {str(event_id): values for event_id, values in stats.items()}
+
+
+@route("GET", r"/events/(?P<event_id>\d+)")
+async def get_event(request, event_id):
+    event = await event_service.get_event(int(event_id))
+    if not event:
+        return _error("Event not found", 404)
+    return 200, event
+
+
+@route("POST", "/register_participant")
+async def register_participant(request):
+    data = request.get_json() or {}
+    event_id, name = data.get("event_id"), data.get("name")
+    if not event_id or not name:
+        return _error("Missing event_id or name", 400)
+    participant = await participant_service.create(event_id, name)
+    return 200, {"message": "Participant registered", "participant": participant}
+
+
+@route("GET", "/attendees")
+async def get_attendees(request):
+    limit, after_id = request.page_args()
+    attendees = await participant_service.get_attendees(request.get_int("event_id"), limit, after_id)
+    if attendees is None:
+        return _error("Event not found", 404)
+    return 200, {"participants": attendees}, cursor_headers(attendees, limit)
+
+
+@route("POST", "/register_speaker")
+async def register_speaker(request):
+    data = request.get_json() or {}
+    event_id, name = data.get("event_id"), data.get("name")
+    if not event_id or not name:
+        return _error("Missing event_id or speaker name", 400)
+    speaker = await speaker_service.create(name, data.get("description"), event_id)
+    if not speaker:
+        return _error("Event not found", 404)
+    return 200, {"message": "Speaker registered", "speaker": speaker}
+
+
+@route("GET", "/list_speakers")
+async def list_speakers(request):
+    limit, after_id = request.page_args()
+    speakers = await speaker_service.list_speakers(request.get_int("event_id"), limit, after_id)
+    if speakers is None:
+        return _error("Event not found", 404)
+    return 200, {"speakers": speakers}, cursor_headers(speakers, limit)
+
+
+@route("POST", "/register_vendor")
+async def register_vendor(request):
+    data = request.get_json() or {}
+    event_id, name = data.get("event_id"), data.get("name")
+    if not event_id or not name:
+        return _error("Missing event_id or vendor name", 400)
+    vendor = await vendor_service.create(name, data.get("services"), event_id)
+    if not vendor:
+        return _error("Event not found", 404)
+    return 200, {"message": "Vendor registered", "vendor": vendor}
+
+
+@route("GET", "/list_vendors")
+async def list_vendors(request):
+    limit, after_id = request.page_args()
+    vendors = await vendor_service.list_vendors(request.get_int("event_id"), limit, after_id)
+    if vendors is None:
+        return _error("Event not found", 404)
+    return 200, {"vendors": vendors}, cursor_headers(vendors, limit)
+
+
+@route("POST", "/add_feedback")
+async def add_feedback(request):
+    data = request.get_json() or {}
+    event_id, content = data.get("event_id"), data.get("feedback")
+    if not event_id or not content:
+        return _error("Missing event_id or feedback", 400)
+    feedback = await feedback_service.create(content, event_id)
+    if not feedback:
+        return _error("Event not found", 404)
+    return 200, {"message": "Feedback added", "feedback": feedback}
+
+
+@route("GET", "/feedbacks")
+async def get_feedback(request):
+    limit, after_id = request.page_args()
+    feedbacks = await feedback_service.get_feedback(request.get_int("event_id"), limit, after_id)
+    if feedbacks is None:
+        return _error("Event not found", 404)
+    return 200, {"feedbacks": feedbacks}, cursor_headers(feedbacks, limit)
+
+
+def _match(method, path):
+    """(handler, parâmetros do caminho) ou a resposta de erro 404/405"""
+    if not path.startswith(API_PREFIX + "/"):
+        return None, _error(f"Not Found (the experimental async app only serves {API_PREFIX}; use the WSGI app for /api/v1)", 404)
+    path = path[len(API_PREFIX):]
+    allowed = False
+    for route_method, pattern, handler in ROUTES:
+        match = pattern.match(path)
+        if match:
+            if route_method == method:
+                return (handler, match.groupdict()), None
+            allowed = True
+    if allowed:
+        return None, _error("Method Not Allowed", 405)
+    return None, _error("Not Found", 404)
+
+
+async def _dispatch(request):
+    found, error = _match(request.method, request.path)
+    if error:
+        return (*error, {})
+    handler, params = found
+    # Uma unidade de trabalho por requisição, como no Flask: commit só se a resposta for de sucesso
+    uow = AsyncUnitOfWork()
+    try:
+        async with uow:
+            status, payload, *headers = await handler(request, **params)
+            if status >= 400:
+                await uow.rollback()
+    except ValueError as e:
+        # Validações dos modelos levantam ValueError, como na API Flask
+        return 400, {"error": str(e)}, {}
+    except Exception:
+        logger.exception("Erro inesperado em %s %s", request.method, request.path)
+        return 500, {"error": "Internal server error"}, {}
+    return status, payload, headers[0] if headers else {}
+
+
+async def _read_body(receive):
+    body = b""
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return None
+        body += message.get("body", b"")
+        if len(body) > MAX_BODY_SIZE:
+            return False
+        if not message.get("more_body"):
+            return body
+
+
+async def _send_json(send, status, payload, headers):
+    body = json.dumps(payload, default=str).encode()
+    raw_headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    raw_headers += [(name.lower().encode(), value.encode()) for name, value in headers.items()]
+    await send({"type": "http.response.start", "status": status, "headers": raw_headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            try:
+                engine = get_async_engine()
+                if is_memory_database(DATABASE_URL):
+                    # O banco em memória só existe neste processo: cria o esquema na subida
+                    from src.database.schema import create_schema
+                    async with engine.begin() as conn:
+                        await conn.run_sync(lambda sync_conn: create_schema(sync_conn, log=logger.info))
+            except Exception as e:
+                await send({"type": "lifespan.startup.failed", "message": str(e)})
+                return
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await dispose_async_engine()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        return await _lifespan(receive, send)
+    if scope["type"] != "http":
+        return
+    body = await _read_body(receive)
+    if body is None:
+        return
+    if body is False:
+        return await _send_json(send, 413, {"error": "Request body too large"}, {})
+    status, payload, headers = await _dispatch(Request(scope, body))
+    await _send_json(send, status, payload, headers)
@@ -0,0 +1,2 @@
+"""Benchmarks reprodutíveis: gerador de dados (seed.py), execução dos cenários
+(run.py) e comparação de resultados (compare.py)."""
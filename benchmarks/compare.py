@@ -0,0 +1,85 @@
+"""
+Compara dois resultados de benchmarks/run.py (antes e depois de uma mudança).
+
+Uso:
+    python benchmarks/compare.py benchmarks/results/antes.json benchmarks/results/depois.json
+    python benchmarks/compare.py antes.json depois.json --max-regression 10   # falha se p95 piorar >10%
+"""
+import argparse
+import json
+import sys
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "throughput_ops", "queries_per_op", "db_ms_per_op")
+
+
+def _load(path):
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def _dataset(report):
+    """Parâmetros da base, sem o tempo que levou para ser gerada"""
+    return {key: value for key, value in report["dataset"].items() if key != "seconds"}
+
+
+def _change(before, after):
+    """Variação percentual de before para after (None quando não dá para calcular)"""
+    if before in (None, 0) or after is None:
+        return None
+    return (after - before) / before * 100
+
+
+def compare(before, after):
+    """Retorna {cenário: {métrica: (antes, depois, variação %)}} dos cenários presentes nos dois"""
+    common = [name for name in before["scenarios"] if name in after["scenarios"]]
+    return {
+        name: {
+            metric: (
+                before["scenarios"][name].get(metric),
+                after["scenarios"][name].get(metric),
+                _change(before["scenarios"][name].get(metric), after["scenarios"][name].get(metric)),
+            )
+            for metric in METRICS
+        }
+        for name in common
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compara dois resultados de benchmark.")
+    parser.add_argument("before", help="Resultado de referência")
+    parser.add_argument("after", help="Resultado a comparar")
+    parser.add_argument("--max-regression", type=float,
+                        help="Falha (código 1) se o p95 de algum cenário piorar mais que esta porcentagem")
+    args = parser.parse_args(argv)
+
+    before, after = _load(args.before), _load(args.after)
+    for report in (before, after):
+        print(f"{report['label']}: {report['created_at']} commit={report.get('git_commit')} "
+              f"banco={report['database']['dialect']} dados={report['dataset']}")
+    if _dataset(before) != _dataset(after) or before["database"]["dialect"] != after["database"]["dialect"]:
+        print("Aviso: as execuções usaram bases ou bancos diferentes; a comparação pode não ser válida.")
+
+    # Cada célula mostra o valor novo e a variação em relação ao de referência
+    header = f"{'cenário':<28}" + "".join(f"{metric:>22}" for metric in METRICS)
+    print(header)
+    print("-" * len(header))
+    regressions = []
+    for name, metrics in compare(before, after).items():
+        cells = []
+        for metric, (_, new, change) in metrics.items():
+            text = "-" if change is None else f"{new:g} ({change:+.1f}%)"
+            cells.append(f"{text:>22}")
+        print(f"{name:<28}" + "".join(cells))
+        p95_change = metrics["p95_ms"][2]
+        if args.max_regression is not None and p95_change is not None and p95_change > args.max_regression:
+            regressions.append(f"{name} (p95 {p95_change:+.1f}%)")
+
+    if regressions:
+        print(f"Regressões acima de {args.max_regression}%: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""
+Gera uma base sintética para os benchmarks: N eventos com M participantes,
+palestrantes, fornecedores e feedbacks cada. Os dados dependem só de --seed,
+então duas execuções com os mesmos parâmetros produzem a mesma base.
+
+Uso:
+    python benchmarks/seed.py --database-url sqlite:///benchmarks/bench.db --events 200 --participants 500
+    python benchmarks/seed.py --database-url postgresql://.../bench --reset
+
+ATENÇÃO: --reset apaga todos os dados do banco indicado.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+# Permite executar o script diretamente (python benchmarks/seed.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_DATABASE_URL = "sqlite:///benchmarks/bench.db"
+BATCH_SIZE = 5000
+
+# Vocabulário dos textos gerados; palavras repetidas de propósito para a busca ter acertos
+WORDS = (
+    "conferência palestra tecnologia dados nuvem segurança python banco evento "
+    "workshop inovação música comida bebida som iluminação palco transporte "
+    "ótimo excelente organização atraso fila atendimento local horário café"
+).split()
+FIRST_NAMES = ("Ana", "Bruno", "Carla", "Diego", "Elisa", "Fábio", "Gabriela", "Hugo", "Isabela", "João")
+LAST_NAMES = ("Silva", "Souza", "Oliveira", "Santos", "Lima", "Costa", "Pereira", "Almeida", "Ribeiro")
+
+
+def configure_environment(database_url, cache_backend="none"):
+    """Define o banco e o cache antes de importar src (o engine é criado na importação)"""
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("CACHE_BACKEND", cache_backend)
+    # Os ouvintes de e-mail/log só imprimem; entregá-los mediria o console, não a aplicação
+    os.environ.setdefault("OUTBOX_RELAY_ENABLED", "0")
+
+
+def prepare_schema(engine, reset=False):
+    """Cria o esquema (migrações no PostgreSQL, modelos nos demais) e, com reset, apaga os dados"""
+    from src.database.db import Base
+    from src.database.schema import create_schema
+
+    if reset and engine.dialect.name != "postgresql":
+        Base.metadata.drop_all(engine)
+    create_schema(engine, log=lambda message: None)
+    if reset and engine.dialect.name == "postgresql":
+        tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f"TRUNCATE {tables} RESTART IDENTITY CASCADE")
+
+
+def _sentence(rng, words):
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _person(rng):
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+def _insert(conn, table, rows):
+    for start in range(0, len(rows), BATCH_SIZE):
+        conn.execute(table.insert(), rows[start:start + BATCH_SIZE])
+
+
+def seed(engine, events=100, participants=200, speakers=5, vendors=5, feedbacks=50, seed=42):
+    """Insere os dados sintéticos; falha se já houver eventos (use prepare_schema(reset=True))"""
+    from sqlalchemy import func, select
+    from src.models import Event, Feedback, Participant, Speaker, Vendor
+
+    rng = random.Random(seed)
+    first_day = date(2025, 1, 1)
+    event_table = Event.__table__
+    counts = {"participants": participants, "speakers": speakers, "vendors": vendors, "feedbacks": feedbacks}
+    builders = {
+        "participants": (Participant.__table__, lambda event_id: {"name": _person(rng), "event_id": event_id}),
+        "speakers": (Speaker.__table__, lambda event_id: {
+            "name": _person(rng), "description": _sentence(rng, 12), "event_id": event_id}),
+        "vendors": (Vendor.__table__, lambda event_id: {
+            "name": f"{rng.choice(WORDS).title()} {rng.choice(LAST_NAMES)} Ltda", "services": _sentence(rng, 6),
+            "event_id": event_id}),
+        "feedbacks": (Feedback.__table__, lambda event_id: {"content": _sentence(rng, 20), "event_id": event_id}),
+    }
+
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        if conn.execute(select(func.count()).select_from(event_table)).scalar():
+            raise RuntimeError("O banco já tem eventos; use --reset para recriar a base do benchmark.")
+        _insert(conn, event_table, [
+            {
+                "name": f"Evento {number} - {_sentence(rng, 3)}",
+                "date": first_day + timedelta(days=rng.randrange(365)),
+                "budget": round(rng.uniform(0, 50000), 2),
+            }
+            for number in range(1, events + 1)
+        ])
+        event_ids = conn.execute(select(event_table.c.id).order_by(event_table.c.id)).scalars().all()
+        for name, (table, build) in builders.items():
+            _insert(conn, table, [build(event_id) for event_id in event_ids for _ in range(counts[name])])
+    return {
+        "events": events, **counts, "seed": seed,
+        "rows": events * (1 + sum(counts.values())),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def add_arguments(parser):
+    """Opções de tamanho da base, compartilhadas com run.py"""
+    parser.add_argument("--database-url", default=os.environ.get("BENCH_DATABASE_URL", DEFAULT_DATABASE_URL),
+                        help=f"Banco do benchmark (padrão: BENCH_DATABASE_URL ou {DEFAULT_DATABASE_URL})")
+    parser.add_argument("--events", type=int, default=100, help="Quantidade de eventos")
+    parser.add_argument("--participants", type=int, default=200, help="Participantes por evento")
+    parser.add_argument("--speakers", type=int, default=5, help="Palestrantes por evento")
+    parser.add_argument("--vendors", type=int, default=5, help="Fornecedores por evento")
+    parser.add_argument("--feedbacks", type=int, default=50, help="Feedbacks por evento")
+    parser.add_argument("--seed", type=int, default=42, help="Semente do gerador de dados")
+
+
+def seed_options(args):
+    return {name: getattr(args, name) for name in ("events", "participants", "speakers", "vendors", "feedbacks", "seed")}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera a base sintética dos benchmarks.")
+    add_arguments(parser)
+    parser.add_argument("--reset", action="store_true", help="Apaga todos os dados antes de gerar")
+    args = parser.parse_args(argv)
+
+    configure_environment(args.database_url)
+    from src.database.db import engine
+
+    prepare_schema(engine, reset=args.reset)
+    result = seed(engine, **seed_options(args))
+    print(f"{result['rows']} linhas geradas em {result['seconds']}s ({engine.url.render_as_string()}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
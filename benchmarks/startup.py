@@ -0,0 +1,105 @@
+"""
+Mede o tempo de inicialização e do primeiro request da aplicação e compara com um orçamento.
+
+Cada execução roda num interpretador novo (como um worker recém-criado): mede a
+importação de wsgi.py (create_app + aquecimento) e os primeiros requests de uma
+rota JSON e de uma página HTML. Usa a mediana de --runs execuções, grava o
+resultado em benchmarks/results/ e termina com código 1 se passar do orçamento.
+
+Uso:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 10 --budget-startup-ms 1500 --budget-first-request-ms 150
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Permite executar o script diretamente (python benchmarks/startup.py)
+sys.path.insert(0, ROOT)
+
+from benchmarks.seed import DEFAULT_DATABASE_URL, configure_environment, prepare_schema
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+# Executado no processo filho; imprime os tempos em JSON na última linha
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+sys.path.insert(0, {root!r})
+import wsgi
+loaded = time.perf_counter()
+client = wsgi.app.test_client()
+timings = {{"startup_ms": (loaded - started) * 1000}}
+for name, url in (("first_request_ms", "/api/v1/events"), ("first_page_ms", "/eventos")):
+    before = time.perf_counter()
+    response = client.get(url)
+    timings[name] = (time.perf_counter() - before) * 1000
+    if response.status_code != 200:
+        raise SystemExit(f"{{url}} respondeu {{response.status_code}}")
+print(json.dumps(timings))
+"""
+
+
+def probe(env):
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(root=ROOT)],
+        env=env, cwd=ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"A execução falhou:\n{result.stderr or result.stdout}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede inicialização e primeiro request contra um orçamento.")
+    parser.add_argument("--database-url", default=os.environ.get("BENCH_DATABASE_URL", DEFAULT_DATABASE_URL))
+    parser.add_argument("--runs", type=int, default=5, help="Execuções (usa a mediana)")
+    parser.add_argument("--budget-startup-ms", type=float, default=2000.0,
+                        help="Orçamento para importar e aquecer a aplicação")
+    parser.add_argument("--budget-first-request-ms", type=float, default=200.0,
+                        help="Orçamento para cada um dos primeiros requests")
+    parser.add_argument("--output", help="Arquivo de resultado (padrão: benchmarks/results/<data>_startup.json)")
+    args = parser.parse_args(argv)
+
+    configure_environment(args.database_url)
+    from src.database.db import engine
+    # O esquema precisa existir; os dados não importam para esta medição
+    prepare_schema(engine)
+    engine.dispose()
+
+    runs = [probe(dict(os.environ)) for _ in range(args.runs)]
+    medians = {name: round(statistics.median(run[name] for run in runs), 2) for name in runs[0]}
+    budgets = {
+        "startup_ms": args.budget_startup_ms,
+        "first_request_ms": args.budget_first_request_ms,
+        "first_page_ms": args.budget_first_request_ms,
+    }
+    over = [name for name, value in medians.items() if value > budgets[name]]
+
+    for name, value in medians.items():
+        print(f"{name:<20}{value:>10.2f} ms   orçamento {budgets[name]:.0f} ms{'   ESTOUROU' if name in over else ''}")
+
+    report = {
+        "label": "startup",
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "database": {"dialect": engine.dialect.name, "url": engine.url.render_as_string()},
+        "runs": runs,
+        "median": medians,
+        "budget": budgets,
+        "within_budget": not over,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}_startup.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2, ensure_ascii=False)
+    print(f"Resultado gravado em {output}")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Configuração do gunicorn para produção:  gunicorn -c gunicorn.conf.py wsgi:app
+(ou python main.py serve). O esquema do banco não é tocado aqui; aplique as
+migrações antes, uma vez, com python main.py setup.
+
+Valores ajustáveis pelas variáveis de ambiente abaixo. Lembre que cada worker
+tem o próprio pool: o PostgreSQL recebe até workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+conexões.
+"""
+import glob
+import multiprocessing
+import os
+import time
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+# A aplicação (carregada depois desta configuração) confere o número de workers, ex.: o cache em memória
+os.environ["WEB_CONCURRENCY"] = str(workers)
+threads = int(os.environ.get("WEB_THREADS", 1))
+timeout = int(os.environ.get("WEB_TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("WEB_GRACEFUL_TIMEOUT", 30))
+# Recicla workers periodicamente (com variação, para não reiniciarem todos juntos)
+max_requests = int(os.environ.get("WEB_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.environ.get("WEB_MAX_REQUESTS_JITTER", 100))
+# A aplicação é importada e aquecida uma vez no mestre; os workers a herdam pelo fork
+preload_app = True
+accesslog = os.environ.get("WEB_ACCESS_LOG", "-")
+
+_started = None
+
+
+def on_starting(server):
+    global _started
+    _started = time.perf_counter()
+    # Instantâneos de métricas de uma execução anterior (ver src/metrics/registry.py)
+    metrics_dir = os.environ.get("METRICS_DIR")
+    if metrics_dir:
+        for path in glob.glob(os.path.join(metrics_dir, "metrics-*.json")):
+            os.remove(path)
+
+
+def when_ready(server):
+    server.log.info("Aplicação carregada em %.0f ms", (time.perf_counter() - _started) * 1000)
+
+
+def child_exit(server, worker):
+    # Junta os contadores do worker encerrado ao arquivo morto das métricas e apaga o
+    # instantâneo dele; sem isto, cada reciclagem (max_requests) deixaria um arquivo a mais
+    from src.metrics.registry import metrics_registry
+    metrics_registry.mark_process_dead(worker.pid)
+
+
+def post_fork(server, worker):
+    # As conexões do pool herdadas do mestre pertencem a ele: o worker descarta as
+    # referências sem fechá-las (close=False) e abre as próprias na primeira consulta
+    from src.database.db import engine
+    engine.dispose(close=False)
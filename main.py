@@ -1,32 +1,75 @@
 """
 Sistema de Gerenciamento de Eventos
 Este script une a configuração do banco de dados e a inicialização da aplicação.
+
+Uso:
+    python main.py setup   # cria o banco e aplica as migrações (uma vez, e a cada atualização)
+    python main.py         # servidor de desenvolvimento (Flask, com reloader)
+    python main.py serve   # servidor de produção (gunicorn, vários workers)
 """
+import argparse
+import os
 import sys
-from utils.create_table import criar_banco, criar_tabelas
-from app import create_app
 
-def inicializar_sistema():
-    """Inicializa o sistema configurando o banco de dados e iniciando a aplicação."""
-    print("\n=== Sistema de Gerenciamento de Eventos ===\n")
-    
-    # Configuração do banco de dados
+
+def configurar_banco():
+    """Cria o banco, se preciso, e aplica as migrações pendentes."""
+    from utils.create_table import criar_banco, criar_tabelas
+
     print("Configurando banco de dados...")
     try:
         criar_banco()
+        # Só aplica as migrações pendentes; com o esquema em dia nenhum DDL é executado
         criar_tabelas()
         print("Banco de dados configurado com sucesso!")
     except Exception as e:
         print(f"Erro ao configurar banco de dados: {e}")
         sys.exit(1)
-    
-    # Inicialização da aplicação Flask
-    print("\nIniciando servidor web...")
+
+
+def inicializar_sistema():
+    """Inicia o servidor de desenvolvimento. O esquema deve ter sido criado com 'setup'."""
+    from app import create_app
+    from src.database.db import DATABASE_URL, is_memory_database
+
+    print("\n=== Sistema de Gerenciamento de Eventos ===\n")
+    if is_memory_database(DATABASE_URL):
+        # O banco em memória só existe neste processo: não há 'setup' prévio possível
+        from src.database.schema import create_schema
+        create_schema()
+    print("Iniciando servidor web...")
     app = create_app()
     print("\nServidor iniciado! Acesse http://localhost:5000 no seu navegador.")
-    
+
     # Inicia o servidor Flask
     app.run(debug=True)
 
+
+def servir_producao():
+    """Substitui este processo pelo gunicorn com a configuração de gunicorn.conf.py."""
+    raiz = os.path.dirname(os.path.abspath(__file__))
+    argumentos = ["gunicorn", "-c", os.path.join(raiz, "gunicorn.conf.py"), "--chdir", raiz, "wsgi:app"]
+    try:
+        os.execvp("gunicorn", argumentos)
+    except FileNotFoundError:
+        print("gunicorn não encontrado. Instale com: pip install -r requirements.txt")
+        sys.exit(1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sistema de Gerenciamento de Eventos")
+    parser.add_argument("comando", nargs="?", default="dev", choices=("dev", "setup", "serve"),
+                        help="dev (padrão): servidor de desenvolvimento; setup: cria o esquema; "
+                             "serve: servidor de produção")
+    args = parser.parse_args(argv)
+
+    if args.comando == "setup":
+        configurar_banco()
+    elif args.comando == "serve":
+        servir_producao()
+    else:
+        inicializar_sistema()
+
+
 if __name__ == "__main__":
-    inicializar_sistema()
\ No newline at end of file
+    main()
@@ -0,0 +1,127 @@
+# cache/cache_manager.py
+import logging
+import os
+import threading
+
+from src.cache.backends import FakeRedis, MemoryBackend, RedisBackend
+from src.database.unit_of_work import has_uncommitted_writes
+
+logger = logging.getLogger(__name__)
+
+
+class CacheManager:
+    """Cache de leitura (read-through) organizado em namespaces.
+
+    Cada namespace tem um número de versão que entra na chave; invalidar um
+    namespace só incrementa a versão, descartando de uma vez todas as chaves
+    antigas (elas saem pelo LRU ou pelo TTL). Os valores devolvidos pelo backend
+    em memória são compartilhados e não devem ser alterados por quem os recebe.
+
+    Uma leitura feita numa transação que já gravou não é guardada: ela enxerga
+    dados ainda não confirmados, que um rollback desfaria sem invalidar o cache.
+    """
+
+    def __init__(self, backend=None, ttl=30, enabled=True):
+        self.backend = backend or MemoryBackend()
+        self.ttl = ttl
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def configure(self, backend=None, ttl=None, enabled=None):
+        """Troca backend/TTL em tempo de execução (ex.: FakeRedis em testes)"""
+        if backend is not None:
+            self.backend = backend
+        if ttl is not None:
+            self.ttl = ttl
+        if enabled is not None:
+            self.enabled = enabled
+        self.reset_stats()
+
+    def _count(self, namespace, field):
+        with self._lock:
+            counters = self._stats.setdefault(namespace, {"hits": 0, "misses": 0, "invalidations": 0})
+            counters[field] += 1
+
+    def _key(self, namespace, key):
+        version = self.backend.get_counter(f"{namespace}:version")
+        return f"{namespace}:v{version}:{key}"
+
+    def get_or_load(self, namespace, key, loader):
+        """Devolve o valor em cache ou chama loader() e guarda o resultado (None não é guardado)"""
+        if not self.enabled:
+            return loader()
+        full_key = self._key(namespace, key)
+        value = self.backend.get(full_key)
+        if value is not None:
+            self._count(namespace, "hits")
+            return value
+        self._count(namespace, "misses")
+        value = loader()
+        if value is not None and not has_uncommitted_writes():
+            self.backend.set(full_key, value, self.ttl)
+        return value
+
+    async def get_or_load_async(self, namespace, key, loader):
+        """Como get_or_load, com loader assíncrono (await loader()); o backend continua síncrono"""
+        if not self.enabled:
+            return await loader()
+        full_key = self._key(namespace, key)
+        value = self.backend.get(full_key)
+        if value is not None:
+            self._count(namespace, "hits")
+            return value
+        self._count(namespace, "misses")
+        value = await loader()
+        if value is not None:
+            self.backend.set(full_key, value, self.ttl)
+        return value
+
+    def invalidate(self, namespace):
+        """Descarta todas as entradas do namespace"""
+        self.backend.incr(f"{namespace}:version")
+        self._count(namespace, "invalidations")
+
+    def stats(self):
+        with self._lock:
+            result = {}
+            for namespace, counters in self._stats.items():
+                lookups = counters["hits"] + counters["misses"]
+                result[namespace] = dict(counters, hit_rate=counters["hits"] / lookups if lookups else 0.0)
+            return result
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {}
+
+
+def build_cache_manager(environ=None):
+    """Cria o cache conforme CACHE_BACKEND (memory, redis, fakeredis ou none), CACHE_TTL e CACHE_MAXSIZE"""
+    environ = os.environ if environ is None else environ
+    kind = environ.get("CACHE_BACKEND", "memory").lower()
+    ttl = int(environ.get("CACHE_TTL", 30))
+
+    if kind == "none":
+        return CacheManager(ttl=ttl, enabled=False)
+    if kind == "memory":
+        workers = int(environ.get("WEB_CONCURRENCY", 1))
+        if workers > 1:
+            # A invalidação só alcança o processo que gravou: os demais servem dados antigos até o TTL
+            logger.warning(
+                "CACHE_BACKEND=memory com %d workers: cada worker pode servir dados desatualizados "
+                "por até %ds após uma alteração; use CACHE_BACKEND=redis", workers, ttl)
+        return CacheManager(MemoryBackend(int(environ.get("CACHE_MAXSIZE", 1024))), ttl)
+    if kind == "fakeredis":
+        return CacheManager(RedisBackend(FakeRedis()), ttl)
+    if kind == "redis":
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("CACHE_BACKEND=redis requer o pacote 'redis' (pip install redis)")
+        client = redis.Redis.from_url(environ.get("REDIS_URL", "redis://localhost:6379/0"))
+        return CacheManager(RedisBackend(client), ttl)
+    raise ValueError(f"CACHE_BACKEND desconhecido: {kind}")
+
+
+# Instância única usada pelos serviços
+cache_manager = build_cache_manager()
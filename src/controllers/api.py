@@ -0,0 +1,87 @@
+import gzip
+import logging
+
+from flask import Blueprint, request, jsonify
+from werkzeug.exceptions import HTTPException
+
+from src.controllers import (
+    budget_controller,
+    event_controller,
+    export_controller,
+    feedback_controller,
+    participant_controller,
+    search_controller,
+    speaker_controller,
+    vendor_controller,
+)
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = "/api/v1"
+# Respostas menores que isso não compensam o custo da compressão
+GZIP_MIN_SIZE = 500
+GZIP_LEVEL = 6
+
+api_bp = Blueprint("api_v1", __name__, url_prefix=API_PREFIX)
+for _controller in (event_controller, budget_controller, participant_controller,
+                    speaker_controller, vendor_controller, feedback_controller, search_controller,
+                    export_controller):
+    api_bp.register_blueprint(_controller.bp)
+
+
+def _is_api_request():
+    return request.path == API_PREFIX or request.path.startswith(API_PREFIX + "/")
+
+
+def _error(message, status):
+    return jsonify({"error": message}), status
+
+
+@api_bp.errorhandler(ValueError)
+def _validation_error(e):
+    # Validações dos modelos e das operações em lote levantam ValueError
+    return _error(str(e), 400)
+
+
+@api_bp.errorhandler(Exception)
+def _unexpected_error(e):
+    if isinstance(e, HTTPException):
+        return _error(e.description, e.code)
+    logger.exception("Erro inesperado em %s %s", request.method, request.path)
+    return _error("Internal server error", 500)
+
+
+@api_bp.after_request
+def _conditional_and_compressed(response):
+    if request.method not in ("GET", "HEAD") or response.status_code != 200 or response.is_streamed:
+        return response
+    # ETag fraca: o mesmo conteúdo pode ir comprimido ou não, e a validação continua valendo
+    response.add_etag(weak=True)
+    response.headers.setdefault("Cache-Control", "no-cache")
+    response.make_conditional(request)
+    if response.status_code == 200:
+        _gzip(response)
+    return response
+
+
+def _gzip(response):
+    response.vary.add("Accept-Encoding")
+    if (request.accept_encodings["gzip"] <= 0
+            or "Content-Encoding" in response.headers
+            or response.content_length is None
+            or response.content_length < GZIP_MIN_SIZE):
+        return
+    response.set_data(gzip.compress(response.get_data(), compresslevel=GZIP_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+
+
+def register_api(app):
+    """Registra os controllers JSON em /api/v1, com erros sempre em JSON nesse prefixo"""
+    app.register_blueprint(api_bp)
+
+    @app.errorhandler(HTTPException)
+    def _http_error(e):
+        # 404/405 de URLs inexistentes não chegam a nenhum blueprint; as páginas HTML mantêm o padrão
+        if not _is_api_request():
+            return e
+        return _error(e.description, e.code)
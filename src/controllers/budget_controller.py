@@ -1,16 +1,31 @@
 from flask import Blueprint, request, jsonify
+from src.controllers.pagination import page_args, paginated
 from src.services.event_service import EventService
 
 bp = Blueprint("budget", __name__)
 event_service = EventService()
 
+def _event_id(value):
+    """event_id como inteiro, ou None se ausente/inválido (a rota responde 400)"""
+    if isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def _invalid_event_id():
+    return jsonify({"error": "event_id must be an integer"}), 400
+
 @bp.route("/update_budget", methods=["POST"])
 def update_budget():
-    data = request.get_json()
-    event_id = data.get("event_id")
+    data = request.get_json(silent=True) or {}
+    event_id = _event_id(data.get("event_id"))
+    if event_id is None:
+        return _invalid_event_id()
     try:
-        amount = int(data.get("amount", 0))
-    except ValueError:
+        amount = float(data.get("amount", 0))
+    except (TypeError, ValueError):
         return jsonify({"error": "Amount must be a valid number"}), 400
     updated_event = event_service.update_budget(event_id, amount)
     if not updated_event:
@@ -19,7 +34,9 @@ def update_budget():
 
 @bp.route("/get_budget", methods=["GET"])
 def get_budget():
-    event_id = request.args.get("event_id")
+    event_id = _event_id(request.args.get("event_id"))
+    if event_id is None:
+        return _invalid_event_id()
     budget = event_service.get_budget(event_id)
     if budget is None:
         return jsonify({"error": "Event not found"}), 404
@@ -27,13 +44,36 @@ def get_budget():
 
 @bp.route("/edit_budget", methods=["POST"])
 def edit_budget():
-    data = request.get_json()
-    event_id = data.get("event_id")
+    data = request.get_json(silent=True) or {}
+    event_id = _event_id(data.get("event_id"))
+    if event_id is None:
+        return _invalid_event_id()
     try:
-        new_budget = int(data.get("new_budget", 0))
-    except ValueError:
+        new_budget = float(data.get("new_budget", 0))
+    except (TypeError, ValueError):
         return jsonify({"error": "New budget must be a valid number"}), 400
     updated_event = event_service.edit_budget(event_id, new_budget)
     if not updated_event:
         return jsonify({"error": "Event not found"}), 404
     return jsonify({"message": "Budget updated", "event": updated_event})
+
+@bp.route("/budget_history", methods=["GET"])
+def budget_history():
+    event_id = _event_id(request.args.get("event_id"))
+    if event_id is None:
+        return _invalid_event_id()
+    limit, after_id = page_args()
+    entries = event_service.get_budget_history(event_id, limit, after_id)
+    if entries is None:
+        return jsonify({"error": "Event not found"}), 404
+    return paginated(jsonify({"entries": entries}), entries, limit)
+
+@bp.route("/budget_totals", methods=["GET"])
+def budget_totals():
+    event_id = _event_id(request.args.get("event_id"))
+    if event_id is None:
+        return _invalid_event_id()
+    totals = event_service.get_budget_totals(event_id)
+    if totals is None:
+        return jsonify({"error": "Event not found"}), 404
+    return jsonify(totals)
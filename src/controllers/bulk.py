@@ -0,0 +1,45 @@
+from flask import request, jsonify
+
+def register_bulk_routes(bp, service, plural):
+    """Registra no blueprint as rotas em lote de uma entidade:
+
+    POST /bulk_create_<plural>  {"<plural>": [{...}, ...]}
+    POST /bulk_update_<plural>  {"<plural>": [{"id": 1, ...}, ...]}
+    POST /bulk_delete_<plural>  {"ids": [1, 2, ...]}
+    """
+
+    def body():
+        data = request.get_json(silent=True)
+        if data is None:
+            return {}
+        if not isinstance(data, dict):
+            raise ValueError("Request body must be a JSON object")
+        return data
+
+    def bulk_create():
+        try:
+            created = service.bulk_create(body().get(plural))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        return jsonify({"message": f"{len(created)} {plural} created", plural: created}), 201
+
+    def bulk_update():
+        try:
+            items = body().get(plural)
+            updated = service.bulk_update(items)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        requested = {int(item["id"]) for item in items}
+        return jsonify({"updated": updated, "not_found": sorted(requested - set(updated))})
+
+    def bulk_delete():
+        try:
+            ids = body().get("ids")
+            deleted = service.bulk_delete(ids)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        return jsonify({"deleted": deleted, "not_found": sorted({int(i) for i in ids} - set(deleted))})
+
+    bp.add_url_rule(f"/bulk_create_{plural}", f"bulk_create_{plural}", bulk_create, methods=["POST"])
+    bp.add_url_rule(f"/bulk_update_{plural}", f"bulk_update_{plural}", bulk_update, methods=["POST"])
+    bp.add_url_rule(f"/bulk_delete_{plural}", f"bulk_delete_{plural}", bulk_delete, methods=["POST"])
@@ -1,18 +1,54 @@
 from flask import Blueprint, request, jsonify
+from src.controllers.bulk import register_bulk_routes
 from src.services.event_service import EventService
-from datetime import datetime
+from src.services.event_purger import PURGE_SCHEDULED
+from src.controllers.pagination import page_args, paginated
+from src.repositories.pagination import MAX_PAGE_SIZE
 
 bp = Blueprint("event", __name__)
 event_service = EventService()
+register_bulk_routes(bp, event_service, "events")
 
 @bp.route("/events", methods=["GET"])
 def list_events():
-    events = event_service.list_events()
-    return jsonify(events)
+    limit, after_id = page_args()
+    # ?start=AAAA-MM-DD&end=AAAA-MM-DD filtra pelo intervalo de datas (inclusive)
+    start, end = request.args.get("start"), request.args.get("end")
+    events = event_service.list_events(limit, after_id, start, end, request.args.get("after_date"))
+    return paginated(jsonify(events), events, limit, by_date=start is not None or end is not None)
+
+@bp.route("/events/stats", methods=["GET"])
+def event_stats():
+    # ?ids=1,2,3 — contagens e orçamento de vários eventos em uma chamada
+    try:
+        ids = [int(value) for value in request.args.get("ids", "").split(",") if value.strip()]
+    except ValueError:
+        return jsonify({"error": "ids must be a comma-separated list of integers"}), 400
+    if len(ids) > MAX_PAGE_SIZE:
+        return jsonify({"error": f"At most {MAX_PAGE_SIZE} ids per request"}), 400
+    stats = event_service.get_stats(ids)
+    return jsonify({str(event_id): values for event_id, values in stats.items()})
+
+@bp.route("/dashboard", methods=["GET"])
+def dashboard():
+    limit, after_id = page_args()
+    result = event_service.get_dashboard(limit, after_id)
+    return paginated(jsonify(result), result["events"], limit)
+
+@bp.route("/events/calendar/<int:year>/<int:month>", methods=["GET"])
+def event_calendar(year, month):
+    return jsonify(event_service.get_calendar(year, month))
+
+@bp.route("/events/<int:event_id>", methods=["GET"])
+def get_event(event_id):
+    event = event_service.get_event(event_id)
+    if not event:
+        return jsonify({"error": "Event not found"}), 404
+    return jsonify(event)
 
 @bp.route("/create_event", methods=["POST"])
 def create_event():
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     name = data.get("name")
     date_str = data.get("date")
     budget = data.get("budget", 0)
@@ -20,22 +56,20 @@ def create_event():
     if not name or not date_str:
         return jsonify({"error": "Missing required fields"}), 400
 
-    try:
-        date = datetime.strptime(date_str, "%d-%m-%Y").date()
-    except ValueError:
-        return jsonify({"error": "Date must be in DD-MM-YYYY format"}), 400
-
     try:
         budget = int(budget)
-    except ValueError:
+    except (TypeError, ValueError):
         return jsonify({"error": "Budget must be a valid number"}), 400
 
-    event = event_service.create(name, date, budget)
+    try:
+        event = event_service.create(name, date_str, budget)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     return jsonify(event), 201
 
 @bp.route("/edit_event", methods=["POST"])
 def edit_event():
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     event_id = data.get("event_id")
     if not event_id:
         return jsonify({"error": "Missing event_id"}), 400
@@ -48,8 +82,12 @@ def edit_event():
 
 @bp.route("/delete_event", methods=["POST"])
 def delete_event():
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     event_id = data.get("event_id")
-    if event_service.delete(event_id):
+    # "background": true apaga em lotes depois da resposta (eventos muito grandes)
+    result = event_service.delete(event_id, background=True if data.get("background") else None)
+    if result == PURGE_SCHEDULED:
+        return jsonify({"message": "Event deletion scheduled", "id": event_id}), 202
+    if result:
         return jsonify({"message": "Event deleted", "id": event_id})
     return jsonify({"error": "Event not found"}), 404
@@ -0,0 +1,18 @@
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from src.services.export_service import FORMATS, ExportService
+
+bp = Blueprint("export", __name__)
+export_service = ExportService()
+
+@bp.route("/export/<entity>.<fmt>", methods=["GET"])
+def export(entity, fmt):
+    # /export/participants.csv?event_id=<id> — sem event_id exporta todos os eventos
+    event_id = request.args.get("event_id", type=int)
+    if not export_service.validate(entity, fmt, event_id):
+        return jsonify({"error": "Event not found"}), 404
+    filename = f"{entity}-{event_id}.{fmt}" if event_id else f"{entity}.{fmt}"
+    return Response(
+        stream_with_context(export_service.stream(entity, fmt, event_id)),
+        mimetype=FORMATS[fmt],
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
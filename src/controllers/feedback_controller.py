@@ -1,18 +1,29 @@
 from flask import Blueprint, request, jsonify
+from src.controllers.bulk import register_bulk_routes
+from src.controllers.pagination import page_args, paginated
 from src.services.feedback_service import FeedbackService
 
 bp = Blueprint("feedback", __name__)
 feedback_service = FeedbackService()
+register_bulk_routes(bp, feedback_service, "feedbacks")
 
 @bp.route("/add_feedback", methods=["POST"])
 def add_feedback():
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     event_id = data.get("event_id")
     content = data.get("feedback")
     if not event_id or not content:
         return jsonify({"error": "Missing event_id or feedback"}), 400
-    # Agora usamos 'create' para feedback
-    feedback = feedback_service.create(event_id, content)
+    feedback = feedback_service.create(content, event_id)
     if not feedback:
         return jsonify({"error": "Event not found"}), 404
     return jsonify({"message": "Feedback added", "feedback": feedback})
+
+@bp.route("/feedbacks", methods=["GET"])
+def get_feedback():
+    event_id = request.args.get("event_id", type=int)
+    limit, after_id = page_args()
+    feedbacks = feedback_service.get_feedback(event_id, limit, after_id)
+    if feedbacks is None:
+        return jsonify({"error": "Event not found"}), 404
+    return paginated(jsonify({"feedbacks": feedbacks}), feedbacks, limit)
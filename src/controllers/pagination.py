@@ -0,0 +1,19 @@
+from flask import request
+from src.repositories.pagination import DEFAULT_PAGE_SIZE, clamp_limit, cursor_headers
+
+def _to_int(value):
+    try:
+        return int(value) if value else None
+    except (ValueError, TypeError):
+        return None
+
+def page_args(default_limit=DEFAULT_PAGE_SIZE):
+    """Lê o cursor da query string: ?limit=<n>&after_id=<último id da página anterior>"""
+    limit = clamp_limit(_to_int(request.args.get("limit")), default_limit)
+    after_id = _to_int(request.args.get("after_id"))
+    return limit, after_id
+
+def paginated(response, items, limit, by_date=False):
+    """Acrescenta à resposta o cursor da próxima página (cabeçalho X-Next-After-Id)"""
+    response.headers.update(cursor_headers(items, limit, by_date))
+    return response
@@ -1,12 +1,17 @@
 from flask import Blueprint, request, jsonify
+from src.controllers.bulk import register_bulk_routes
+from src.controllers.pagination import page_args, paginated
 from src.services.participant_service import ParticipantService
+from src.services.participant_import_service import ParticipantImportService, detect_format
 
 bp = Blueprint("participant", __name__)
 participant_service = ParticipantService()
+import_service = ParticipantImportService()
+register_bulk_routes(bp, participant_service, "participants")
 
 @bp.route("/register_participant", methods=["POST"])
 def register_participant():
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     event_id = data.get("event_id")
     name = data.get("name")
     if not event_id or not name:
@@ -19,15 +24,16 @@ def register_participant():
 
 @bp.route("/attendees", methods=["GET"])
 def get_attendees():
-    event_id = request.args.get("event_id")
-    attendees = participant_service.get_attendees(event_id)
+    event_id = request.args.get("event_id", type=int)
+    limit, after_id = page_args()
+    attendees = participant_service.get_attendees(event_id, limit, after_id)
     if attendees is None:
         return jsonify({"error": "Event not found"}), 404
-    return jsonify({"participants": attendees})
+    return paginated(jsonify({"participants": attendees}), attendees, limit)
 
 @bp.route("/edit_participant", methods=["POST"])
 def edit_participant():
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     participant_id = data.get("participant_id")
     new_name = data.get("new_name")
     if not participant_id or not new_name:
@@ -37,3 +43,18 @@ def edit_participant():
     if not participant:
         return jsonify({"error": "Participant not found"}), 404
     return jsonify({"message": "Participant updated", "participant": participant})
+
+@bp.route("/import_participants", methods=["POST"])
+def import_participants():
+    # Aceita upload multipart (campo "file") ou o arquivo direto no corpo (?format=csv|jsonl)
+    event_id = request.args.get("event_id", type=int)
+    upload = request.files.get("file")
+    if upload:
+        stream, fmt = upload.stream, detect_format(upload.filename, request.args.get("format", "csv"))
+    else:
+        stream, fmt = request.stream, request.args.get("format", "csv")
+    try:
+        report = import_service.import_stream(stream, fmt, event_id)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({"message": "Import finished", "report": report.to_dict()})
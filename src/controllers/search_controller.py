@@ -0,0 +1,18 @@
+from flask import Blueprint, request, jsonify
+from src.services.search_service import SearchService
+
+bp = Blueprint("search", __name__)
+search_service = SearchService()
+
+@bp.route("/search", methods=["GET"])
+def search():
+    # ?q=<termo>&types=speaker,vendor&event_id=<id>&limit=<n>&offset=<n>
+    types = request.args.get("types")
+    result = search_service.search(
+        request.args.get("q"),
+        kinds=types.split(",") if types else None,
+        event_id=request.args.get("event_id", type=int),
+        limit=request.args.get("limit", type=int),
+        offset=request.args.get("offset", 0, type=int),
+    )
+    return jsonify(result)
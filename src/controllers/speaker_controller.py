@@ -1,34 +1,38 @@
 from flask import Blueprint, request, jsonify
+from src.controllers.bulk import register_bulk_routes
+from src.controllers.pagination import page_args, paginated
 from src.services.speaker_service import SpeakerService
 
 bp = Blueprint("speaker", __name__)
 speaker_service = SpeakerService()
+register_bulk_routes(bp, speaker_service, "speakers")
 
 @bp.route("/register_speaker", methods=["POST"])
 def register_speaker():
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     event_id = data.get("event_id")
     name = data.get("name")
     description = data.get("description")
     if not event_id or not name:
         return jsonify({"error": "Missing event_id or speaker name"}), 400
     # Usa o método 'create'
-    speaker = speaker_service.create(event_id, name, description)
+    speaker = speaker_service.create(name, description, event_id)
     if not speaker:
         return jsonify({"error": "Event not found"}), 404
     return jsonify({"message": "Speaker registered", "speaker": speaker})
 
 @bp.route("/list_speakers", methods=["GET"])
 def list_speakers():
-    event_id = request.args.get("event_id")
-    speakers = speaker_service.list_speakers(event_id)
+    event_id = request.args.get("event_id", type=int)
+    limit, after_id = page_args()
+    speakers = speaker_service.list_speakers(event_id, limit, after_id)
     if speakers is None:
         return jsonify({"error": "Event not found"}), 404
-    return jsonify({"speakers": speakers})
+    return paginated(jsonify({"speakers": speakers}), speakers, limit)
 
 @bp.route("/edit_speaker", methods=["POST"])
 def edit_speaker():
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     speaker_id = data.get("speaker_id")
     new_name = data.get("new_name")
     new_description = data.get("new_description")
@@ -1,34 +1,38 @@
 from flask import Blueprint, request, jsonify
+from src.controllers.bulk import register_bulk_routes
+from src.controllers.pagination import page_args, paginated
 from src.services.vendor_service import VendorService
 
 bp = Blueprint("vendor", __name__)
 vendor_service = VendorService()
+register_bulk_routes(bp, vendor_service, "vendors")
 
 @bp.route("/register_vendor", methods=["POST"])
 def register_vendor():
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     event_id = data.get("event_id")
     name = data.get("name")
     services_offered = data.get("services")
     if not event_id or not name:
         return jsonify({"error": "Missing event_id or vendor name"}), 400
     # Usa o método 'create'
-    vendor = vendor_service.create(event_id, name, services_offered)
+    vendor = vendor_service.create(name, services_offered, event_id)
     if not vendor:
         return jsonify({"error": "Event not found"}), 404
     return jsonify({"message": "Vendor registered", "vendor": vendor})
 
 @bp.route("/list_vendors", methods=["GET"])
 def list_vendors():
-    event_id = request.args.get("event_id")
-    vendors = vendor_service.list_vendors(event_id)
+    event_id = request.args.get("event_id", type=int)
+    limit, after_id = page_args()
+    vendors = vendor_service.list_vendors(event_id, limit, after_id)
     if vendors is None:
         return jsonify({"error": "Event not found"}), 404
-    return jsonify({"vendors": vendors})
+    return paginated(jsonify({"vendors": vendors}), vendors, limit)
 
 @bp.route("/edit_vendor", methods=["POST"])
 def edit_vendor():
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     vendor_id = data.get("vendor_id")
     new_name = data.get("new_name")
     new_services = data.get("new_services")
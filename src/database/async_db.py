@@ -0,0 +1,123 @@
+# database/async_db.py
+"""Engine e sessões assíncronas (extensão asyncio do SQLAlchemy), usados pela pilha ASGI.
+
+Mesma configuração do engine síncrono (src/database/config.py), trocando só o driver:
+postgresql -> asyncpg, sqlite -> aiosqlite. Os drivers são opcionais e só são exigidos
+quando o engine assíncrono é criado (na primeira requisição ASGI); a aplicação Flask
+não depende deles.
+"""
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+from src.database.config import load_database_config
+from src.database.db import _configure_sqlite, is_memory_database
+from src.database.pool_metrics import pool_metrics
+from src.database.query_metrics import query_metrics
+
+# Backend -> (driver assíncrono, pacote que o fornece)
+ASYNC_DRIVERS = {
+    "postgresql": ("asyncpg", "asyncpg"),
+    "sqlite": ("aiosqlite", "aiosqlite"),
+}
+
+
+def async_url(url):
+    """URL equivalente com o driver assíncrono (postgresql+asyncpg, sqlite+aiosqlite)"""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"Banco sem driver assíncrono suportado: {backend}")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend][0]}")
+
+
+def _require_driver(backend):
+    driver, package = ASYNC_DRIVERS[backend]
+    try:
+        __import__(driver)
+    except ImportError:
+        raise RuntimeError(
+            f"A pilha assíncrona requer o pacote '{package}'. "
+            f"Instale com: pip install {package} (ou pip install -r requirements-async.txt)"
+        ) from None
+
+
+def build_async_engine(config=None):
+    """Cria o AsyncEngine a partir da configuração; as métricas e PRAGMAs ficam no engine síncrono interno"""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    config = config or load_database_config()
+    url = async_url(config["url"])
+    is_postgres = url.get_backend_name() == "postgresql"
+    _require_driver(url.get_backend_name())
+
+    options = {"echo": config["echo"], "pool_pre_ping": config["pool_pre_ping"]}
+    connect_args = {}
+
+    if config["pgbouncer"]:
+        options["poolclass"] = NullPool
+        if is_postgres:
+            # O asyncpg prepara todos os comandos; no pooling por transação eles não sobrevivem
+            connect_args.update(statement_cache_size=0, prepared_statement_cache_size=0)
+    elif is_memory_database(url):
+        # Como no engine síncrono: uma única conexão, usada por uma transação de cada vez
+        options.update(poolclass=AsyncAdaptedQueuePool, pool_size=1, max_overflow=0,
+                       pool_timeout=config["pool_timeout"], pool_recycle=-1, pool_pre_ping=False)
+    elif is_postgres:
+        options.update(
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=config["pool_size"],
+            max_overflow=config["max_overflow"],
+            pool_timeout=config["pool_timeout"],
+            pool_recycle=config["pool_recycle"],
+        )
+
+    timeout = config["statement_timeout_ms"]
+    if timeout and is_postgres and not config["pgbouncer"]:
+        connect_args["server_settings"] = {"statement_timeout": str(int(timeout))}
+
+    new_engine = create_async_engine(url, connect_args=connect_args, **options)
+    sync_engine = new_engine.sync_engine
+
+    if timeout and is_postgres and config["pgbouncer"]:
+        from sqlalchemy import event
+
+        @event.listens_for(sync_engine, "begin")
+        def _set_statement_timeout(conn):
+            conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout)}")
+
+    if url.get_backend_name() == "sqlite":
+        _configure_sqlite(sync_engine, wal=config["sqlite_wal"] and not is_memory_database(url),
+                          busy_timeout_ms=config["sqlite_busy_timeout_ms"])
+
+    query_metrics.attach(pool_metrics.attach(sync_engine))
+    return new_engine
+
+
+_engine = None
+_session_factory = None
+
+
+def get_async_engine():
+    """AsyncEngine do processo, criado no primeiro uso"""
+    global _engine
+    if _engine is None:
+        _engine = build_async_engine()
+    return _engine
+
+
+def async_session_factory():
+    """async_sessionmaker ligado ao engine do processo (expire_on_commit=False, como SessionLocal)"""
+    global _session_factory
+    if _session_factory is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+        _session_factory = async_sessionmaker(bind=get_async_engine(), autoflush=False, expire_on_commit=False)
+    return _session_factory
+
+
+async def dispose_async_engine():
+    """Fecha as conexões do pool (no desligamento do servidor ASGI)"""
+    global _engine, _session_factory
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_factory = None
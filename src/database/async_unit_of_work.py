@@ -0,0 +1,98 @@
+# database/async_unit_of_work.py
+from contextvars import ContextVar
+from functools import wraps
+
+from src.database.async_db import async_session_factory
+
+# Unidade de trabalho assíncrona ativa; cada tarefa do asyncio (requisição ASGI) tem a sua
+_current_async_uow = ContextVar("current_async_unit_of_work", default=None)
+
+
+class AsyncUnitOfWork:
+    """Versão assíncrona de UnitOfWork: uma AsyncSession e uma transação por requisição ASGI.
+
+    Uso: ``async with AsyncUnitOfWork(): ...``. Commit na saída sem exceção,
+    rollback caso contrário; os callbacks de after_commit rodam após o commit.
+    """
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory
+        self._session = None
+        self._token = None
+        self._after_commit = []
+
+    @property
+    def session(self):
+        # Abrir a AsyncSession não faz I/O; a conexão só é obtida na primeira consulta
+        if self._session is None:
+            self._session = (self._session_factory or async_session_factory())()
+        return self._session
+
+    def after_commit(self, callback):
+        """Agenda callback() para logo depois do próximo commit bem-sucedido"""
+        self._after_commit.append(callback)
+
+    async def commit(self):
+        if self._session is not None:
+            await self._session.commit()
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            callback()
+
+    async def rollback(self):
+        self._after_commit = []
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def close(self):
+        self._after_commit = []
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        self._token = _current_async_uow.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self.close()
+            _current_async_uow.reset(self._token)
+            self._token = None
+
+
+def current_async_unit_of_work():
+    """Retorna a unidade de trabalho assíncrona ativa ou None"""
+    return _current_async_uow.get()
+
+
+def get_async_session():
+    """Retorna a AsyncSession compartilhada da unidade de trabalho ativa"""
+    uow = current_async_unit_of_work()
+    if uow is None:
+        raise RuntimeError(
+            "Nenhuma unidade de trabalho assíncrona ativa. Use 'async with AsyncUnitOfWork():' "
+            "ou chame o repositório a partir de um serviço."
+        )
+    return uow.session
+
+
+def async_transactional(func):
+    """Equivalente de @transactional para métodos de serviço async"""
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        uow = current_async_unit_of_work()
+        if uow is None:
+            async with AsyncUnitOfWork():
+                return await func(*args, **kwargs)
+        try:
+            return await func(*args, **kwargs)
+        except Exception:
+            await uow.rollback()
+            raise
+    return wrapper
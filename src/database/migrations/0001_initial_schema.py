@@ -0,0 +1,81 @@
+# database/migrations/0001_initial_schema.py
+# Esquema original de utils/create_table.py. Usa IF NOT EXISTS para que bancos
+# criados antes das migrações sejam adotados sem erro.
+DESCRIPTION = "Esquema inicial"
+
+STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS public.events (
+        id serial4 NOT NULL,
+        "name" varchar NOT NULL,
+        "date" varchar NOT NULL,
+        budget int4 NULL,
+        CONSTRAINT events_pkey PRIMARY KEY (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_events_id ON public.events USING btree (id)",
+    """
+    CREATE TABLE IF NOT EXISTS public.feedbacks (
+        id serial4 NOT NULL,
+        "content" text NOT NULL,
+        event_id int4 NOT NULL,
+        CONSTRAINT feedbacks_pkey PRIMARY KEY (id),
+        CONSTRAINT fk_feedback_event FOREIGN KEY (event_id) REFERENCES public.events(id) ON DELETE CASCADE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS public.participants (
+        id serial4 NOT NULL,
+        "name" varchar(255) NOT NULL,
+        event_id int4 NOT NULL,
+        CONSTRAINT participants_pkey PRIMARY KEY (id),
+        CONSTRAINT fk_participant_event FOREIGN KEY (event_id) REFERENCES public.events(id) ON DELETE CASCADE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS public.speakers (
+        id serial4 NOT NULL,
+        "name" varchar(255) NOT NULL,
+        description varchar(255) NULL,
+        event_id int4 NOT NULL,
+        CONSTRAINT speakers_pkey PRIMARY KEY (id),
+        CONSTRAINT fk_speaker_event FOREIGN KEY (event_id) REFERENCES public.events(id) ON DELETE CASCADE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS public.vendors (
+        id serial4 NOT NULL,
+        "name" varchar(255) NOT NULL,
+        services varchar(255) NULL,
+        event_id int4 NOT NULL,
+        CONSTRAINT vendors_pkey PRIMARY KEY (id),
+        CONSTRAINT fk_vendor_event FOREIGN KEY (event_id) REFERENCES public.events(id) ON DELETE CASCADE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS public.outbox (
+        id bigserial NOT NULL,
+        event_type varchar NOT NULL,
+        payload text NOT NULL,
+        created_at timestamptz NOT NULL DEFAULT now(),
+        available_at timestamptz NOT NULL DEFAULT now(),
+        attempts int4 NOT NULL DEFAULT 0,
+        last_error varchar NULL,
+        CONSTRAINT outbox_pkey PRIMARY KEY (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_outbox_available_at ON public.outbox USING btree (available_at)",
+    """
+    CREATE TABLE IF NOT EXISTS public.budget_entries (
+        id bigserial NOT NULL,
+        event_id int4 NOT NULL,
+        kind varchar NOT NULL,
+        amount float8 NOT NULL,
+        balance float8 NOT NULL,
+        created_at timestamptz NOT NULL DEFAULT now(),
+        CONSTRAINT budget_entries_pkey PRIMARY KEY (id),
+        CONSTRAINT fk_budget_entry_event FOREIGN KEY (event_id) REFERENCES public.events(id) ON DELETE CASCADE
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_budget_entries_event_id_id ON public.budget_entries USING btree (event_id, id)",
+]
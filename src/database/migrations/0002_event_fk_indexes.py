@@ -0,0 +1,12 @@
+# database/migrations/0002_event_fk_indexes.py
+# Índices em (event_id, id) nas tabelas filhas. Atendem às listagens por evento
+# (WHERE event_id = ? AND id > ? ORDER BY id), às contagens por evento (somente
+# o índice) e ao ON DELETE CASCADE, que sem eles varria a tabela inteira.
+# CONCURRENTLY não bloqueia escritas, mas não roda dentro de uma transação.
+DESCRIPTION = "Índices das chaves estrangeiras event_id"
+TRANSACTIONAL = False
+
+STATEMENTS = [
+    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_event_id_id ON public.{table} USING btree (event_id, id)"
+    for table in ("participants", "speakers", "vendors", "feedbacks")
+]
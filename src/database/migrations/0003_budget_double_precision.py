@@ -0,0 +1,11 @@
+# database/migrations/0003_budget_double_precision.py
+# O modelo Event declara budget como Float; o int4 original truncava centavos.
+DESCRIPTION = "events.budget como double precision"
+
+STATEMENTS = [
+    """
+    ALTER TABLE public.events
+        ALTER COLUMN budget TYPE double precision USING budget::double precision,
+        ALTER COLUMN budget SET DEFAULT 0
+    """,
+]
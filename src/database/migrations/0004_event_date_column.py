@@ -0,0 +1,19 @@
+# database/migrations/0004_event_date_column.py
+# events.date passa de texto livre para DATE, com índice para consultas por intervalo.
+# Converte os formatos aceitos pela aplicação (AAAA-MM-DD, DD-MM-AAAA, DD/MM/AAAA);
+# qualquer outro valor vira NULL e a migração falha no NOT NULL, sem alterar nada:
+# corrija essas linhas (SELECT id, date FROM events) e rode de novo.
+DESCRIPTION = "events.date como DATE, com índice"
+
+STATEMENTS = [
+    r"""
+    ALTER TABLE public.events
+        ALTER COLUMN "date" TYPE date USING (
+            CASE
+                WHEN "date" ~ '^\d{4}-\d{2}-\d{2}$' THEN to_date("date", 'YYYY-MM-DD')
+                WHEN "date" ~ '^\d{2}[-/]\d{2}[-/]\d{4}$' THEN to_date(replace("date", '/', '-'), 'DD-MM-YYYY')
+            END
+        )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_events_date_id ON public.events USING btree (\"date\", id)",
+]
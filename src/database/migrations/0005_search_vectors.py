@@ -0,0 +1,32 @@
+# database/migrations/0005_search_vectors.py
+# Colunas tsvector geradas (STORED) para a busca textual: o PostgreSQL as recalcula
+# a cada INSERT/UPDATE da linha, sem triggers nem código na aplicação.
+# A configuração de idioma precisa ser a mesma de SEARCH_CONFIG em
+# src/repositories/search_repository.py. Adicionar uma coluna STORED reescreve a
+# tabela: em bases grandes, aplique fora do horário de pico.
+DESCRIPTION = "Colunas tsvector para a busca textual"
+
+STATEMENTS = [
+    """
+    ALTER TABLE public.events ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('portuguese', coalesce("name", ''))) STORED
+    """,
+    """
+    ALTER TABLE public.speakers ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('portuguese', coalesce("name", '')), 'A') ||
+            setweight(to_tsvector('portuguese', coalesce(description, '')), 'B')
+        ) STORED
+    """,
+    """
+    ALTER TABLE public.vendors ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('portuguese', coalesce("name", '')), 'A') ||
+            setweight(to_tsvector('portuguese', coalesce(services, '')), 'B')
+        ) STORED
+    """,
+    """
+    ALTER TABLE public.feedbacks ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('portuguese', coalesce("content", ''))) STORED
+    """,
+]
@@ -0,0 +1,9 @@
+# database/migrations/0006_search_indexes.py
+# Índices GIN sobre as colunas de busca da migração 0005, criados sem bloquear escritas.
+DESCRIPTION = "Índices GIN da busca textual"
+TRANSACTIONAL = False
+
+STATEMENTS = [
+    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_search_vector ON public.{table} USING gin (search_vector)"
+    for table in ("events", "speakers", "vendors", "feedbacks")
+]
@@ -0,0 +1,124 @@
+# database/migrations/0007_event_summary.py
+# Tabela event_summary com as contagens de filhos de cada evento, mantida por
+# triggers por comando (FOR EACH STATEMENT) com tabelas de transição: um INSERT
+# ou COPY de N linhas faz uma única atualização por evento afetado, não N.
+# Eventos e tabelas filhas ficam bloqueados para escrita (SHARE) enquanto a migração
+# preenche os valores iniciais, para nenhuma alteração escapar da contagem.
+DESCRIPTION = "Contadores por evento mantidos por triggers"
+
+# coluna da event_summary -> tabela filha
+COUNTED_TABLES = {
+    "participants": "participants",
+    "speakers": "speakers",
+    "vendors": "vendors",
+    "feedbacks": "feedbacks",
+}
+
+STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS public.event_summary (
+        event_id int4 NOT NULL,
+        participants int4 NOT NULL DEFAULT 0,
+        speakers int4 NOT NULL DEFAULT 0,
+        vendors int4 NOT NULL DEFAULT 0,
+        feedbacks int4 NOT NULL DEFAULT 0,
+        last_activity_at timestamptz NULL,
+        CONSTRAINT event_summary_pkey PRIMARY KEY (event_id),
+        CONSTRAINT fk_event_summary_event FOREIGN KEY (event_id) REFERENCES public.events(id) ON DELETE CASCADE
+    )
+    """,
+    "LOCK TABLE public.events, public.participants, public.speakers, public.vendors, public.feedbacks IN SHARE MODE",
+    """
+    CREATE OR REPLACE FUNCTION public.event_summary_events_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO public.event_summary (event_id, last_activity_at)
+        SELECT id, now() FROM new_rows ORDER BY id
+        ON CONFLICT (event_id) DO NOTHING;
+        RETURN NULL;
+    END $$
+    """,
+    "DROP TRIGGER IF EXISTS trg_events_summary_insert ON public.events",
+    """
+    CREATE TRIGGER trg_events_summary_insert AFTER INSERT ON public.events
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION public.event_summary_events_insert()
+    """,
+]
+
+for column, table in COUNTED_TABLES.items():
+    STATEMENTS += [
+        f"""
+        CREATE OR REPLACE FUNCTION public.event_summary_{table}_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            -- ORDER BY: comandos concorrentes travam as linhas de event_summary na mesma ordem
+            INSERT INTO public.event_summary AS s (event_id, {column}, last_activity_at)
+            SELECT event_id, count(*), now() FROM new_rows GROUP BY event_id ORDER BY event_id
+            ON CONFLICT (event_id) DO UPDATE
+            SET {column} = s.{column} + EXCLUDED.{column}, last_activity_at = EXCLUDED.last_activity_at;
+            RETURN NULL;
+        END $$
+        """,
+        f"""
+        CREATE OR REPLACE FUNCTION public.event_summary_{table}_delete() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE public.event_summary AS s
+            SET {column} = s.{column} - d.total, last_activity_at = now()
+            FROM (SELECT event_id, count(*) AS total FROM old_rows GROUP BY event_id) AS d
+            WHERE s.event_id = d.event_id;
+            RETURN NULL;
+        END $$
+        """,
+        f"""
+        CREATE OR REPLACE FUNCTION public.event_summary_{table}_update() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            -- Só muda a contagem quando o event_id da linha muda
+            UPDATE public.event_summary AS s
+            SET {column} = s.{column} + d.delta, last_activity_at = now()
+            FROM (
+                SELECT event_id, sum(delta) AS delta FROM (
+                    SELECT event_id, -1 AS delta FROM old_rows
+                    UNION ALL
+                    SELECT event_id, 1 AS delta FROM new_rows
+                ) AS moved
+                GROUP BY event_id
+                HAVING sum(delta) <> 0
+            ) AS d
+            WHERE s.event_id = d.event_id;
+            RETURN NULL;
+        END $$
+        """,
+        f"DROP TRIGGER IF EXISTS trg_{table}_summary_insert ON public.{table}",
+        f"""
+        CREATE TRIGGER trg_{table}_summary_insert AFTER INSERT ON public.{table}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION public.event_summary_{table}_insert()
+        """,
+        f"DROP TRIGGER IF EXISTS trg_{table}_summary_delete ON public.{table}",
+        f"""
+        CREATE TRIGGER trg_{table}_summary_delete AFTER DELETE ON public.{table}
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION public.event_summary_{table}_delete()
+        """,
+        f"DROP TRIGGER IF EXISTS trg_{table}_summary_update ON public.{table}",
+        f"""
+        CREATE TRIGGER trg_{table}_summary_update AFTER UPDATE ON public.{table}
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION public.event_summary_{table}_update()
+        """,
+    ]
+
+# Valores iniciais a partir dos dados existentes
+STATEMENTS.append(
+    """
+    INSERT INTO public.event_summary (event_id, {columns})
+    SELECT e.id, {counts} FROM public.events AS e
+    ON CONFLICT (event_id) DO UPDATE SET {updates}
+    """.format(
+        columns=", ".join(COUNTED_TABLES),
+        counts=", ".join(
+            f"(SELECT count(*) FROM public.{table} AS c WHERE c.event_id = e.id)"
+            for table in COUNTED_TABLES.values()
+        ),
+        updates=", ".join(f"{column} = EXCLUDED.{column}" for column in COUNTED_TABLES),
+    )
+)
@@ -0,0 +1,182 @@
+# database/migrations/__init__.py
+"""Migrações versionadas do esquema (PostgreSQL).
+
+Cada arquivo ``NNNN_descricao.py`` desta pasta é uma migração, aplicada em ordem
+crescente de NNNN e registrada na tabela ``schema_migrations``. Um módulo de
+migração define ``DESCRIPTION``, ``STATEMENTS`` (lista de comandos SQL) e,
+opcionalmente, ``TRANSACTIONAL = False`` para comandos que não rodam dentro de
+uma transação (CREATE INDEX CONCURRENTLY). Migrações já aplicadas não devem ser
+editadas: crie uma nova.
+"""
+import hashlib
+import importlib
+import os
+import re
+
+from sqlalchemy import text
+
+_FILENAME = re.compile(r"^(\d{4})_(\w+)\.py$")
+# Nome do índice criado por um CREATE INDEX CONCURRENTLY (ver _drop_invalid_index)
+_CONCURRENT_INDEX = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+IF\s+NOT\s+EXISTS\s+(\w+)\s+ON\s+(?:(\w+)\.)?", re.IGNORECASE
+)
+# Chave do advisory lock: impede que dois processos apliquem migrações ao mesmo tempo
+_LOCK_KEY = 4823001
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS public.schema_migrations (
+    version int4 NOT NULL,
+    "name" varchar NOT NULL,
+    checksum varchar(40) NOT NULL,
+    applied_at timestamptz NOT NULL DEFAULT now(),
+    CONSTRAINT schema_migrations_pkey PRIMARY KEY (version)
+)
+"""
+
+
+class Migration:
+    def __init__(self, version, name, description, statements, transactional=True):
+        self.version = version
+        self.name = name
+        self.description = description
+        self.statements = statements
+        self.transactional = transactional
+
+    @property
+    def checksum(self):
+        return hashlib.sha1("\n;\n".join(self.statements).encode("utf-8")).hexdigest()
+
+    def __repr__(self):
+        return f"{self.version:04d}_{self.name}"
+
+
+def discover():
+    """Lista as migrações desta pasta em ordem de versão"""
+    migrations = []
+    for filename in sorted(os.listdir(os.path.dirname(__file__))):
+        match = _FILENAME.match(filename)
+        if not match:
+            continue
+        module = importlib.import_module(f"{__name__}.{filename[:-3]}")
+        migrations.append(Migration(
+            version=int(match.group(1)),
+            name=match.group(2),
+            description=module.DESCRIPTION,
+            statements=list(module.STATEMENTS),
+            transactional=getattr(module, "TRANSACTIONAL", True),
+        ))
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError(f"Versões de migração duplicadas: {versions}")
+    return migrations
+
+
+def _applied(conn):
+    """{versão: checksum} das migrações já registradas (vazio se a tabela ainda não existe)"""
+    exists = conn.execute(text("SELECT to_regclass('public.schema_migrations')")).scalar()
+    if exists is None:
+        return {}
+    return dict(conn.execute(text("SELECT version, checksum FROM public.schema_migrations")).all())
+
+
+def _check_dialect(engine):
+    if engine.dialect.name != "postgresql":
+        raise RuntimeError(
+            f"As migrações são escritas para PostgreSQL; em {engine.dialect.name} "
+            "o esquema é criado a partir dos modelos."
+        )
+
+
+def status(engine=None):
+    """Retorna [(migração, situação)] com situação 'aplicada', 'pendente' ou 'alterada'"""
+    engine = engine or _default_engine()
+    _check_dialect(engine)
+    with engine.connect() as conn:
+        applied = _applied(conn)
+    result = []
+    for migration in discover():
+        if migration.version not in applied:
+            result.append((migration, "pendente"))
+        elif applied[migration.version] != migration.checksum:
+            result.append((migration, "alterada"))
+        else:
+            result.append((migration, "aplicada"))
+    return result
+
+
+def migrate(engine=None, target=None, dry_run=False, log=print):
+    """Aplica as migrações pendentes até ``target`` (inclusive; padrão: todas).
+
+    Com ``dry_run=True`` apenas mostra os comandos que seriam executados.
+    Retorna a lista de migrações aplicadas (ou que seriam aplicadas).
+    """
+    engine = engine or _default_engine()
+    _check_dialect(engine)
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as lock_conn:
+        if not dry_run:
+            lock_conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": _LOCK_KEY})
+        try:
+            # Lido depois do lock: outro processo pode ter acabado de aplicar as mesmas migrações
+            applied = _applied(lock_conn)
+            pending = [
+                m for m in discover()
+                if m.version not in applied and (target is None or m.version <= target)
+            ]
+            for migration in pending:
+                log(f"{'[dry-run] ' if dry_run else ''}Aplicando {migration!r}: {migration.description}")
+                if dry_run:
+                    for statement in migration.statements:
+                        log(f"    {statement.strip()};")
+                    continue
+                _apply(engine, migration)
+            if not pending:
+                log("Nenhuma migração pendente.")
+            return pending
+        finally:
+            if not dry_run:
+                lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _LOCK_KEY})
+
+
+def _apply(engine, migration):
+    record = text(
+        "INSERT INTO public.schema_migrations (version, name, checksum) VALUES (:version, :name, :checksum)"
+    )
+    params = {"version": migration.version, "name": migration.name, "checksum": migration.checksum}
+    if migration.transactional:
+        # Comandos e registro na mesma transação: ou a migração inteira entra, ou nada
+        with engine.begin() as conn:
+            conn.execute(text(_CREATE_TABLE))
+            for statement in migration.statements:
+                conn.exec_driver_sql(statement)
+            conn.execute(record, params)
+        return
+    # Fora de transação cada comando é confirmado sozinho; por isso eles devem ser
+    # idempotentes (IF NOT EXISTS), para que uma nova tentativa após falha funcione
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(_CREATE_TABLE))
+        for statement in migration.statements:
+            _drop_invalid_index(conn, statement)
+            conn.exec_driver_sql(statement)
+        conn.execute(record, params)
+
+
+def _drop_invalid_index(conn, statement):
+    """Remove o índice INVALID deixado por um CREATE INDEX CONCURRENTLY que falhou.
+
+    O IF NOT EXISTS só olha o nome: sem isto, a nova tentativa pularia o índice
+    inutilizável e registraria a migração como aplicada.
+    """
+    match = _CONCURRENT_INDEX.search(statement)
+    if not match:
+        return
+    name = f"{match.group(2) or 'public'}.{match.group(1)}"
+    invalid = conn.execute(
+        text("SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"), {"name": name}
+    ).scalar()
+    if invalid:
+        conn.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def _default_engine():
+    from src.database.db import engine
+    return engine
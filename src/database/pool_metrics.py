@@ -0,0 +1,121 @@
+# database/pool_metrics.py
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    """Contadores do pool de conexões: checkouts, conexões abertas e tempo de espera.
+
+    waits conta só as retiradas que encontraram o pool esgotado e esperaram uma
+    devolução; o tempo para abrir conexões novas fica em connect_*_seconds.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.connects = 0
+            self.connect_total_seconds = 0.0
+            self.connect_max_seconds = 0.0
+            self.checkouts = 0
+            self.checkins = 0
+            self.invalidations = 0
+            self.checked_out = 0
+            self.peak_checked_out = 0
+            self.waits = 0
+            self.wait_total_seconds = 0.0
+            self.wait_max_seconds = 0.0
+            self.timeouts = 0
+
+    def record_wait(self, seconds, timed_out=False):
+        with self._lock:
+            self.waits += 1
+            self.wait_total_seconds += seconds
+            self.wait_max_seconds = max(self.wait_max_seconds, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def record_connect(self, seconds):
+        with self._lock:
+            self.connect_total_seconds += seconds
+            self.connect_max_seconds = max(self.connect_max_seconds, seconds)
+
+    def _on_connect(self, dbapi_conn, record):
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_conn, record, proxy):
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def _on_checkin(self, dbapi_conn, record):
+        with self._lock:
+            self.checkins += 1
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def _on_invalidate(self, dbapi_conn, record, exc):
+        with self._lock:
+            self.invalidations += 1
+
+    def attach(self, engine):
+        """Registra os ouvintes de eventos do pool do engine"""
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+        return engine
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "connects": self.connects,
+                "connect_total_seconds": self.connect_total_seconds,
+                "connect_max_seconds": self.connect_max_seconds,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "waits": self.waits,
+                "wait_total_seconds": self.wait_total_seconds,
+                "wait_avg_seconds": self.wait_total_seconds / self.waits if self.waits else 0.0,
+                "wait_max_seconds": self.wait_max_seconds,
+                "timeouts": self.timeouts,
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool que mede as esperas por uma conexão livre e o tempo de abrir conexões"""
+
+    def _do_get(self):
+        # Só espera quem encontra o pool esgotado (todas as conexões e o overflow em uso);
+        # os demais recebem uma conexão ociosa ou abrem uma nova na hora
+        if self._max_overflow < 0 or self.checkedout() < self.size() + self._max_overflow:
+            return super()._do_get()
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            pool_metrics.record_wait(time.perf_counter() - start, timed_out)
+
+    def _create_connection(self):
+        start = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            pool_metrics.record_connect(time.perf_counter() - start)
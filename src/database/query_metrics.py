@@ -0,0 +1,196 @@
+# database/query_metrics.py
+import heapq
+import html
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+
+from flask import g, has_app_context, request
+from sqlalchemy import event
+
+from src.metrics.registry import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# Parâmetros e literais viram "?" para que a mesma consulta com valores diferentes tenha o mesmo formato
+_PLACEHOLDER = r"(?:\?|%\(\w+\)s|%s|:\w+)"
+_IN_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})+\s*\)")
+_PARAMS = re.compile(rf"{_PLACEHOLDER}|'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_SPACES = re.compile(r"\s+")
+
+MAX_STATEMENT_LENGTH = 500
+
+statement_duration = metrics_registry.histogram(
+    "db_statement_duration_seconds", "Duração dos comandos SQL",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+
+def statement_shape(statement):
+    """Formato da consulta: espaços normalizados e parâmetros/literais trocados por ?"""
+    shape = _SPACES.sub(" ", statement).strip()
+    shape = _IN_LIST.sub("(?)", shape)
+    return _PARAMS.sub("?", shape)
+
+
+class RequestQueries:
+    """Consultas de uma requisição: quantidade, tempo total, as mais lentas e formatos repetidos"""
+
+    def __init__(self, slowest=5):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.shapes = Counter()
+        self._slowest_size = slowest
+        self._slowest = []  # heap de (segundos, ordem, comando)
+
+    def record(self, statement, seconds):
+        self.count += 1
+        self.total_seconds += seconds
+        self.shapes[statement_shape(statement)] += 1
+        if self._slowest_size:
+            item = (seconds, self.count, statement[:MAX_STATEMENT_LENGTH])
+            if len(self._slowest) < self._slowest_size:
+                heapq.heappush(self._slowest, item)
+            else:
+                heapq.heappushpop(self._slowest, item)
+
+    @property
+    def slowest(self):
+        return [(seconds, statement) for seconds, _, statement in sorted(self._slowest, reverse=True)]
+
+    def repeated(self, threshold):
+        """[(formato, vezes)] dos formatos executados mais de threshold vezes"""
+        return [(shape, times) for shape, times in self.shapes.most_common() if times > threshold]
+
+
+class QueryMetrics:
+    """Instrumentação das consultas SQL por ouvintes de eventos do engine.
+
+    Mantém contadores do processo inteiro e, dentro de uma requisição Flask,
+    um RequestQueries em ``g`` com os dados só daquela requisição.
+    """
+
+    def __init__(self, slow_statements=5, repeat_threshold=10):
+        self.slow_statements = slow_statements
+        self.repeat_threshold = repeat_threshold
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.statements = 0
+            self.total_seconds = 0.0
+            self.errors = 0
+            self.repeated_warnings = 0
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._query_started = time.perf_counter()
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_query_started", None)
+        seconds = time.perf_counter() - started if started is not None else 0.0
+        with self._lock:
+            self.statements += 1
+            self.total_seconds += seconds
+        statement_duration.observe(seconds)
+        queries = current_queries()
+        if queries is not None:
+            queries.record(statement, seconds)
+
+    def _on_error(self, exception_context):
+        with self._lock:
+            self.errors += 1
+
+    def attach(self, engine):
+        """Registra os ouvintes de execução do engine"""
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+        event.listen(engine, "handle_error", self._on_error)
+        return engine
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "statements": self.statements,
+                "total_seconds": self.total_seconds,
+                "errors": self.errors,
+                "repeated_warnings": self.repeated_warnings,
+            }
+
+    def init_app(self, app, toolbar=None):
+        """Mede as consultas de cada requisição e as expõe em cabeçalhos de resposta.
+
+        Registre antes da unidade de trabalho: os after_request rodam na ordem
+        inversa, e assim o que o commit do fim da requisição grava também é contado.
+        Com toolbar=True (ou SQL_DEBUG_TOOLBAR=1) as páginas HTML ganham um
+        painel com as consultas mais lentas e os formatos repetidos.
+        """
+        if toolbar is None:
+            toolbar = os.environ.get("SQL_DEBUG_TOOLBAR", "0").lower() in ("1", "true", "yes", "on", "sim")
+
+        @app.before_request
+        def _start_query_metrics():
+            g.request_queries = RequestQueries(self.slow_statements)
+
+        @app.after_request
+        def _report_query_metrics(response):
+            queries = g.get("request_queries")
+            if queries is None:
+                return response
+            milliseconds = queries.total_seconds * 1000
+            response.headers["X-DB-Query-Count"] = str(queries.count)
+            response.headers["X-DB-Time-Ms"] = f"{milliseconds:.2f}"
+            response.headers.add("Server-Timing", f'db;dur={milliseconds:.2f};desc="{queries.count} queries"')
+            repeated = queries.repeated(self.repeat_threshold)
+            if repeated:
+                with self._lock:
+                    self.repeated_warnings += 1
+                response.headers["X-DB-Repeated-Statements"] = str(repeated[0][1])
+                for shape, times in repeated:
+                    logger.warning("Possível N+1 em %s %s: %d execuções de %s",
+                                   request.method, request.path, times, shape[:MAX_STATEMENT_LENGTH])
+            if toolbar and response.mimetype == "text/html" and not response.is_streamed:
+                _inject_toolbar(response, queries, repeated)
+            return response
+
+        @app.teardown_request
+        def _end_query_metrics(exc):
+            g.pop("request_queries", None)
+
+
+def current_queries():
+    """RequestQueries da requisição atual (None fora de uma requisição Flask)"""
+    if has_app_context():
+        return g.get("request_queries")
+    return None
+
+
+def _inject_toolbar(response, queries, repeated):
+    body = response.get_data(as_text=True)
+    position = body.lower().rfind("</body>")
+    if position < 0:
+        return
+    rows = "".join(
+        f"<li>{seconds * 1000:.2f} ms: <code>{html.escape(statement)}</code></li>"
+        for seconds, statement in queries.slowest
+    )
+    rows += "".join(
+        f"<li><strong>{times}×</strong> <code>{html.escape(shape[:MAX_STATEMENT_LENGTH])}</code></li>"
+        for shape, times in repeated
+    )
+    panel = (
+        '<div id="sql-debug" style="position:fixed;bottom:0;left:0;right:0;max-height:40%;overflow:auto;'
+        'background:#222;color:#eee;font:12px monospace;padding:6px;z-index:9999">'
+        f"SQL: {queries.count} consultas, {queries.total_seconds * 1000:.2f} ms<ul>{rows}</ul></div>"
+    )
+    response.set_data(body[:position] + panel + body[position:])
+
+
+query_metrics = QueryMetrics(
+    slow_statements=int(os.environ.get("SQL_SLOW_STATEMENTS", 5)),
+    repeat_threshold=int(os.environ.get("SQL_REPEAT_THRESHOLD", 10)),
+)
@@ -0,0 +1,20 @@
+# database/schema.py
+"""Criação do esquema em qualquer banco suportado.
+
+No PostgreSQL o esquema vem das migrações versionadas (src/database/migrations),
+que incluem o que os modelos não descrevem (colunas tsvector geradas, triggers
+em PL/pgSQL). Nos demais bancos (SQLite) ele é criado a partir dos modelos, com
+os triggers de event_summary registrados em src/models/event_summary.py.
+"""
+from src.database.db import Base, engine as default_engine
+from src.database.migrations import migrate
+import src.models  # noqa: F401 - registra todas as tabelas em Base.metadata
+
+
+def create_schema(engine=None, log=print):
+    """Cria ou atualiza o esquema; repetir a chamada não altera um esquema em dia"""
+    engine = engine or default_engine
+    if engine.dialect.name == "postgresql":
+        return migrate(engine, log=log)
+    Base.metadata.create_all(engine)
+    return []
@@ -0,0 +1,165 @@
+# database/unit_of_work.py
+from contextvars import ContextVar
+from functools import wraps
+
+from flask import g, has_app_context
+from sqlalchemy import event
+
+from src.database.db import SessionLocal
+
+# Unidade de trabalho ativa fora do Flask (scripts, utilitários, serviços usados diretamente)
+_current_uow = ContextVar("current_unit_of_work", default=None)
+
+
+class UnitOfWork:
+    """Agrupa todas as operações de repositório em uma única sessão e transação.
+
+    Dentro de uma requisição Flask existe exatamente uma unidade de trabalho
+    (ver ``init_app``): todos os repositórios compartilham a mesma sessão, o
+    mapa de identidade é reaproveitado entre chamadas e há um único commit no
+    fim da requisição. Fora do Flask pode ser usada como gerenciador de contexto.
+    """
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory or SessionLocal
+        self._session = None
+        self._token = None
+        self._after_commit = []
+        # A transação atual já gravou algo (flush do ORM ou INSERT/UPDATE/DELETE direto)
+        self.has_writes = False
+
+    @property
+    def session(self):
+        # A sessão só é aberta na primeira consulta: páginas estáticas não fazem checkout de conexão
+        if self._session is None:
+            self._session = self._session_factory()
+            event.listen(self._session, "after_flush", self._mark_written)
+            event.listen(self._session, "do_orm_execute", self._on_execute)
+        return self._session
+
+    def _mark_written(self, *args):
+        self.has_writes = True
+
+    def _on_execute(self, state):
+        if state.is_insert or state.is_update or state.is_delete:
+            self.has_writes = True
+
+    def after_commit(self, callback):
+        """Agenda callback() para logo depois do próximo commit bem-sucedido"""
+        self._after_commit.append(callback)
+
+    def commit(self):
+        if self._session is not None:
+            self._session.commit()
+        self.has_writes = False
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            callback()
+
+    def rollback(self):
+        self._after_commit = []
+        self.has_writes = False
+        if self._session is not None:
+            self._session.rollback()
+
+    def close(self):
+        self._after_commit = []
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self):
+        self._token = _current_uow.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            self.close()
+            _current_uow.reset(self._token)
+            self._token = None
+
+
+def current_unit_of_work():
+    """Retorna a unidade de trabalho ativa (da requisição ou do contexto) ou None"""
+    if has_app_context():
+        uow = g.get("unit_of_work")
+        if uow is not None:
+            return uow
+    return _current_uow.get()
+
+
+def get_session():
+    """Retorna a sessão compartilhada da unidade de trabalho ativa"""
+    uow = current_unit_of_work()
+    if uow is None:
+        raise RuntimeError(
+            "Nenhuma unidade de trabalho ativa. Use 'with UnitOfWork():' "
+            "ou chame o repositório a partir de um serviço."
+        )
+    return uow.session
+
+
+def has_uncommitted_writes():
+    """True se a unidade de trabalho ativa já gravou algo ainda não confirmado"""
+    uow = current_unit_of_work()
+    return uow is not None and uow.has_writes
+
+
+def on_commit(callback):
+    """Executa callback() após o commit da unidade de trabalho ativa (ou já, se não houver uma)"""
+    uow = current_unit_of_work()
+    if uow is None:
+        callback()
+    else:
+        uow.after_commit(callback)
+
+
+def transactional(func):
+    """Executa um método de serviço dentro da unidade de trabalho ativa.
+
+    Se já existe uma unidade de trabalho (requisição Flask), a chamada participa
+    dela e qualquer exceção desfaz a transação, para que uma falha de validação
+    no meio do método não seja gravada no commit do fim da requisição. Sem
+    unidade de trabalho ativa, abre uma só para esta chamada e faz commit ao final.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        uow = current_unit_of_work()
+        if uow is None:
+            with UnitOfWork():
+                return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            uow.rollback()
+            raise
+    return wrapper
+
+
+def init_app(app):
+    """Liga uma unidade de trabalho ao contexto de cada requisição da aplicação"""
+
+    @app.before_request
+    def _begin_unit_of_work():
+        g.unit_of_work = UnitOfWork()
+
+    @app.after_request
+    def _commit_unit_of_work(response):
+        # O commit acontece antes do envio da resposta: se falhar, o cliente recebe erro
+        uow = g.get("unit_of_work")
+        if uow is not None and response.status_code < 400:
+            uow.commit()
+        return response
+
+    @app.teardown_appcontext
+    def _end_unit_of_work(exc):
+        uow = g.pop("unit_of_work", None)
+        if uow is not None:
+            # Descarta qualquer trabalho não confirmado (exceções ou respostas de erro)
+            uow.rollback()
+            uow.close()
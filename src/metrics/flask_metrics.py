@@ -0,0 +1,108 @@
+# metrics/flask_metrics.py
+import atexit
+import time
+
+from flask import Response, g, request
+
+from src.cache.cache_manager import cache_manager
+from src.database.pool_metrics import pool_metrics
+from src.database.query_metrics import query_metrics
+from src.metrics.registry import CONTENT_TYPE, metrics_registry
+from src.notifications.notification_manager import notification_manager
+from src.notifications.outbox import outbox_relay
+
+request_duration = metrics_registry.histogram(
+    "http_request_duration_seconds", "Duração das requisições HTTP por rota",
+    labels=("method", "route", "status"),
+)
+
+
+def _pool_metrics():
+    stats = pool_metrics.snapshot()
+    return [
+        ("db_pool_checked_out_connections", "gauge", "Conexões do pool em uso", [({}, stats["checked_out"])]),
+        ("db_pool_connects_total", "counter", "Conexões abertas com o banco", [({}, stats["connects"])]),
+        ("db_pool_connect_seconds_total", "counter", "Tempo total gasto abrindo conexões",
+         [({}, stats["connect_total_seconds"])]),
+        ("db_pool_checkouts_total", "counter", "Retiradas de conexões do pool", [({}, stats["checkouts"])]),
+        ("db_pool_invalidations_total", "counter", "Conexões invalidadas", [({}, stats["invalidations"])]),
+        ("db_pool_waits_total", "counter", "Retiradas que esperaram com o pool esgotado", [({}, stats["waits"])]),
+        ("db_pool_wait_seconds_total", "counter", "Tempo total de espera por uma conexão livre",
+         [({}, stats["wait_total_seconds"])]),
+        ("db_pool_timeouts_total", "counter", "Esperas por conexão que estouraram o pool_timeout",
+         [({}, stats["timeouts"])]),
+    ]
+
+
+def _query_metrics():
+    stats = query_metrics.snapshot()
+    return [
+        ("db_statements_total", "counter", "Comandos SQL executados", [({}, stats["statements"])]),
+        ("db_statement_seconds_total", "counter", "Tempo total dos comandos SQL", [({}, stats["total_seconds"])]),
+        ("db_statement_errors_total", "counter", "Comandos SQL que falharam", [({}, stats["errors"])]),
+        ("db_repeated_statement_warnings_total", "counter", "Requisições com possível N+1",
+         [({}, stats["repeated_warnings"])]),
+    ]
+
+
+def _notification_metrics():
+    stats = notification_manager.stats()
+    return [
+        ("notifications_queue_depth", "gauge", "Notificações aguardando na fila do modo assíncrono",
+         [({}, stats["queue_depth"])]),
+        ("notifications_total", "counter", "Notificações enfileiradas, descartadas ou entregues pelo chamador",
+         [({"outcome": outcome}, stats[outcome]) for outcome in ("queued", "dropped", "caller_runs")]),
+    ]
+
+
+def _outbox_metrics():
+    stats = outbox_relay.stats()
+    return [
+        ("outbox_messages_total", "counter", "Mensagens do outbox entregues ou com falha pelo relay",
+         [({"outcome": outcome}, stats[outcome]) for outcome in ("delivered", "failed")]),
+        ("outbox_relay_busy_seconds_total", "counter", "Tempo gasto pelo relay entregando lotes",
+         [({}, stats["busy_seconds"])]),
+    ]
+
+
+def _cache_metrics():
+    stats = cache_manager.stats()
+    return [
+        ("cache_requests_total", "counter", "Consultas ao cache por namespace e resultado",
+         [({"namespace": namespace, "result": result}, counters[result])
+          for namespace, counters in stats.items() for result in ("hits", "misses")]),
+        ("cache_invalidations_total", "counter", "Invalidações de namespace do cache",
+         [({"namespace": namespace}, counters["invalidations"]) for namespace, counters in stats.items()]),
+    ]
+
+
+for _collector in (_pool_metrics, _query_metrics, _notification_metrics, _outbox_metrics, _cache_metrics):
+    metrics_registry.register_collector(_collector)
+
+
+def init_app(app):
+    """Mede a duração de cada requisição por rota e expõe /metrics no formato do Prometheus"""
+
+    @app.before_request
+    def _start_request_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def _observe_request(response):
+        started = g.pop("request_started", None)
+        if started is not None:
+            # A regra da rota (/events/<int:event_id>), não o caminho, para não criar uma série por id
+            route = request.url_rule.rule if request.url_rule is not None else "<sem rota>"
+            request_duration.observe(
+                time.perf_counter() - started,
+                method=request.method, route=route, status=response.status_code,
+            )
+        metrics_registry.maybe_flush()
+        return response
+
+    @app.route("/metrics")
+    def metrics():
+        return Response(metrics_registry.render(), content_type=CONTENT_TYPE)
+
+    if metrics_registry.directory:
+        atexit.register(metrics_registry.flush)
@@ -0,0 +1,256 @@
+# metrics/registry.py
+import bisect
+import glob
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+
+# Limites dos buckets em segundos (os mesmos padrões do cliente oficial do Prometheus)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Instantâneo com os contadores somados dos processos que já terminaram
+ARCHIVE_FILE = "metrics-archive.json"
+
+
+class Histogram:
+    """Histograma com rótulos; os valores ficam na memória do processo"""
+
+    def __init__(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._values = {}  # valores dos rótulos -> [contagem por bucket..., soma, total]
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels.get(label, "")) for label in self.labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            values = self._values.get(key)
+            if values is None:
+                values = self._values[key] = [0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                values[index] += 1
+            values[-2] += value
+            values[-1] += 1
+
+    def samples(self):
+        """[(nome, rótulos, valor)] no formato do Prometheus (buckets cumulativos)"""
+        with self._lock:
+            items = [(key, list(values)) for key, values in self._values.items()]
+        samples = []
+        for key, values in items:
+            labels = dict(zip(self.labels, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets, values):
+                cumulative += count
+                samples.append((f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative))
+            samples.append((f"{self.name}_bucket", {**labels, "le": "+Inf"}, values[-1]))
+            samples.append((f"{self.name}_sum", labels, values[-2]))
+            samples.append((f"{self.name}_count", labels, values[-1]))
+        return samples
+
+
+class MetricsRegistry:
+    """Métricas no formato texto do Prometheus, agregadas entre processos.
+
+    Histogramas são observados diretamente; os demais valores vêm de coletores,
+    funções chamadas na hora da coleta que devolvem
+    ``[(nome, tipo, ajuda, [(rótulos, valor), ...]), ...]`` a partir das
+    estatísticas que cada componente já mantém (pool, cache, notificações).
+
+    Com ``directory`` (METRICS_DIR), cada processo grava periodicamente um
+    instantâneo em ``<directory>/metrics-<pid>.json`` e a coleta soma os
+    arquivos de todos os processos: assim qualquer worker do gunicorn responde
+    com os números do servidor inteiro. Contadores e histogramas de processos
+    que já terminaram continuam somados; gauges só dos processos vivos. Quando
+    um worker termina, mark_process_dead junta os contadores dele em
+    ``metrics-archive.json`` e apaga o seu arquivo, para os instantâneos não se
+    acumularem com a reciclagem de workers (max_requests).
+    """
+
+    def __init__(self, directory=None, flush_interval=1.0):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._collectors = []
+        self._last_flush = 0.0
+
+    def histogram(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        """Cria (ou devolve o já registrado) histograma com esse nome"""
+        with self._lock:
+            if name not in self._histograms:
+                self._histograms[name] = Histogram(name, help, labels, buckets)
+            return self._histograms[name]
+
+    def register_collector(self, collector):
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+        return collector
+
+    def collect(self):
+        """Famílias deste processo: [{"name", "type", "help", "samples": [[nome, rótulos, valor]]}]"""
+        with self._lock:
+            histograms = list(self._histograms.values())
+            collectors = list(self._collectors)
+        families = [
+            {"name": h.name, "type": "histogram", "help": h.help, "samples": [list(s) for s in h.samples()]}
+            for h in histograms
+        ]
+        for collector in collectors:
+            for name, kind, help, values in collector():
+                families.append({
+                    "name": name, "type": kind, "help": help,
+                    "samples": [[name, labels, value] for labels, value in values],
+                })
+        return families
+
+    # Agregação entre processos
+
+    def _path(self, pid):
+        return os.path.join(self.directory, f"metrics-{pid}.json")
+
+    def flush(self):
+        """Grava o instantâneo deste processo (troca atômica do arquivo)"""
+        if not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        self._write(self._path(os.getpid()), {"pid": os.getpid(), "families": self.collect()})
+        self._last_flush = time.monotonic()
+
+    def maybe_flush(self):
+        """Grava o instantâneo se o último tiver mais de flush_interval segundos"""
+        if self.directory and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def _write(self, path, data):
+        # Troca atômica: a coleta nunca lê um arquivo pela metade
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=".metrics-", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(json.dumps(data))
+        os.replace(temp_path, path)
+
+    def mark_process_dead(self, pid):
+        """Soma os contadores e histogramas de um processo encerrado ao arquivo de
+        arquivo morto e apaga o instantâneo dele (gunicorn: hook child_exit)"""
+        if not self.directory:
+            return
+        path = self._path(pid)
+        try:
+            with open(path, encoding="utf-8") as fh:
+                dead = json.load(fh)["families"]
+        except (OSError, ValueError):
+            return
+        archive_path = os.path.join(self.directory, ARCHIVE_FILE)
+        try:
+            with open(archive_path, encoding="utf-8") as fh:
+                archived = json.load(fh)["families"]
+        except (OSError, ValueError):
+            archived = []
+        families = _merge_families(archived + [family for family in dead if family["type"] != "gauge"])
+        self._write(archive_path, {"pid": None, "families": families})
+        os.remove(path)
+
+    def _snapshots(self):
+        """[(pid, famílias)]: este processo coletado agora, os demais lidos dos arquivos"""
+        pid = os.getpid()
+        snapshots = [(pid, self.collect())]
+        if not self.directory:
+            return snapshots
+        for path in glob.glob(os.path.join(self.directory, "metrics-*.json")):
+            try:
+                with open(path, encoding="utf-8") as fh:
+                    data = json.load(fh)
+            except (OSError, ValueError):
+                continue  # arquivo removido ou sendo substituído
+            if data["pid"] != pid:
+                snapshots.append((data["pid"], data["families"]))
+        return snapshots
+
+    def aggregate(self):
+        families = {}
+        for pid, snapshot in self._snapshots():
+            alive = pid == os.getpid() or (pid is not None and _process_alive(pid))
+            for family in snapshot:
+                if family["type"] == "gauge" and not alive:
+                    continue
+                merged = families.setdefault(family["name"], {
+                    "type": family["type"], "help": family["help"], "samples": {},
+                })
+                for name, labels, value in family["samples"]:
+                    key = (name, tuple(sorted(labels.items())))
+                    merged["samples"][key] = merged["samples"].get(key, 0) + value
+        return families
+
+    def render(self):
+        """Texto de exposição do Prometheus com os valores somados de todos os processos"""
+        lines = []
+        for family_name, family in sorted(self.aggregate().items()):
+            lines.append(f"# HELP {family_name} {_escape_help(family['help'])}")
+            lines.append(f"# TYPE {family_name} {family['type']}")
+            for (name, labels), value in family["samples"].items():
+                label_text = ",".join(f'{key}="{_escape_label(value_)}"' for key, value_ in labels)
+                lines.append(f"{name}{{{label_text}}} {_format_value(value)}" if labels
+                             else f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _merge_families(families):
+    """Soma amostra a amostra as famílias com o mesmo nome (formato de collect())"""
+    merged = {}
+    for family in families:
+        target = merged.setdefault(family["name"], {
+            "name": family["name"], "type": family["type"], "help": family["help"], "samples": {},
+        })
+        for name, labels, value in family["samples"]:
+            key = (name, tuple(sorted(labels.items())))
+            target["samples"][key] = target["samples"].get(key, 0) + value
+    return [
+        dict(family, samples=[[name, dict(labels), value] for (name, labels), value in family["samples"].items()])
+        for family in merged.values()
+    ]
+
+
+def _process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(value)
+    return str(value)
+
+
+def _escape_help(text):
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(text):
+    return str(text).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def build_metrics_registry(environ=None):
+    """Cria o registro conforme METRICS_DIR (agregação entre processos) e METRICS_FLUSH_INTERVAL"""
+    environ = os.environ if environ is None else environ
+    return MetricsRegistry(
+        directory=environ.get("METRICS_DIR") or None,
+        flush_interval=float(environ.get("METRICS_FLUSH_INTERVAL", 1.0)),
+    )
+
+
+# Instância única do processo
+metrics_registry = build_metrics_registry()
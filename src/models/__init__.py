@@ -0,0 +1,11 @@
+# models/__init__.py
+# Importa todos os modelos para que os relacionamentos por nome ("Speaker", "Vendor"...)
+# sejam resolvidos mesmo quando só um deles é usado (scripts em utils/, por exemplo).
+from src.models.event import Event
+from src.models.participant import Participant
+from src.models.speaker import Speaker
+from src.models.vendor import Vendor
+from src.models.feedback import Feedback
+from src.models.budget_entry import BudgetEntry
+from src.models.event_summary import EventSummary
+from src.models.outbox_message import OutboxMessage
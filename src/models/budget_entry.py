@@ -0,0 +1,37 @@
+# models/budget_entry.py
+from datetime import datetime, timezone
+from sqlalchemy import BigInteger, Column, DateTime, Float, ForeignKey, Index, Integer, String
+from src.database.db import Base
+
+# Tipos de lançamento: ajuste relativo (+/- valor) ou definição de um novo valor
+KINDS = ("adjust", "set")
+
+def _utcnow():
+    return datetime.now(timezone.utc)
+
+class BudgetEntry(Base):
+    """Lançamento do livro-razão do orçamento (somente inserção).
+
+    amount é a variação aplicada ao orçamento e balance o valor resultante,
+    então a soma de amount de um evento reconstitui o orçamento a partir do primeiro lançamento.
+    """
+    __tablename__ = "budget_entries"
+    # Atende ao histórico paginado (event_id, id) e aos totais por evento
+    __table_args__ = (Index("ix_budget_entries_event_id_id", "event_id", "id"),)
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
+    kind = Column(String, nullable=False)
+    amount = Column(Float, nullable=False)
+    balance = Column(Float, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "event_id": self.event_id,
+            "kind": self.kind,
+            "amount": self.amount,
+            "balance": self.balance,
+            "created_at": self.created_at.isoformat() if self.created_at else None
+        }
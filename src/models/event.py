@@ -1,20 +1,32 @@
 # models/event.py
-from sqlalchemy import Column, Integer, String, Float
+from datetime import date, datetime
+from sqlalchemy import Column, Date, Float, Index, Integer, String
 from sqlalchemy.orm import relationship
 from src.database.db import Base
 
 class Event(Base):
     __tablename__ = "events"
+    # Consultas por intervalo de datas, em ordem de data (migração 0004)
+    __table_args__ = (Index("ix_events_date_id", "date", "id"),)
+
+    # Formatos aceitos para a data, além de objetos date/datetime
+    DATE_FORMATS = ("%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y")
+
     id = Column(Integer, primary_key=True, index=True)
     _name = Column("name", String, nullable=False)
-    _date = Column("date", String, nullable=False)
+    _date = Column("date", Date, nullable=False)
     _budget = Column("budget", Float, default=0.0)
 
-    # Relacionamentos com tabelas filhas
-    participants = relationship("Participant", back_populates="event", cascade="all, delete-orphan")
-    speakers = relationship("Speaker", back_populates="event", cascade="all, delete-orphan")
-    vendors = relationship("Vendor", back_populates="event", cascade="all, delete-orphan")
-    feedbacks = relationship("Feedback", back_populates="event", cascade="all, delete-orphan")
+    # Relacionamentos com tabelas filhas. passive_deletes: ao excluir o evento, o ON DELETE
+    # CASCADE do banco remove os filhos; o ORM não os carrega nem emite um DELETE por linha
+    participants = relationship("Participant", back_populates="event", cascade="all, delete-orphan",
+                                passive_deletes=True)
+    speakers = relationship("Speaker", back_populates="event", cascade="all, delete-orphan",
+                         passive_deletes=True)
+    vendors = relationship("Vendor", back_populates="event", cascade="all, delete-orphan",
+                        passive_deletes=True)
+    feedbacks = relationship("Feedback", back_populates="event", cascade="all, delete-orphan",
+                          passive_deletes=True)
 
     def __init__(self, name, date, budget=0.0):
         self.name = name
@@ -28,9 +40,13 @@ class Event(Base):
 
     @name.setter
     def name(self, value):
+        self._name = self.validate_name(value)
+
+    @staticmethod
+    def validate_name(value):
         if not value:
             raise ValueError("O nome do evento não pode ser vazio.")
-        self._name = value
+        return value
 
     # Propriedade para date
     @property
@@ -39,9 +55,22 @@ class Event(Base):
 
     @date.setter
     def date(self, value):
+        self._date = self.validate_date(value)
+
+    @classmethod
+    def validate_date(cls, value):
         if not value:
             raise ValueError("A data do evento não pode ser vazia.")
-        self._date = value
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        for fmt in cls.DATE_FORMATS:
+            try:
+                return datetime.strptime(str(value).strip(), fmt).date()
+            except ValueError:
+                continue
+        raise ValueError(f"Data inválida: {value!r}. Use AAAA-MM-DD ou DD-MM-AAAA.")
 
     # Propriedade para budget
     @property
@@ -50,30 +79,28 @@ class Event(Base):
 
     @budget.setter
     def budget(self, value):
+        self._budget = self.validate_budget(value)
+
+    @staticmethod
+    def validate_budget(value):
         if value < 0:
             raise ValueError("O orçamento não pode ser negativo!")
-        self._budget = value
+        return value
 
     def to_dict(self, include_relations=True):
         result = {
             "id": self.id,
             "name": self.name,
-            "date": self.date,
+            "date": self.date.isoformat() if self.date else None,
             "budget": self.budget
         }
         
-        # Acessa as relações quando explicitamente solicitado
+        # Acessa as relações quando explicitamente solicitado: o objeto precisa estar numa
+        # sessão (ou ter as relações carregadas); listagens usam EventRepository.children
         if include_relations:
-            try:
-                result["participants"] = [p.to_dict() for p in self.participants]
-                result["speakers"] = [s.to_dict() for s in self.speakers]
-                result["vendors"] = [v.to_dict() for v in self.vendors]
-                result["feedbacks"] = [f.to_dict() for f in self.feedbacks]
-            except:
-                # Se houver erro de sessão, retorna apenas as listas vazias
-                result["participants"] = []
-                result["speakers"] = []
-                result["vendors"] = []
-                result["feedbacks"] = []
+            result["participants"] = [p.to_dict() for p in self.participants]
+            result["speakers"] = [s.to_dict() for s in self.speakers]
+            result["vendors"] = [v.to_dict() for v in self.vendors]
+            result["feedbacks"] = [f.to_dict() for f in self.feedbacks]
         
         return result
\ No newline at end of file
@@ -0,0 +1,83 @@
+# models/event_summary.py
+from sqlalchemy import DDL, Column, DateTime, ForeignKey, Integer, event
+from src.database.db import Base
+
+# Colunas de contagem -> tabela filha correspondente
+COUNTED_TABLES = {
+    "participants": "participants",
+    "speakers": "speakers",
+    "vendors": "vendors",
+    "feedbacks": "feedbacks",
+}
+
+class EventSummary(Base):
+    """Contadores por evento mantidos por triggers do banco (somente leitura para a aplicação).
+
+    No PostgreSQL os triggers são por comando, com tabelas de transição (migração
+    0007): um INSERT/COPY de milhares de linhas faz uma única atualização por evento.
+    Nos bancos criados por create_all (SQLite) são triggers por linha, definidos abaixo.
+    Para conferir ou reconstruir os valores: python utils/event_summary.py.
+    """
+    __tablename__ = "event_summary"
+
+    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), primary_key=True)
+    participants = Column(Integer, nullable=False, default=0)
+    speakers = Column(Integer, nullable=False, default=0)
+    vendors = Column(Integer, nullable=False, default=0)
+    feedbacks = Column(Integer, nullable=False, default=0)
+    last_activity_at = Column(DateTime(timezone=True), nullable=True)
+
+    COUNTERS = tuple(COUNTED_TABLES)
+
+    def to_dict(self):
+        return {
+            "event_id": self.event_id,
+            **{name: getattr(self, name) for name in self.COUNTERS},
+            "last_activity_at": self.last_activity_at.isoformat() if self.last_activity_at else None
+        }
+
+
+def _sqlite_triggers():
+    columns = ", ".join(COUNTED_TABLES)
+    statements = [
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_events_summary_insert AFTER INSERT ON events
+        BEGIN
+            INSERT OR IGNORE INTO event_summary (event_id, {columns}, last_activity_at)
+            VALUES (NEW.id, 0, 0, 0, 0, CURRENT_TIMESTAMP);
+        END
+        """
+    ]
+    for column, table in COUNTED_TABLES.items():
+        initial = ", ".join("1" if name == column else "0" for name in COUNTED_TABLES)
+        statements += [
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_summary_insert AFTER INSERT ON {table}
+            BEGIN
+                INSERT INTO event_summary (event_id, {columns}, last_activity_at)
+                VALUES (NEW.event_id, {initial}, CURRENT_TIMESTAMP)
+                ON CONFLICT (event_id) DO UPDATE
+                SET {column} = {column} + 1, last_activity_at = CURRENT_TIMESTAMP;
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_summary_delete AFTER DELETE ON {table}
+            BEGIN
+                UPDATE event_summary SET {column} = {column} - 1, last_activity_at = CURRENT_TIMESTAMP
+                WHERE event_id = OLD.event_id;
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_summary_update AFTER UPDATE OF event_id ON {table}
+            BEGIN
+                UPDATE event_summary SET {column} = {column} - 1 WHERE event_id = OLD.event_id;
+                UPDATE event_summary SET {column} = {column} + 1, last_activity_at = CURRENT_TIMESTAMP
+                WHERE event_id = NEW.event_id;
+            END
+            """,
+        ]
+    return statements
+
+# Os triggers dependem de todas as tabelas, por isso são criados depois do create_all inteiro
+for _statement in _sqlite_triggers():
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
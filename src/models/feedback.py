@@ -1,14 +1,16 @@
 # models/feedback.py
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from src.database.db import Base
 
 class Feedback(Base):
     __tablename__ = "feedbacks"
+    # Listagens por evento e ON DELETE CASCADE (migração 0002)
+    __table_args__ = (Index("ix_feedbacks_event_id_id", "event_id", "id"),)
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     _content = Column("content", String, nullable=False)
-    event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
+    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
 
     event = relationship("Event", back_populates="feedbacks")
 
@@ -22,9 +24,13 @@ class Feedback(Base):
 
     @content.setter
     def content(self, value):
+        self._content = self.validate_content(value)
+
+    @staticmethod
+    def validate_content(value):
         if not value:
             raise ValueError("O conteúdo do feedback não pode ser vazio.")
-        self._content = value
+        return value
 
     def to_dict(self):
         return {
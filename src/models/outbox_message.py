@@ -0,0 +1,23 @@
+# models/outbox_message.py
+from datetime import datetime, timezone
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String, Text
+from src.database.db import Base
+
+def _utcnow():
+    return datetime.now(timezone.utc)
+
+class OutboxMessage(Base):
+    """Notificação pendente, gravada na mesma transação da alteração que a originou.
+
+    O OutboxRelay entrega as mensagens aos ouvintes e as apaga; falhas são
+    reagendadas (available_at) até max_attempts, e depois ficam na tabela para análise.
+    """
+    __tablename__ = "outbox"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    event_type = Column(String, nullable=False)
+    payload = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
+    available_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow, index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(String, nullable=True)
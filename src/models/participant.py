@@ -1,14 +1,16 @@
 # models/participant.py
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from src.database.db import Base
 
 class Participant(Base):
     __tablename__ = "participants"
+    # Listagens por evento e ON DELETE CASCADE (migração 0002)
+    __table_args__ = (Index("ix_participants_event_id_id", "event_id", "id"),)
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     _name = Column("name", String, nullable=False)
-    event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
+    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
 
     event = relationship("Event", back_populates="participants")
 
@@ -22,9 +24,14 @@ class Participant(Base):
 
     @name.setter
     def name(self, value):
+        self._name = self.validate_name(value)
+
+    @staticmethod
+    def validate_name(value):
+        """Regra do nome, compartilhada com a importação em lote (que não instancia o modelo)"""
         if not value:
             raise ValueError("O nome do participante não pode ser vazio.")
-        self._name = value
+        return value
 
     def to_dict(self):
         return {
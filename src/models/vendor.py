@@ -1,15 +1,17 @@
 # models/vendor.py
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from src.database.db import Base
 
 class Vendor(Base):
     __tablename__ = "vendors"
+    # Listagens por evento e ON DELETE CASCADE (migração 0002)
+    __table_args__ = (Index("ix_vendors_event_id_id", "event_id", "id"),)
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     _name = Column("name", String, nullable=False)
     _services = Column("services", String, nullable=True)
-    event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
+    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
 
     event = relationship("Event", back_populates="vendors")
 
@@ -24,9 +26,13 @@ class Vendor(Base):
 
     @name.setter
     def name(self, value):
+        self._name = self.validate_name(value)
+
+    @staticmethod
+    def validate_name(value):
         if not value:
             raise ValueError("O nome do fornecedor não pode ser vazio.")
-        self._name = value
+        return value
 
     @property
     def services(self):
@@ -0,0 +1,18 @@
+# notifications/listeners/cache_listeners.py
+from src.cache.cache_manager import cache_manager
+from src.database.unit_of_work import on_commit
+from src.notifications.notification_manager import notification_manager
+
+def invalidate_event_cache(data=None):
+    """Invalida listagens e eventos em cache quando algum evento muda"""
+    cache_manager.invalidate("events")
+    # Invalida de novo após o commit: uma leitura concorrente feita antes dele
+    # pode ter recolocado no cache os dados antigos
+    on_commit(lambda: cache_manager.invalidate("events"))
+
+# Registrar para todas as alterações de eventos; sync=True porque a invalidação
+# precisa acontecer na própria requisição (e na unidade de trabalho dela)
+notification_manager.subscribe("event_created", invalidate_event_cache, sync=True)
+notification_manager.subscribe("event_updated", invalidate_event_cache, sync=True)
+notification_manager.subscribe("event_deleted", invalidate_event_cache, sync=True)
+notification_manager.subscribe("events_bulk_changed", invalidate_event_cache, sync=True)
@@ -1,21 +1,292 @@
 # notifications/notification_manager.py
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+from src.metrics.registry import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+MODES = ("sync", "async")
+# O que fazer quando a fila do modo assíncrono está cheia
+OVERFLOW_POLICIES = ("block", "drop", "caller_runs")
+
+listener_duration = metrics_registry.histogram(
+    "notification_listener_duration_seconds", "Duração de cada chamada de ouvinte de notificação",
+    labels=("listener", "outcome"),
+)
+
 
 class NotificationManager:
-    def __init__(self):
+    """Publicador/assinante de eventos do sistema (padrão Observer).
+
+    Modo "sync" (padrão, usado nos testes): os ouvintes rodam na própria chamada
+    de notify, como sempre foi. Modo "async": notify só coloca a notificação numa
+    fila limitada e retorna; threads despachantes entregam aos ouvintes, cada um
+    com um tempo limite e com as exceções isoladas (registradas no log, sem
+    afetar os demais ouvintes nem a requisição). Ouvintes assinados com
+    ``sync=True`` (ex.: invalidação de cache) rodam sempre na chamada de notify.
+    """
+
+    def __init__(self, mode="sync", workers=4, queue_size=1000, overflow="block",
+                 listener_timeout=5.0, enqueue_timeout=1.0):
         # Dicionário onde as chaves são tipos de eventos e os valores são listas de funções
         self.listeners = {}
-    
-    def subscribe(self, event_type, listener_function):
+        self._sync_listeners = set()
+        self._stats_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._queue = None
+        self._executor = None
+        self._dispatchers = []
+        self._pid = None
+        self.reset_stats()
+        self.configure(mode, workers, queue_size, overflow, listener_timeout, enqueue_timeout)
+
+    def configure(self, mode=None, workers=None, queue_size=None, overflow=None,
+                  listener_timeout=None, enqueue_timeout=None):
+        """Altera o modo de despacho; as threads são (re)criadas na próxima notificação"""
+        if mode is not None and mode not in MODES:
+            raise ValueError(f"Modo de notificação desconhecido: {mode}")
+        if overflow is not None and overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Política de fila cheia desconhecida: {overflow}")
+        self.shutdown()
+        if mode is not None:
+            self.mode = mode
+        if workers is not None:
+            self.workers = workers
+        if queue_size is not None:
+            self.queue_size = queue_size
+        if overflow is not None:
+            self.overflow = overflow
+        if listener_timeout is not None:
+            self.listener_timeout = listener_timeout
+        if enqueue_timeout is not None:
+            self.enqueue_timeout = enqueue_timeout
+
+    def subscribe(self, event_type, listener_function, sync=False):
         """Adiciona um ouvinte para um tipo de evento"""
         if event_type not in self.listeners:
             self.listeners[event_type] = []
         self.listeners[event_type].append(listener_function)
-    
+        if sync:
+            self._sync_listeners.add(listener_function)
+
     def notify(self, event_type, data=None):
         """Notifica todos os ouvintes interessados em um evento"""
-        if event_type in self.listeners:
+        if event_type not in self.listeners:
+            return
+        if self.mode == "sync":
             for listener_function in self.listeners[event_type]:
                 listener_function(data)
+            return
+
+        deferred = []
+        for listener_function in self.listeners[event_type]:
+            if listener_function in self._sync_listeners:
+                listener_function(data)
+            else:
+                deferred.append(listener_function)
+        if deferred:
+            self._enqueue((event_type, data, deferred, None))
+
+    # Entrega em duas etapas, usada pelo outbox (src/notifications/outbox.py)
+
+    def notify_sync_listeners(self, event_type, data=None):
+        """Chama só os ouvintes assinados com sync=True, na própria chamada"""
+        for listener_function in self.listeners.get(event_type, []):
+            if listener_function in self._sync_listeners:
+                listener_function(data)
+
+    def deliver(self, event_type, data=None):
+        """Chama os demais ouvintes, em sequência; se algum falhar, levanta a primeira exceção
+        depois de tentar todos (o relay do outbox então reagenda a mensagem)"""
+        first_error = None
+        for listener_function in self.listeners.get(event_type, []):
+            if listener_function in self._sync_listeners:
+                continue
+            name = getattr(listener_function, "__qualname__", repr(listener_function))
+            start = time.perf_counter()
+            try:
+                listener_function(data)
+                self._record(name, time.perf_counter() - start, "delivered")
+            except Exception as e:
+                self._record(name, time.perf_counter() - start, "failed")
+                logger.exception("Ouvinte %s falhou ao tratar '%s'", name, event_type)
+                first_error = first_error or e
+        if first_error is not None:
+            raise first_error
+
+    def dispatch(self, event_type, data=None, on_done=None):
+        """Entrega aos ouvintes não-sync pelo modo configurado e chama on_done(erro) ao terminar.
+
+        Usada pelo relay do outbox. No modo "async" só enfileira: os despachantes
+        entregam com o tempo limite e o isolamento de falhas de cada ouvinte, e
+        on_done recebe None se todos terminaram bem, ou a primeira falha (exceção,
+        tempo esgotado ou fila cheia). No modo "sync" entrega na própria chamada.
+        """
+        on_done = on_done or (lambda error: None)
+        listeners = [f for f in self.listeners.get(event_type, []) if f not in self._sync_listeners]
+        if self.mode == "sync" or not listeners:
+            try:
+                self.deliver(event_type, data)
+            except Exception as e:
+                on_done(e)
+            else:
+                on_done(None)
+            return
+        self._enqueue((event_type, data, listeners, on_done))
+
+    # Modo assíncrono
+
+    def _ensure_started(self):
+        # Após um fork (gunicorn com preload) as threads do processo pai não existem no filho
+        if self._pid == os.getpid():
+            return
+        with self._state_lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.Queue(maxsize=self.queue_size)
+            # Folga para ouvintes que estouraram o tempo limite e ainda ocupam uma thread
+            self._executor = ThreadPoolExecutor(max_workers=self.workers * 2, thread_name_prefix="notify-listener")
+            self._dispatchers = [
+                threading.Thread(target=self._dispatch_loop, name=f"notify-dispatch-{i}", daemon=True)
+                for i in range(self.workers)
+            ]
+            for thread in self._dispatchers:
+                thread.start()
+            self._pid = os.getpid()
+
+    def _enqueue(self, job):
+        self._ensure_started()
+        try:
+            if self.overflow == "block":
+                self._queue.put(job, timeout=self.enqueue_timeout)
+            else:
+                self._queue.put_nowait(job)
+            self._count("queued")
+        except queue.Full:
+            if self.overflow == "caller_runs":
+                self._count("caller_runs")
+                self._deliver(job)
+            else:
+                self._count("dropped")
+                logger.warning("Fila de notificações cheia; '%s' descartada", job[0])
+                if job[3] is not None:
+                    job[3](RuntimeError("Fila de notificações cheia"))
+
+    def _dispatch_loop(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._deliver(job)
+            finally:
+                self._queue.task_done()
+
+    def _deliver(self, job):
+        event_type, data, listeners, on_done = job
+        error = None
+        for listener_function in listeners:
+            name = getattr(listener_function, "__qualname__", repr(listener_function))
+            started = threading.Event()
+            future = self._executor.submit(self._run_listener, listener_function, data, started)
+            # O tempo limite conta a partir do início da execução. A espera por uma thread livre
+            # também é limitada: com o pool tomado por ouvintes travados, a entrega estoura o
+            # tempo em vez de bloquear o despachante (ou a requisição, em caller_runs) para sempre
+            if not started.wait(self.listener_timeout) and future.cancel():
+                self._record(name, self.listener_timeout, "timed_out")
+                logger.warning("Nenhuma thread livre para o ouvinte %s em %.1fs ('%s')",
+                               name, self.listener_timeout, event_type)
+                error = error or TimeoutError(f"Nenhuma thread livre para o ouvinte {name}")
+                continue
+            start = time.perf_counter()
+            try:
+                future.result(timeout=self.listener_timeout)
+                self._record(name, time.perf_counter() - start, "delivered")
+            except FutureTimeoutError:
+                # A thread do ouvinte continua rodando; o despachante segue para o próximo
+                self._record(name, time.perf_counter() - start, "timed_out")
+                logger.warning("Ouvinte %s excedeu %.1fs em '%s'", name, self.listener_timeout, event_type)
+                error = error or TimeoutError(f"Ouvinte {name} excedeu {self.listener_timeout}s")
+            except Exception as e:
+                self._record(name, time.perf_counter() - start, "failed")
+                logger.exception("Ouvinte %s falhou ao tratar '%s'", name, event_type)
+                error = error or e
+        if on_done is not None:
+            on_done(error)
+
+    @staticmethod
+    def _run_listener(listener_function, data, started):
+        started.set()
+        return listener_function(data)
+
+    def join(self):
+        """Espera a fila esvaziar (útil em testes e no encerramento)"""
+        if self._pid == os.getpid() and self._queue is not None:
+            self._queue.join()
+
+    def shutdown(self, wait=True):
+        """Encerra as threads do modo assíncrono, entregando o que já está na fila"""
+        with self._state_lock:
+            if self._pid != os.getpid() or self._queue is None:
+                self._pid = None
+                return
+            for _ in self._dispatchers:
+                self._queue.put(None)
+            if wait:
+                for thread in self._dispatchers:
+                    thread.join()
+            self._executor.shutdown(wait=wait)
+            self._queue, self._executor, self._dispatchers, self._pid = None, None, [], None
+
+    # Estatísticas
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._stats = {"queued": 0, "dropped": 0, "caller_runs": 0}
+            self._listener_stats = {}
+
+    def _count(self, field):
+        with self._stats_lock:
+            self._stats[field] += 1
+
+    def _record(self, name, seconds, outcome):
+        listener_duration.observe(seconds, listener=name, outcome=outcome)
+        with self._stats_lock:
+            stats = self._listener_stats.setdefault(name, {
+                "delivered": 0, "failed": 0, "timed_out": 0, "total_seconds": 0.0, "max_seconds": 0.0,
+            })
+            stats[outcome] += 1
+            stats["total_seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+
+    def stats(self):
+        with self._stats_lock:
+            return {
+                **self._stats,
+                "mode": self.mode,
+                "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+                "listeners": {name: dict(values) for name, values in self._listener_stats.items()},
+            }
+
+
+def build_notification_manager(environ=None):
+    """Cria o gerenciador conforme NOTIFICATIONS_MODE, _WORKERS, _QUEUE_SIZE, _OVERFLOW e _LISTENER_TIMEOUT"""
+    environ = os.environ if environ is None else environ
+    return NotificationManager(
+        mode=environ.get("NOTIFICATIONS_MODE", "sync"),
+        workers=int(environ.get("NOTIFICATIONS_WORKERS", 4)),
+        queue_size=int(environ.get("NOTIFICATIONS_QUEUE_SIZE", 1000)),
+        overflow=environ.get("NOTIFICATIONS_OVERFLOW", "block"),
+        listener_timeout=float(environ.get("NOTIFICATIONS_LISTENER_TIMEOUT", 5.0)),
+    )
+
 
 # Criando uma única instância global
-notification_manager = NotificationManager()
\ No newline at end of file
+notification_manager = build_notification_manager()
+atexit.register(notification_manager.shutdown)
@@ -0,0 +1,199 @@
+# notifications/outbox.py
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select
+
+from src.database.unit_of_work import UnitOfWork, get_session, on_commit
+from src.models.outbox_message import OutboxMessage
+from src.notifications.notification_manager import notification_manager
+
+logger = logging.getLogger(__name__)
+
+
+def publish(event_type, payload):
+    """Registra uma notificação no outbox, dentro da transação da alteração que a gerou.
+
+    Se a transação for desfeita, a notificação some junto; se o processo cair
+    depois do commit, ela continua na tabela e é entregue quando o relay voltar.
+    Ouvintes assinados com sync=True (invalidação de cache) rodam imediatamente;
+    os demais recebem o payload pelo relay, logo após o commit.
+    """
+    get_session().add(OutboxMessage(event_type=event_type, payload=json.dumps(payload, default=str)))
+    notification_manager.notify_sync_listeners(event_type, payload)
+    on_commit(outbox_relay.wake)
+
+
+class OutboxRelay:
+    """Esvazia o outbox em lotes e entrega as mensagens ao NotificationManager.
+
+    Cada lote passa por três etapas, nenhuma com os ouvintes dentro de uma transação:
+
+    1. reserva: as mensagens são lidas com FOR UPDATE SKIP LOCKED (PostgreSQL; com
+       vários processos, cada um fica com um lote diferente) e têm available_at
+       adiado por claim_timeout segundos; o commit solta os bloqueios na hora;
+    2. entrega: fora da transação, por NotificationManager.dispatch, que no modo
+       "async" usa a fila, o tempo limite e o isolamento de falhas de cada ouvinte;
+    3. conclusão: numa transação curta, apaga as mensagens cuja entrega terminou bem
+       e reagenda as que falharam, com backoff exponencial.
+
+    Entrega pelo menos uma vez: uma mensagem só é apagada depois que a entrega
+    terminou, e uma reserva que não chega ao fim (queda do processo, ouvinte que
+    demora mais que claim_timeout) expira e a mensagem volta a ser entregue.
+    """
+
+    def __init__(self, manager=None, batch_size=100, poll_interval=1.0,
+                 max_attempts=10, max_backoff=300, claim_timeout=60, enabled=True):
+        self.manager = manager or notification_manager
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.max_backoff = max_backoff
+        self.claim_timeout = claim_timeout
+        self.enabled = enabled
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        # (id da mensagem, erro ou None) das entregas terminadas e ainda não registradas no banco
+        self._completed = []
+        self._thread = None
+        self._pid = None
+        self.reset_stats()
+
+    def reset_stats(self):
+        self._stats = {"batches": 0, "delivered": 0, "failed": 0, "busy_seconds": 0.0, "last_batch_seconds": 0.0}
+
+    def process_batch(self):
+        """Reserva e despacha um lote; devolve quantas mensagens foram reservadas"""
+        start = time.perf_counter()
+        self.finish_completed()
+        claimed = self._claim()
+        for message_id, event_type, payload in claimed:
+            self.manager.dispatch(event_type, json.loads(payload),
+                                  on_done=lambda error, message_id=message_id: self._complete(message_id, error))
+        # No modo "sync" as entregas já terminaram: o lote é concluído aqui mesmo
+        self.finish_completed()
+
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["busy_seconds"] += elapsed
+            self._stats["last_batch_seconds"] = elapsed
+        return len(claimed)
+
+    def _claim(self):
+        now = datetime.now(timezone.utc)
+        with UnitOfWork() as uow:
+            session = uow.session
+            messages = session.scalars(
+                select(OutboxMessage)
+                .where(OutboxMessage.available_at <= now, OutboxMessage.attempts < self.max_attempts)
+                .order_by(OutboxMessage.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            ).all()
+            lease_until = now + timedelta(seconds=self.claim_timeout)
+            for message in messages:
+                message.available_at = lease_until
+            return [(message.id, message.event_type, message.payload) for message in messages]
+
+    def _complete(self, message_id, error):
+        # Chamado pela thread que terminou a entrega (despachante no modo "async")
+        with self._lock:
+            self._completed.append((message_id, error))
+        if self.manager.mode != "sync":
+            self._wakeup.set()
+
+    def finish_completed(self):
+        """Apaga as mensagens entregues e reagenda as que falharam; devolve quantas concluiu"""
+        with self._lock:
+            completed, self._completed = self._completed, []
+        if not completed:
+            return 0
+        now = datetime.now(timezone.utc)
+        delivered_ids = [message_id for message_id, error in completed if error is None]
+        errors = {message_id: error for message_id, error in completed if error is not None}
+        with UnitOfWork() as uow:
+            session = uow.session
+            if delivered_ids:
+                session.execute(delete(OutboxMessage).where(OutboxMessage.id.in_(delivered_ids)))
+            if errors:
+                for message in session.scalars(select(OutboxMessage).where(OutboxMessage.id.in_(errors))):
+                    error = errors[message.id]
+                    message.attempts += 1
+                    message.last_error = f"{type(error).__name__}: {error}"[:500]
+                    message.available_at = now + timedelta(seconds=min(2 ** message.attempts, self.max_backoff))
+        with self._lock:
+            self._stats["delivered"] += len(delivered_ids)
+            self._stats["failed"] += len(errors)
+        return len(completed)
+
+    def drain(self):
+        """Processa lotes até não haver mensagens disponíveis; devolve o total lido"""
+        total = 0
+        while True:
+            count = self.process_batch()
+            total += count
+            if count < self.batch_size:
+                return total
+
+    def pending(self):
+        with UnitOfWork() as uow:
+            return uow.session.scalar(select(func.count()).select_from(OutboxMessage))
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        busy = stats["busy_seconds"]
+        stats["messages_per_second"] = stats["delivered"] / busy if busy else 0.0
+        return stats
+
+    # Thread em segundo plano
+
+    def ensure_started(self):
+        # Após um fork (gunicorn com preload) a thread do processo pai não existe no filho
+        if not self.enabled or self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="outbox-relay", daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def wake(self):
+        """Pede uma entrega imediata (chamado após o commit de quem publicou)"""
+        self.ensure_started()
+        self._wakeup.set()
+
+    def stop(self, timeout=5.0):
+        if self._pid != os.getpid():
+            return
+        self._stop.set()
+        self._wakeup.set()
+        self._thread.join(timeout)
+        self._thread, self._pid = None, None
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.drain()
+            except Exception:
+                logger.exception("Falha ao processar o outbox; nova tentativa em %.1fs", self.poll_interval)
+
+
+outbox_relay = OutboxRelay(
+    batch_size=int(os.environ.get("OUTBOX_BATCH_SIZE", 100)),
+    poll_interval=float(os.environ.get("OUTBOX_POLL_INTERVAL", 1.0)),
+    claim_timeout=float(os.environ.get("OUTBOX_CLAIM_TIMEOUT", 60)),
+    enabled=os.environ.get("OUTBOX_RELAY_ENABLED", "1").lower() not in ("0", "false", "no"),
+)
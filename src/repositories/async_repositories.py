@@ -0,0 +1,135 @@
+# repositories/async_repositories.py
+"""Repositórios assíncronos: mesmos métodos dos síncronos, como corrotinas sobre a
+AsyncSession da unidade de trabalho assíncrona. Relações nunca são carregadas de
+forma preguiçosa (isso exigiria I/O implícito); as listagens devolvem só colunas."""
+from abc import ABC, abstractmethod
+from sqlalchemy import exists, select
+from src.database.async_unit_of_work import get_async_session
+from src.models.event import Event
+from src.models.feedback import Feedback
+from src.models.participant import Participant
+from src.models.speaker import Speaker
+from src.models.vendor import Vendor
+from .event_repository import EVENT_COLUMNS, EventRepository
+from .pagination import keyset
+
+class AsyncBaseRepository(ABC):
+    model = None
+
+    @property
+    def session(self):
+        """AsyncSession da unidade de trabalho ativa, compartilhada por todos os repositórios"""
+        return get_async_session()
+
+    @abstractmethod
+    async def add(self, obj):
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, obj_id):
+        pass
+
+    @abstractmethod
+    async def list_all(self):
+        pass
+
+    @abstractmethod
+    async def remove(self, obj):
+        pass
+
+
+class AsyncChildRepository(AsyncBaseRepository):
+    """Participantes, palestrantes, fornecedores e feedbacks: filhos de um evento"""
+
+    async def add(self, obj):
+        # flush gera o id; o commit fica a cargo da unidade de trabalho
+        self.session.add(obj)
+        await self.session.flush()
+        return obj
+
+    async def get_by_id(self, obj_id):
+        if obj_id is None:
+            return None
+        return await self.session.get(self.model, obj_id)
+
+    async def list_all(self):
+        return (await self.session.scalars(select(self.model))).all()
+
+    async def list_by_event(self, event_id: int, limit: int | None = None, after_id: int | None = None):
+        stmt = select(self.model).where(self.model.event_id == event_id)
+        return (await self.session.scalars(keyset(stmt, self.model.id, limit, after_id))).all()
+
+    async def list_rows_by_event(self, event_id: int, limit: int | None = None, after_id: int | None = None):
+        """Ver BaseRepository.list_rows_by_event"""
+        table = self.model.__table__
+        stmt = select(*table.c).where(table.c.event_id == event_id)
+        return (await self.session.execute(keyset(stmt, table.c.id, limit, after_id))).all()
+
+    async def remove(self, obj):
+        await self.session.delete(obj)
+        await self.session.flush()
+
+
+class AsyncEventRepository(AsyncBaseRepository):
+    model = Event
+
+    async def add(self, event: Event) -> Event:
+        self.session.add(event)
+        await self.session.flush()
+        return event
+
+    async def get_by_id(self, event_id: int) -> Event | None:
+        if event_id is None:
+            return None
+        return await self.session.get(Event, event_id)
+
+    async def get_row(self, event_id: int):
+        if event_id is None:
+            return None
+        return (await self.session.execute(select(*EVENT_COLUMNS).where(Event.id == event_id))).first()
+
+    async def names_by_id(self, event_ids) -> dict[int, str]:
+        if not event_ids:
+            return {}
+        return dict((await self.session.execute(select(Event.id, Event._name).where(Event.id.in_(event_ids)))).all())
+
+    async def exists(self, event_id: int) -> bool:
+        return (await self.session.execute(select(exists().where(Event.id == event_id)))).scalar()
+
+    async def stats(self, event_ids) -> dict[int, dict]:
+        """Ver EventRepository.stats (mesma consulta única sobre event_summary)"""
+        if not event_ids:
+            return {}
+        result = await self.session.execute(EventRepository.stats_statement(event_ids))
+        return EventRepository.stats_payload(result.mappings())
+
+    async def list_all(self) -> list[Event]:
+        return (await self.session.scalars(select(Event))).all()
+
+    async def list_page(self, limit: int | None = None, after_id: int | None = None) -> list:
+        return (await self.session.execute(keyset(select(*EVENT_COLUMNS), Event.id, limit, after_id))).all()
+
+    async def list_between(self, start=None, end=None, limit: int | None = None, after_id: int | None = None,
+                           after_date=None) -> list:
+        stmt = EventRepository.between_statement(start, end, limit, after_id, after_date)
+        return (await self.session.execute(stmt)).all()
+
+    async def remove(self, event: Event) -> None:
+        await self.session.delete(event)
+        await self.session.flush()
+
+
+class AsyncParticipantRepository(AsyncChildRepository):
+    model = Participant
+
+
+class AsyncSpeakerRepository(AsyncChildRepository):
+    model = Speaker
+
+
+class AsyncVendorRepository(AsyncChildRepository):
+    model = Vendor
+
+
+class AsyncFeedbackRepository(AsyncChildRepository):
+    model = Feedback
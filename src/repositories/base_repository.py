@@ -1,10 +1,29 @@
 # repositories/base_repository.py
 from abc import ABC, abstractmethod
+from sqlalchemy import Integer, bindparam, column, delete, insert, select, update, values
+from src.database.unit_of_work import get_session
+from .pagination import keyset
 
-class BaseRepository(ABC):
-    @abstractmethod
-    def add(self, obj):
-        pass
+# Linhas por comando nas operações em lote (limita o tamanho de cada statement)
+BULK_CHUNK_SIZE = 1000
+
+def _chunks(items, size=BULK_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+class ReadRepository(ABC):
+    """Base dos repositórios: sessão compartilhada e leitura por id.
+
+    Tabelas que a aplicação não altera linha a linha (livro-razão somente inserção,
+    tabelas mantidas por triggers) partem daqui, sem a API de escrita de BaseRepository.
+    """
+    # Modelo gerenciado pelo repositório; as operações em lote trabalham direto na sua tabela
+    model = None
+
+    @property
+    def session(self):
+        """Sessão da unidade de trabalho ativa, compartilhada por todos os repositórios"""
+        return get_session()
 
     @abstractmethod
     def get_by_id(self, obj_id):
@@ -14,6 +33,90 @@ class BaseRepository(ABC):
     def list_all(self):
         pass
 
+
+class BaseRepository(ReadRepository):
+    """Repositório de uma entidade que a aplicação cria, altera e remove"""
+
+    @abstractmethod
+    def add(self, obj):
+        pass
+
     @abstractmethod
     def remove(self, obj):
-        pass
\ No newline at end of file
+        pass
+
+    # Leitura das listagens: só colunas, em linhas do SQLAlchemy (named tuples), sem
+    # instanciar o modelo nem passar pelo mapa de identidade
+
+    def list_rows_by_event(self, event_id: int, limit: int | None = None, after_id: int | None = None) -> list:
+        """Página das linhas de um evento (tabelas filhas), com as colunas do modelo"""
+        table = self.model.__table__
+        stmt = select(*table.c).where(table.c.event_id == event_id)
+        return self.session.execute(keyset(stmt, table.c.id, limit, after_id)).all()
+
+    # Operações em lote: SQL por conjunto, sem instanciar o modelo nem passar pelo mapa
+    # de identidade. Recebem e devolvem dicionários com os nomes das colunas.
+
+    def insert_many(self, rows: list[dict]) -> list[dict]:
+        """INSERT multi-linha com RETURNING; devolve as linhas criadas (com id)"""
+        table = self.model.__table__
+        created = []
+        for chunk in _chunks(rows):
+            result = self.session.execute(insert(table).returning(*table.c), chunk)
+            created.extend(dict(row._mapping) for row in result)
+        return created
+
+    def update_many(self, rows: list[dict]) -> list[int]:
+        """Atualiza várias linhas pelo id; cada linha traz "id" e as colunas a alterar.
+
+        No PostgreSQL cada grupo de linhas com as mesmas colunas vira um único
+        ``UPDATE ... FROM (VALUES ...) RETURNING id``; nos demais bancos, um executemany.
+        Devolve os ids que existiam e foram atualizados.
+        """
+        table = self.model.__table__
+        is_postgres = self.session.get_bind().dialect.name == "postgresql"
+        groups = {}
+        for row in rows:
+            columns = tuple(sorted(key for key in row if key != "id"))
+            groups.setdefault(columns, []).append(row)
+
+        updated = []
+        for columns, group in groups.items():
+            if not columns:
+                continue
+            for chunk in _chunks(group):
+                if is_postgres:
+                    data = values(
+                        column("id", Integer),
+                        *[column(name, table.c[name].type) for name in columns],
+                        name="data",
+                    ).data([(row["id"], *[row[name] for name in columns]) for row in chunk])
+                    stmt = update(table)\
+                        .where(table.c.id == data.c.id)\
+                        .values({name: data.c[name] for name in columns})\
+                        .returning(table.c.id)
+                    updated.extend(self.session.scalars(stmt))
+                else:
+                    ids = [row["id"] for row in chunk]
+                    existing = set(self.session.scalars(select(table.c.id).where(table.c.id.in_(ids))))
+                    stmt = update(table)\
+                        .where(table.c.id == bindparam("b_id"))\
+                        .values({name: bindparam(f"b_{name}") for name in columns})
+                    self.session.execute(stmt, [
+                        {"b_id": row["id"], **{f"b_{name}": row[name] for name in columns}}
+                        for row in chunk
+                    ])
+                    updated.extend(i for i in ids if i in existing)
+        # Objetos já carregados nesta sessão deixam de refletir o banco
+        self.session.expire_all()
+        return updated
+
+    def delete_many(self, ids: list[int]) -> list[int]:
+        """DELETE ... WHERE id IN (...) RETURNING id; devolve os ids removidos"""
+        table = self.model.__table__
+        deleted = []
+        for chunk in _chunks(list(ids)):
+            stmt = delete(table).where(table.c.id.in_(chunk)).returning(table.c.id)
+            deleted.extend(self.session.scalars(stmt))
+        self.session.expire_all()
+        return deleted
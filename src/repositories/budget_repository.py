@@ -0,0 +1,119 @@
+# repositories/budget_repository.py
+from sqlalchemy import case, func, insert, literal, select, update
+from src.models.budget_entry import BudgetEntry
+from src.models.event import Event
+from .base_repository import ReadRepository, _chunks
+from .pagination import keyset
+
+events = Event.__table__
+entries = BudgetEntry.__table__
+# Colunas devolvidas pelas alterações: o mesmo formato de Event.to_dict(include_relations=False)
+EVENT_COLUMNS = (events.c.id, events.c.name, events.c.date, events.c.budget)
+
+class BudgetRepository(ReadRepository):
+    """Livro-razão do orçamento e alterações atômicas do orçamento dos eventos.
+
+    O orçamento é alterado por um UPDATE condicional no próprio banco, sem ler o
+    evento antes: duas alterações simultâneas se serializam no lock da linha e
+    nenhuma se perde. No PostgreSQL o UPDATE e o lançamento no livro-razão vão
+    num único comando (CTE), numa só ida ao banco.
+    """
+    model = BudgetEntry
+
+    def get_by_id(self, entry_id: int) -> BudgetEntry | None:
+        return self.session.get(BudgetEntry, entry_id)
+
+    def list_all(self) -> list[BudgetEntry]:
+        return self.session.query(BudgetEntry).all()
+
+    def list_by_event(self, event_id: int, limit: int | None = None, after_id: int | None = None) -> list[BudgetEntry]:
+        query = self.session.query(BudgetEntry).filter(BudgetEntry.event_id == event_id)
+        return keyset(query, BudgetEntry.id, limit, after_id).all()
+
+    def record(self, event_id: int, kind: str, amount: float, balance: float) -> None:
+        """Registra um lançamento de uma alteração já aplicada pelo ORM (criação/edição do evento)"""
+        self.session.execute(insert(entries).values(event_id=event_id, kind=kind, amount=amount, balance=balance))
+
+    def record_many(self, rows: list[dict]) -> None:
+        """Registra vários lançamentos ("event_id", "kind", "amount", "balance") num executemany por bloco"""
+        for chunk in _chunks(rows):
+            self.session.execute(insert(entries), chunk)
+
+    def budgets_for_update(self, event_ids) -> dict:
+        """{id: orçamento} dos eventos existentes, com lock das linhas até o fim da transação"""
+        budgets = {}
+        for chunk in _chunks(sorted(set(event_ids))):
+            stmt = select(events.c.id, events.c.budget).where(events.c.id.in_(chunk)).with_for_update()
+            budgets.update((row.id, row.budget or 0) for row in self.session.execute(stmt))
+        return budgets
+
+    def adjust(self, event_id: int, amount: float) -> dict | None:
+        """Soma amount ao orçamento, se o resultado não ficar negativo.
+
+        Retorna o evento atualizado ou None se ele não existe ou o saldo ficaria negativo.
+        """
+        change = (
+            update(events)
+            .where(events.c.id == event_id, func.coalesce(events.c.budget, 0) + amount >= 0)
+            .values(budget=func.coalesce(events.c.budget, 0) + amount)
+        )
+        return self._apply(change, "adjust", literal(amount))
+
+    def set(self, event_id: int, value: float) -> dict | None:
+        """Define o orçamento; o lançamento guarda a diferença para o valor anterior"""
+        if not self._is_postgres():
+            # O RETURNING do SQLite não enxerga outras tabelas: lê o valor anterior antes, com lock da linha
+            previous = self.session.execute(
+                select(events.c.budget).where(events.c.id == event_id).with_for_update()
+            ).first()
+            if previous is None:
+                return None
+            change = update(events).where(events.c.id == event_id).values(budget=value)
+            return self._apply(change, "set", literal(value - (previous.budget or 0)))
+
+        previous = select(events.c.id, events.c.budget).where(events.c.id == event_id).with_for_update().cte("previous")
+        change = (
+            update(events)
+            .where(events.c.id == previous.c.id)
+            .values(budget=value)
+        )
+        return self._apply(change, "set", literal(value) - func.coalesce(previous.c.budget, 0))
+
+    def _is_postgres(self):
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    def _apply(self, change, kind, amount):
+        # Alterações que não mudam o valor não geram lançamento
+        if self._is_postgres():
+            changed = change.returning(*EVENT_COLUMNS, amount.label("amount")).cte("changed")
+            entry = insert(entries).from_select(
+                ["event_id", "kind", "amount", "balance", "created_at"],
+                select(changed.c.id, literal(kind), changed.c.amount, changed.c.budget, func.now())
+                .where(changed.c.amount != 0),
+            ).cte("entry")
+            query = select(*(changed.c[c.name] for c in EVENT_COLUMNS)).add_cte(entry)
+            row = self.session.execute(query).mappings().first()
+        else:
+            # Sem DML dentro de CTE: o UPDATE com RETURNING e o INSERT vão em dois comandos, na mesma transação
+            row = self.session.execute(change.returning(*EVENT_COLUMNS, amount.label("amount"))).mappings().first()
+            if row is not None and row["amount"] != 0:
+                self.record(row["id"], kind, row["amount"], row["budget"])
+        # Eventos já carregados na sessão passariam a ter o orçamento antigo
+        self.session.expire_all()
+        if row is None:
+            return None
+        event = {c.name: row[c.name] for c in EVENT_COLUMNS}
+        event["date"] = event["date"].isoformat()
+        return event
+
+    def totals(self, event_id: int) -> dict:
+        """Totais do livro-razão de um evento, calculados em uma única agregação"""
+        row = self.session.execute(
+            select(
+                func.count(entries.c.id).label("entries"),
+                func.coalesce(func.sum(case((entries.c.amount > 0, entries.c.amount), else_=0)), 0).label("credits"),
+                func.coalesce(func.sum(case((entries.c.amount < 0, -entries.c.amount), else_=0)), 0).label("debits"),
+                func.coalesce(func.sum(entries.c.amount), 0).label("net"),
+            ).where(entries.c.event_id == event_id)
+        ).mappings().one()
+        return dict(row)
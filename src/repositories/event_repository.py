@@ -1,48 +1,197 @@
 # repositories/event_repository.py
-from sqlalchemy.orm import joinedload
-from src.database.db import SessionLocal
+from datetime import date
+from sqlalchemy import delete, exists, func, literal, select, tuple_, union_all
+from sqlalchemy.orm import selectinload
 from src.models.event import Event
+from src.models.event_summary import EventSummary
+from src.models.feedback import Feedback
+from src.models.participant import Participant
+from src.models.speaker import Speaker
+from src.models.vendor import Vendor
+from .base_repository import BaseRepository
+from .pagination import keyset
 
-class EventRepository:
-    def __init__(self):
-        self._Session = SessionLocal
-
-    def add(self, event: Event):
-        session = self._Session()
-        try:
-            session.add(event)
-            session.commit()
-            session.refresh(event)
-            return event
-        finally:
-            session.close()
-
-    def get_by_id(self, event_id: int) -> Event | None:
-        session = self._Session()
-        try:
-            # Carrega o evento e suas relações de uma só vez
-            return session.query(Event)\
-                .options(
-                    joinedload(Event.participants),
-                    joinedload(Event.speakers),
-                    joinedload(Event.vendors),
-                    joinedload(Event.feedbacks)
-                )\
-                .filter(Event.id == event_id).first()
-        finally:
-            session.close()
+# Perfis de carregamento: quais relações acompanham o evento. selectinload faz uma
+# consulta extra por relação (WHERE event_id IN ...), sem o produto cartesiano P×S×V×F
+# que vários joinedload de coleções produzem.
+LOAD_PROFILES = {
+    "bare": (),
+    "participants": ("participants",),
+    "speakers": ("speakers",),
+    "vendors": ("vendors",),
+    "feedbacks": ("feedbacks",),
+    "full": ("participants", "speakers", "vendors", "feedbacks"),
+}
+
+# Tabelas filhas contadas nas estatísticas por evento
+CHILD_TABLES = {
+    "participants": Participant.__table__,
+    "speakers": Speaker.__table__,
+    "vendors": Vendor.__table__,
+    "feedbacks": Feedback.__table__,
+}
+
+# Colunas das listagens de eventos, com os nomes das colunas (name, date, budget)
+EVENT_COLUMNS = tuple(Event.__table__.c)
+
+class EventRepository(BaseRepository):
+    model = Event
+
+    def add(self, event: Event) -> Event:
+        # flush gera o id; o commit fica a cargo da unidade de trabalho
+        self.session.add(event)
+        self.session.flush()
+        return event
+
+    def get_by_id(self, event_id: int, profile: str = "bare") -> Event | None:
+        if profile not in LOAD_PROFILES:
+            raise ValueError(f"Perfil de carregamento desconhecido: {profile}")
+        if event_id is None:
+            return None
+        relations = LOAD_PROFILES[profile]
+        if not relations:
+            # Sem relações: usa o mapa de identidade e só consulta se o evento ainda não foi carregado
+            return self.session.get(Event, event_id)
+        return self.session.query(Event)\
+            .options(*[selectinload(getattr(Event, name)) for name in relations])\
+            .filter(Event.id == event_id).first()
+
+    def exists(self, event_id: int) -> bool:
+        return self.session.execute(select(exists().where(Event.id == event_id))).scalar()
+
+    def existing_ids(self, event_ids) -> set[int]:
+        """Subconjunto de event_ids que existem, em uma única consulta"""
+        if not event_ids:
+            return set()
+        return set(self.session.scalars(select(Event.id).where(Event.id.in_(event_ids))))
+
+    def children(self, event_id: int) -> dict[str, list[dict]]:
+        """Filhos do evento por relação ({"participants": [...], ...}), lidos só como colunas.
+
+        Mesmo formato de Event.to_dict(include_relations=True), sem carregar o grafo de objetos.
+        """
+        return {
+            name: [dict(row) for row in self.session.execute(
+                select(*table.c).where(table.c.event_id == event_id).order_by(table.c.id)).mappings()]
+            for name, table in CHILD_TABLES.items()
+        }
+
+    def names_by_id(self, event_ids) -> dict[int, str]:
+        """{id: nome} dos eventos pedidos, sem carregar os objetos"""
+        if not event_ids:
+            return {}
+        return dict(self.session.execute(select(Event.id, Event._name).where(Event.id.in_(event_ids))).all())
+
+    def stats(self, event_ids) -> dict[int, dict]:
+        """Contagem de filhos e orçamento de cada evento existente em event_ids.
+
+        Uma única consulta, que lê os contadores pré-calculados de event_summary
+        (mantidos por triggers) em vez de contar as tabelas filhas. Nenhum objeto
+        do ORM é carregado.
+        """
+        if not event_ids:
+            return {}
+        return self.stats_payload(self.session.execute(self.stats_statement(event_ids)).mappings())
+
+    @staticmethod
+    def stats_statement(event_ids):
+        """SELECT de stats(), compartilhado com o repositório assíncrono"""
+        events, summary = Event.__table__, EventSummary.__table__
+        return select(events.c.id, events.c.name, events.c.date, events.c.budget,
+                      *(func.coalesce(summary.c[name], 0).label(name) for name in CHILD_TABLES),
+                      summary.c.last_activity_at)\
+            .select_from(events.outerjoin(summary, summary.c.event_id == events.c.id))\
+            .where(events.c.id.in_(event_ids))
+
+    @staticmethod
+    def stats_payload(rows):
+        return {
+            row["id"]: {
+                **row,
+                "date": row["date"].isoformat(),
+                "last_activity_at": row["last_activity_at"].isoformat() if row["last_activity_at"] else None,
+            }
+            for row in rows
+        }
+
+    def count_children(self, event_ids) -> dict[int, dict]:
+        """Contagem real dos filhos (sem event_summary), com um GROUP BY event_id por tabela
+        numa única consulta. Usada para conferir e reconstruir event_summary."""
+        counts = {event_id: {name: 0 for name in CHILD_TABLES} for event_id in event_ids}
+        if not counts:
+            return {}
+        query = union_all(*(
+            select(literal(name).label("child"), table.c.event_id, func.count().label("total"))
+            .where(table.c.event_id.in_(counts))
+            .group_by(table.c.event_id)
+            for name, table in CHILD_TABLES.items()
+        ))
+        for child, event_id, total in self.session.execute(query):
+            counts[event_id][child] = total
+        return counts
 
     def list_all(self) -> list[Event]:
-        session = self._Session()
-        try:
-            return session.query(Event).all()
-        finally:
-            session.close()
-
-    def remove(self, event: Event):
-        session = self._Session()
-        try:
-            session.delete(event)
-            session.commit()
-        finally:
-            session.close()
\ No newline at end of file
+        return self.session.query(Event).all()
+
+    # As listagens devolvem linhas (id, name, date, budget), não objetos Event: sem estado
+    # do ORM por linha nem passagem pelo mapa de identidade
+
+    def get_row(self, event_id: int):
+        """Linha (id, name, date, budget) do evento, ou None"""
+        if event_id is None:
+            return None
+        return self.session.execute(select(*EVENT_COLUMNS).where(Event.id == event_id)).first()
+
+    def list_page(self, limit: int | None = None, after_id: int | None = None) -> list:
+        return self.session.execute(keyset(select(*EVENT_COLUMNS), Event.id, limit, after_id)).all()
+
+    def list_between(self, start=None, end=None, limit: int | None = None, after_id: int | None = None,
+                     after_date=None) -> list:
+        """Eventos com data entre start e end (inclusive), em ordem de data e id.
+
+        Percorre o índice (date, id) só no intervalo pedido. O cursor é o par (date, id)
+        do último evento da página anterior, então a página seguinte não depende dele
+        continuar existindo nem de a sua data não mudar. Sem after_date, a data é
+        buscada pela chave primária na própria consulta; se esse evento já foi
+        excluído, a listagem recomeça do início do intervalo em vez de terminar vazia.
+        """
+        return self.session.execute(self.between_statement(start, end, limit, after_id, after_date)).all()
+
+    @staticmethod
+    def between_statement(start=None, end=None, limit=None, after_id=None, after_date=None):
+        """SELECT de list_between(), compartilhado com o repositório assíncrono"""
+        stmt = select(*EVENT_COLUMNS)
+        if start is not None:
+            stmt = stmt.where(Event._date >= start)
+        if end is not None:
+            stmt = stmt.where(Event._date <= end)
+        if after_id is not None:
+            if after_date is None:
+                after_date = func.coalesce(
+                    select(Event._date).where(Event.id == after_id).scalar_subquery(), date.min)
+            stmt = stmt.where(tuple_(Event._date, Event.id) > tuple_(after_date, after_id))
+        stmt = stmt.order_by(Event._date, Event.id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    def remove(self, event: Event) -> None:
+        self.session.delete(event)
+        self.session.flush()
+
+    def delete_by_id(self, event_id: int) -> bool:
+        """Exclui o evento em um único DELETE; os filhos saem pelo ON DELETE CASCADE do banco"""
+        return bool(self.delete_many([event_id]))
+
+    def delete_children_chunk(self, event_id: int, limit: int) -> int:
+        """Apaga até limit filhos do evento (da primeira tabela que ainda tiver algum).
+
+        Usada pela exclusão em segundo plano: cada chamada é um comando curto, em
+        ordem de id pelo índice (event_id, id), e devolve quantas linhas apagou.
+        """
+        for table in CHILD_TABLES.values():
+            chunk = select(table.c.id).where(table.c.event_id == event_id).order_by(table.c.id).limit(limit)
+            deleted = self.session.execute(delete(table).where(table.c.id.in_(chunk))).rowcount
+            if deleted:
+                return deleted
+        return 0
@@ -0,0 +1,85 @@
+# repositories/event_summary_repository.py
+from sqlalchemy import func, select, text, true
+from sqlalchemy.dialects import postgresql, sqlite
+from src.models.event import Event
+from src.models.event_summary import COUNTED_TABLES, EventSummary
+from .base_repository import ReadRepository
+from .event_repository import CHILD_TABLES, EventRepository
+
+VERIFY_BATCH_SIZE = 1000
+
+class EventSummaryRepository(ReadRepository):
+    """Acesso à tabela event_summary. Os valores são mantidos pelos triggers do banco;
+    a aplicação só lê, confere (verify) ou recalcula tudo (rebuild)."""
+    model = EventSummary
+
+    def __init__(self, event_repository=None):
+        self.event_repo = event_repository or EventRepository()
+
+    def get_by_id(self, event_id: int) -> EventSummary | None:
+        return self.session.get(EventSummary, event_id)
+
+    def list_all(self) -> list[EventSummary]:
+        return self.session.query(EventSummary).all()
+
+    def verify(self, batch_size=VERIFY_BATCH_SIZE):
+        """Compara os contadores com a contagem real, em lotes de eventos.
+
+        Retorna [{"event_id", "column", "stored", "actual"}] com as divergências
+        (evento sem linha em event_summary conta como stored=None).
+        """
+        events = Event.__table__
+        summary = EventSummary.__table__
+        mismatches = []
+        after_id = 0
+        while True:
+            rows = self.session.execute(
+                select(events.c.id, *(summary.c[name] for name in COUNTED_TABLES))
+                .select_from(events.outerjoin(summary, summary.c.event_id == events.c.id))
+                .where(events.c.id > after_id)
+                .order_by(events.c.id)
+                .limit(batch_size)
+            ).mappings().all()
+            if not rows:
+                return mismatches
+            actual = self.event_repo.count_children([row["id"] for row in rows])
+            for row in rows:
+                for name in COUNTED_TABLES:
+                    if row[name] != actual[row["id"]][name]:
+                        mismatches.append({
+                            "event_id": row["id"], "column": name,
+                            "stored": row[name], "actual": actual[row["id"]][name],
+                        })
+            after_id = rows[-1]["id"]
+
+    def rebuild(self):
+        """Recalcula todos os contadores num único comando; retorna quantos eventos foram gravados.
+
+        No PostgreSQL bloqueia as escritas em eventos e tabelas filhas até o fim da
+        transação, para nenhum trigger concorrente ser sobrescrito pelo recálculo.
+        """
+        dialect = self.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            tables = ", ".join(table.name for table in (Event.__table__, *CHILD_TABLES.values()))
+            self.session.execute(text(f"LOCK TABLE {tables} IN SHARE MODE"))
+        insert = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}.get(dialect)
+        if insert is None:
+            raise RuntimeError(f"Reconstrução de event_summary não suportada em {dialect}")
+
+        events = Event.__table__
+        counts = select(
+            events.c.id,
+            *(
+                select(func.count()).where(CHILD_TABLES[name].c.event_id == events.c.id)
+                .scalar_subquery().label(name)
+                for name in COUNTED_TABLES
+            ),
+        ).where(true())  # o SQLite exige um WHERE em INSERT ... SELECT ... ON CONFLICT
+        statement = insert(EventSummary.__table__).from_select(["event_id", *COUNTED_TABLES], counts)
+        statement = statement.on_conflict_do_update(
+            index_elements=["event_id"],
+            set_={name: statement.excluded[name] for name in COUNTED_TABLES},
+        )
+        result = self.session.execute(statement)
+        self.session.expire_all()
+        return result.rowcount
@@ -1,37 +1,26 @@
 # repositories/feedback_repository.py
-from src.database.db import SessionLocal
 from src.models.feedback import Feedback
 from .base_repository import BaseRepository
+from .pagination import keyset
 
 class FeedbackRepository(BaseRepository):
+    model = Feedback
+
     def add(self, feedback: Feedback) -> Feedback:
-        session = SessionLocal()
-        try:
-            session.add(feedback)
-            session.commit()
-            session.refresh(feedback)
-            return feedback
-        finally:
-            session.close()
+        self.session.add(feedback)
+        self.session.flush()
+        return feedback
 
     def get_by_id(self, feedback_id: int) -> Feedback | None:
-        session = SessionLocal()
-        try:
-            return session.query(Feedback).filter(Feedback.id == feedback_id).first()
-        finally:
-            session.close()
+        return self.session.get(Feedback, feedback_id)
 
     def list_all(self) -> list[Feedback]:
-        session = SessionLocal()
-        try:
-            return session.query(Feedback).all()
-        finally:
-            session.close()
+        return self.session.query(Feedback).all()
+
+    def list_by_event(self, event_id: int, limit: int | None = None, after_id: int | None = None) -> list[Feedback]:
+        query = self.session.query(Feedback).filter(Feedback.event_id == event_id)
+        return keyset(query, Feedback.id, limit, after_id).all()
 
     def remove(self, feedback: Feedback) -> None:
-        session = SessionLocal()
-        try:
-            session.delete(feedback)
-            session.commit()
-        finally:
-            session.close()
\ No newline at end of file
+        self.session.delete(feedback)
+        self.session.flush()
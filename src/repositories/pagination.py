@@ -0,0 +1,46 @@
+# repositories/pagination.py
+"""Paginação por chave (keyset/seek): cada página continua a partir do último id
+visto (``WHERE id > :after_id ORDER BY id LIMIT :limit``), usando o índice da
+chave primária em vez de OFFSET, então o custo não cresce com o número da página."""
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def clamp_limit(limit, default=DEFAULT_PAGE_SIZE):
+    """Normaliza o tamanho da página entre 1 e MAX_PAGE_SIZE"""
+    if limit is None:
+        return default
+    return max(1, min(int(limit), MAX_PAGE_SIZE))
+
+
+def keyset(query, id_column, limit=None, after_id=None):
+    """Aplica o cursor (after_id) e o limite a uma consulta ordenada pelo id"""
+    if after_id is not None:
+        query = query.filter(id_column > after_id)
+    query = query.order_by(id_column)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def next_cursor(items, limit):
+    """Cursor da próxima página: o id do último item, se a página veio cheia"""
+    if limit is None or not items or len(items) < limit:
+        return None
+    last = items[-1]
+    return last["id"] if isinstance(last, dict) else last.id
+
+
+def cursor_headers(items, limit, by_date=False):
+    """Cabeçalhos com o cursor da próxima página, a convenção de todas as listagens da API.
+
+    Ausentes na última página. Por data (eventos de um intervalo), o cursor é o par (date, id).
+    """
+    cursor = next_cursor(items, limit)
+    if cursor is None:
+        return {}
+    headers = {"X-Next-After-Id": str(cursor)}
+    if by_date:
+        headers["X-Next-After-Date"] = items[-1]["date"]
+    return headers
@@ -1,48 +1,55 @@
 # repositories/participant_repository.py
-from src.database.db import SessionLocal
+import csv
+import io
+from sqlalchemy import insert
 from src.models.participant import Participant
 from .base_repository import BaseRepository
+from .pagination import keyset
 
 class ParticipantRepository(BaseRepository):
+    model = Participant
+
     def add(self, participant: Participant) -> Participant:
-        session = SessionLocal()
-        try:
-            session.add(participant)
-            session.commit()
-            session.refresh(participant)
-            return participant
-        #review excepiton rollback
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+        self.session.add(participant)
+        self.session.flush()
+        return participant
 
     def get_by_id(self, participant_id: int) -> Participant | None:
-        session = SessionLocal()
-        try:
-            return session.query(Participant).filter(Participant.id == participant_id).first()
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+        return self.session.get(Participant, participant_id)
 
     def list_all(self) -> list[Participant]:
-        session = SessionLocal()
-        try:
-            return session.query(Participant).all()
-        except Exception as e:
-            session.rollback()
-        finally:
-            session.close()
+        return self.session.query(Participant).all()
+
+    def list_by_event(self, event_id: int, limit: int | None = None, after_id: int | None = None) -> list[Participant]:
+        query = self.session.query(Participant).filter(Participant.event_id == event_id)
+        return keyset(query, Participant.id, limit, after_id).all()
 
     def remove(self, participant: Participant) -> None:
-        session = SessionLocal()
-        try:
-            session.delete(participant)
-            session.commit()
-        except Exception as e:
-            session.rollback()
-        finally:
-            session.close()
+        self.session.delete(participant)
+        self.session.flush()
+
+    def bulk_insert(self, rows: list[dict]) -> int:
+        """Insere linhas já validadas ({"name", "event_id"}) sem instanciar o modelo.
+
+        No PostgreSQL com psycopg2 usa COPY, que carrega o lote inteiro em um único
+        comando; nos demais bancos cai para um INSERT executemany.
+        """
+        if not rows:
+            return 0
+        connection = self.session.connection()
+        if connection.dialect.name == "postgresql" and connection.dialect.driver == "psycopg2":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for row in rows:
+                writer.writerow((row["name"], row["event_id"]))
+            buffer.seek(0)
+            cursor = connection.connection.driver_connection.cursor()
+            try:
+                cursor.copy_expert(
+                    "COPY participants (name, event_id) FROM STDIN WITH (FORMAT csv)", buffer
+                )
+            finally:
+                cursor.close()
+        else:
+            connection.execute(insert(Participant.__table__), rows)
+        return len(rows)
@@ -0,0 +1,116 @@
+# repositories/search_repository.py
+from sqlalchemy import cast, func, literal, literal_column, null, or_, select, union_all
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from src.database.unit_of_work import get_session
+from src.models.event import Event
+from src.models.feedback import Feedback
+from src.models.speaker import Speaker
+from src.models.vendor import Vendor
+
+# Mesma configuração usada nas colunas geradas (migração 0005)
+SEARCH_CONFIG = "portuguese"
+# Quantas linhas de cada tabela, no máximo, entram na ordenação por relevância. Termos
+# muito comuns casam com milhões de feedbacks; ranquear todos custaria mais que a busca.
+# É uma aproximação: os candidatos são as correspondências mais recentes (maior id), então
+# para esses termos o ranking vale só entre elas; termos raros são ranqueados por inteiro
+CANDIDATES_PER_SOURCE = 2000
+
+# tipo -> (tabela, coluna do id do evento, título, texto do trecho)
+SOURCES = {
+    "event": (Event.__table__, "id", "name", "name"),
+    "speaker": (Speaker.__table__, "event_id", "name", "description"),
+    "vendor": (Vendor.__table__, "event_id", "name", "services"),
+    "feedback": (Feedback.__table__, "event_id", None, "content"),
+}
+
+
+class SearchRepository:
+    """Busca textual nas tabelas de eventos, palestrantes, fornecedores e feedbacks.
+
+    No PostgreSQL usa as colunas tsvector (índices GIN) e ordena por ts_rank_cd;
+    nos demais bancos faz um LIKE sem ordenação por relevância.
+    """
+
+    @property
+    def session(self):
+        return get_session()
+
+    def search(self, text, kinds=None, event_id=None, limit=20, offset=0):
+        kinds = [kind for kind in (kinds or SOURCES) if kind in SOURCES]
+        if not kinds:
+            return []
+        if self.session.get_bind().dialect.name == "postgresql":
+            return self._search_fulltext(text, kinds, event_id, limit, offset)
+        return self._search_like(text, kinds, event_id, limit, offset)
+
+    def _search_fulltext(self, text, kinds, event_id, limit, offset):
+        config = cast(literal(SEARCH_CONFIG), REGCONFIG)
+        query = func.websearch_to_tsquery(config, text)
+        branches = []
+        for kind in kinds:
+            table, event_column, title_column, body_column = SOURCES[kind]
+            vector = literal_column(f"{table.name}.search_vector")
+            # Primeiro só o índice GIN (limitado), depois o ranking sobre esses candidatos
+            candidates = select(
+                table.c.id,
+                table.c[event_column].label("event_id"),
+                (table.c[title_column] if title_column else null()).label("title"),
+                table.c[body_column].label("body"),
+                vector.label("search_vector"),
+            ).where(vector.bool_op("@@")(query))
+            if event_id is not None:
+                candidates = candidates.where(table.c[event_column] == event_id)
+            candidates = candidates.order_by(table.c.id.desc()).limit(CANDIDATES_PER_SOURCE)\
+                .subquery(f"{kind}_candidates")
+            branches.append(select(
+                literal(kind).label("kind"),
+                candidates.c.id,
+                candidates.c.event_id,
+                candidates.c.title,
+                candidates.c.body,
+                func.ts_rank_cd(candidates.c.search_vector, query).label("rank"),
+            ))
+        ranked = union_all(*branches).subquery("ranked")
+        page = (
+            select(ranked)
+            .order_by(ranked.c.rank.desc(), ranked.c.kind, ranked.c.id)
+            .limit(limit).offset(offset)
+            .subquery("page")
+        )
+        # ts_headline é caro: calculado só para as linhas da página. Marcadores em texto
+        # puro («termo»), para o trecho poder ser exibido escapado nos templates
+        headline = func.ts_headline(
+            config, func.coalesce(page.c.body, ""), query,
+            "MaxFragments=1, MaxWords=25, MinWords=10, StartSel=«, StopSel=»",
+        )
+        rows = self.session.execute(
+            select(page.c.kind, page.c.id, page.c.event_id, page.c.title,
+                   headline.label("snippet"), page.c.rank)
+            .order_by(page.c.rank.desc(), page.c.kind, page.c.id)
+        ).mappings().all()
+        return [dict(row) for row in rows]
+
+    def _search_like(self, text, kinds, event_id, limit, offset):
+        # %, _ e a própria barra no texto buscado são literais, não curingas
+        escaped = text.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        pattern = f"%{escaped}%"
+        branches = []
+        for kind in kinds:
+            table, event_column, title_column, body_column = SOURCES[kind]
+            columns = {title_column, body_column} - {None}
+            branch = select(
+                literal(kind).label("kind"),
+                table.c.id,
+                table.c[event_column].label("event_id"),
+                (table.c[title_column] if title_column else null()).label("title"),
+                table.c[body_column].label("snippet"),
+                literal(0.0).label("rank"),
+            ).where(or_(*(func.lower(table.c[name]).like(pattern, escape="\\") for name in columns)))
+            if event_id is not None:
+                branch = branch.where(table.c[event_column] == event_id)
+            branches.append(branch)
+        ranked = union_all(*branches).subquery("ranked")
+        rows = self.session.execute(
+            select(ranked).order_by(ranked.c.kind, ranked.c.id).limit(limit).offset(offset)
+        ).mappings().all()
+        return [dict(row) for row in rows]
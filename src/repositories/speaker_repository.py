@@ -1,46 +1,26 @@
 # repositories/speaker_repository.py
-from src.database.db import SessionLocal
 from src.models.speaker import Speaker
 from .base_repository import BaseRepository
+from .pagination import keyset
 
 class SpeakerRepository(BaseRepository):
+    model = Speaker
+
     def add(self, speaker: Speaker) -> Speaker:
-        session = SessionLocal()
-        try:
-            session.add(speaker)
-            session.commit()
-            session.refresh(speaker)
-            return speaker
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+        self.session.add(speaker)
+        self.session.flush()
+        return speaker
 
     def get_by_id(self, speaker_id: int) -> Speaker | None:
-        session = SessionLocal()
-        try:
-            return session.query(Speaker).filter(Speaker.id == speaker_id).first()
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+        return self.session.get(Speaker, speaker_id)
 
     def list_all(self) -> list[Speaker]:
-        session = SessionLocal()
-        try:
-            return session.query(Speaker).all()
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+        return self.session.query(Speaker).all()
+
+    def list_by_event(self, event_id: int, limit: int | None = None, after_id: int | None = None) -> list[Speaker]:
+        query = self.session.query(Speaker).filter(Speaker.event_id == event_id)
+        return keyset(query, Speaker.id, limit, after_id).all()
 
     def remove(self, speaker: Speaker) -> None:
-        session = SessionLocal()
-        try:
-            session.delete(speaker)
-            session.commit()
-        finally:
-            session.close()
\ No newline at end of file
+        self.session.delete(speaker)
+        self.session.flush()
@@ -1,37 +1,26 @@
 # repositories/vendor_repository.py
-from src.database.db import SessionLocal
 from src.models.vendor import Vendor
 from .base_repository import BaseRepository
+from .pagination import keyset
 
 class VendorRepository(BaseRepository):
+    model = Vendor
+
     def add(self, supplier: Vendor) -> Vendor:
-        session = SessionLocal()
-        try:
-            session.add(supplier)
-            session.commit()
-            session.refresh(supplier)
-            return supplier
-        finally:
-            session.close()
+        self.session.add(supplier)
+        self.session.flush()
+        return supplier
 
     def get_by_id(self, supplier_id: int) -> Vendor | None:
-        session = SessionLocal()
-        try:
-            return session.query(Vendor).filter(Vendor.id == supplier_id).first()
-        finally:
-            session.close()
+        return self.session.get(Vendor, supplier_id)
 
     def list_all(self) -> list[Vendor]:
-        session = SessionLocal()
-        try:
-            return session.query(Vendor).all()
-        finally:
-            session.close()
+        return self.session.query(Vendor).all()
+
+    def list_by_event(self, event_id: int, limit: int | None = None, after_id: int | None = None) -> list[Vendor]:
+        query = self.session.query(Vendor).filter(Vendor.event_id == event_id)
+        return keyset(query, Vendor.id, limit, after_id).all()
 
     def remove(self, supplier: Vendor) -> None:
-        session = SessionLocal()
-        try:
-            session.delete(supplier)
-            session.commit()
-        finally:
-            session.close()
\ No newline at end of file
+        self.session.delete(supplier)
+        self.session.flush()
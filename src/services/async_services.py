@@ -0,0 +1,135 @@
+# services/async_services.py
+"""Serviços assíncronos usados pelo app ASGI experimental (asgi_experimental.py): os mesmos métodos e retornos
+dos serviços síncronos, sobre os repositórios de src/repositories/async_repositories.py.
+
+Só as operações servidas pelo ASGI têm versão assíncrona (leituras de eventos e
+cadastro/listagem dos filhos). Escritas em eventos e orçamento continuam nos serviços
+síncronos, que publicam notificações pelo outbox e invalidam o cache.
+"""
+from src.cache.cache_manager import cache_manager
+from src.database.async_unit_of_work import async_transactional
+from src.factory.entity_factory import EntityFactory
+from src.models.event import Event
+from src.repositories.async_repositories import (
+    AsyncEventRepository, AsyncFeedbackRepository, AsyncParticipantRepository,
+    AsyncSpeakerRepository, AsyncVendorRepository,
+)
+from src.services.event_service import CACHE_NAMESPACE, EventService
+from src.services.feedback_service import FeedbackService
+from src.services.participant_service import ParticipantService
+from src.services.speaker_service import SpeakerService
+from src.services.vendor_service import VendorService
+
+
+class AsyncEventService:
+    def __init__(self, event_repository=None):
+        self.repo = event_repository or AsyncEventRepository()
+
+    @async_transactional
+    async def list_events(self, limit=None, after_id=None, start=None, end=None, after_date=None):
+        """Ver EventService.list_events; mesmas chaves de cache, então as duas pilhas compartilham as entradas"""
+        if start is None and end is None:
+            async def load():
+                return [EventService._summary(row) for row in await self.repo.list_page(limit, after_id)]
+            return await cache_manager.get_or_load_async(CACHE_NAMESPACE, f"list:{limit}:{after_id}", load)
+        start = Event.validate_date(start) if start is not None else None
+        end = Event.validate_date(end) if end is not None else None
+        after_date = Event.validate_date(after_date) if after_date is not None else None
+
+        async def load_range():
+            rows = await self.repo.list_between(start, end, limit, after_id, after_date)
+            return [EventService._summary(row) for row in rows]
+        return await cache_manager.get_or_load_async(
+            CACHE_NAMESPACE, f"range:{start}:{end}:{limit}:{after_date}:{after_id}", load_range)
+
+    @async_transactional
+    async def get_event(self, event_id):
+        async def load():
+            row = await self.repo.get_row(event_id)
+            return None if row is None else EventService._summary(row)
+        return await cache_manager.get_or_load_async(CACHE_NAMESPACE, f"event:{event_id}", load)
+
+    @async_transactional
+    async def get_stats(self, event_ids):
+        return await self.repo.stats({int(event_id) for event_id in event_ids})
+
+
+class AsyncEventChildService:
+    """Cadastro e listagem por evento; as subclasses definem repo_class e listing"""
+    repo_class = None
+    # Função (linha, nome do evento) -> dict da listagem, a mesma do serviço síncrono
+    listing = None
+
+    def __init__(self, repository=None, event_repository=None):
+        self.repo = repository or self.repo_class()
+        self.event_repo = event_repository or AsyncEventRepository()
+
+    async def _add(self, entity):
+        saved = await self.repo.add(entity)
+        return saved.to_dict()
+
+    @async_transactional
+    async def _list(self, event_id, limit=None, after_id=None):
+        event_name = (await self.event_repo.names_by_id([event_id])).get(event_id)
+        if event_name is None:
+            return None
+        listing = type(self).listing
+        return [listing(row, event_name) for row in await self.repo.list_rows_by_event(event_id, limit, after_id)]
+
+
+class AsyncParticipantService(AsyncEventChildService):
+    repo_class = AsyncParticipantRepository
+    listing = staticmethod(ParticipantService._listing)
+
+    @async_transactional
+    async def create(self, event_id, name):
+        if event_id is None:
+            raise ValueError("ID de evento inválido")
+        if not await self.event_repo.exists(event_id):
+            raise ValueError("Evento não encontrado")
+        return await self._add(EntityFactory.create_participant(name, event_id))
+
+    async def get_attendees(self, event_id, limit=None, after_id=None):
+        return await self._list(event_id, limit, after_id)
+
+
+class AsyncSpeakerService(AsyncEventChildService):
+    repo_class = AsyncSpeakerRepository
+    listing = staticmethod(SpeakerService._listing)
+
+    @async_transactional
+    async def create(self, name, description, event_id):
+        if not await self.event_repo.exists(event_id):
+            return None
+        return await self._add(EntityFactory.create_speaker(name, description, event_id))
+
+    async def list_speakers(self, event_id, limit=None, after_id=None):
+        return await self._list(event_id, limit, after_id)
+
+
+class AsyncVendorService(AsyncEventChildService):
+    repo_class = AsyncVendorRepository
+    listing = staticmethod(VendorService._listing)
+
+    @async_transactional
+    async def create(self, name, services_offered, event_id):
+        if not await self.event_repo.exists(event_id):
+            return None
+        return await self._add(EntityFactory.create_vendor(name, services_offered, event_id))
+
+    async def list_vendors(self, event_id, limit=None, after_id=None):
+        return await self._list(event_id, limit, after_id)
+
+
+class AsyncFeedbackService(AsyncEventChildService):
+    repo_class = AsyncFeedbackRepository
+    listing = staticmethod(FeedbackService._listing)
+
+    @async_transactional
+    async def create(self, content, event_id):
+        if not await self.event_repo.exists(event_id):
+            return None
+        return await self._add(EntityFactory.create_feedback(content, event_id))
+
+    async def get_feedback(self, event_id, limit=None, after_id=None):
+        return await self._list(event_id, limit, after_id)
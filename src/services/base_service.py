@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from src.database.unit_of_work import transactional
 
 class BaseService(ABC):
     @abstractmethod
@@ -14,4 +15,69 @@ class BaseService(ABC):
     @abstractmethod 
     def delete(self, obj_id):
         """Exclui um objeto identificado por obj_id"""
-        pass
\ No newline at end of file
+        pass
+
+    # Operações em lote: validam tudo antes e gravam em uma única transação,
+    # com SQL por conjunto (ver BaseRepository.insert_many/update_many/delete_many)
+
+    @abstractmethod
+    def _to_row(self, item, partial=False):
+        """Valida um item do lote e o converte em colunas; partial=True só exige os campos enviados"""
+        pass
+
+    def _check_references(self, rows):
+        """Confere referências a outras tabelas antes de gravar o lote"""
+        pass
+
+    def _rows(self, items, partial=False):
+        if not isinstance(items, list):
+            raise ValueError("Esperada uma lista de itens")
+        rows = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                raise ValueError(f"Item {index}: esperado um objeto")
+            try:
+                row = self._to_row(item, partial)
+                if partial:
+                    if "id" not in item:
+                        raise ValueError("campo 'id' ausente")
+                    row["id"] = int(item["id"])
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Item {index}: {e}")
+            rows.append(row)
+        return rows
+
+    @transactional
+    def bulk_create(self, items):
+        """Cria todos os itens ou nenhum; devolve as linhas criadas"""
+        rows = self._rows(items)
+        self._check_references(rows)
+        return self.repo.insert_many(rows)
+
+    @transactional
+    def bulk_update(self, items):
+        """Atualiza os itens (cada um com "id"); devolve os ids encontrados e atualizados"""
+        rows = self._rows(items, partial=True)
+        self._check_references(rows)
+        return self.repo.update_many(rows)
+
+    @transactional
+    def bulk_delete(self, ids):
+        """Remove os ids informados; devolve os que existiam"""
+        if not isinstance(ids, list):
+            raise ValueError("Esperada uma lista de ids")
+        try:
+            ids = [int(i) for i in ids]
+        except (TypeError, ValueError):
+            raise ValueError("Todos os ids devem ser números inteiros")
+        return self.repo.delete_many(ids)
+
+
+class EventChildService(BaseService):
+    """Base dos serviços de entidades que pertencem a um evento"""
+
+    def _check_references(self, rows):
+        event_ids = {row["event_id"] for row in rows if "event_id" in row}
+        missing = event_ids - self.event_repo.existing_ids(event_ids)
+        if missing:
+            raise ValueError(f"Eventos não encontrados: {sorted(missing)}")
@@ -0,0 +1,109 @@
+# services/event_purger.py
+import logging
+import os
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Retorno de EventService.delete quando a exclusão foi agendada em vez de feita na hora
+PURGE_SCHEDULED = "scheduled"
+
+
+class EventPurger:
+    """Exclusão de eventos grandes em segundo plano, em lotes.
+
+    A requisição só agenda a exclusão (após o commit) e retorna. Uma thread apaga os
+    filhos do evento em lotes de chunk_size linhas, cada lote na sua própria transação
+    curta, e por fim exclui o evento em um único DELETE. Enquanto isso o evento continua
+    visível, com os contadores diminuindo. A exclusão é idempotente: se o processo cair
+    no meio, basta pedi-la de novo.
+    """
+
+    def __init__(self, chunk_size=5000, pause=0.0, threshold=0):
+        self.chunk_size = chunk_size
+        # Total de filhos a partir do qual EventService.delete usa este modo sem ser pedido (0: nunca)
+        self.threshold = threshold
+        # Intervalo entre lotes, para dar vez às demais escritas (segundos)
+        self.pause = pause
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._thread = None
+        self._pid = None
+        self.reset_stats()
+
+    def reset_stats(self):
+        self._stats = {"purged_events": 0, "purged_rows": 0, "failed": 0}
+
+    def submit(self, event_id):
+        """Agenda a exclusão do evento; pedidos repetidos para o mesmo evento são ignorados"""
+        with self._lock:
+            if event_id in self._pending:
+                return
+            self._pending.add(event_id)
+        self._ensure_started()
+        self._queue.put(event_id)
+
+    def purge(self, event_id):
+        """Apaga o evento em lotes, na thread atual; devolve False se ele já não existia"""
+        from src.services.event_service import EventService
+
+        service = EventService()
+        while True:
+            deleted = service.purge_chunk(event_id, self.chunk_size)
+            if not deleted:
+                break
+            with self._lock:
+                self._stats["purged_rows"] += deleted
+            if self.pause:
+                time.sleep(self.pause)
+        return service.delete(event_id, background=False)
+
+    def pending(self):
+        with self._lock:
+            return sorted(self._pending)
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, pending=len(self._pending))
+
+    def _ensure_started(self):
+        # Após um fork (gunicorn com preload) a thread do processo pai não existe no filho
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._thread = threading.Thread(target=self._run, name="event-purger", daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _run(self):
+        while True:
+            event_id = self._queue.get()
+            try:
+                if self.purge(event_id):
+                    with self._lock:
+                        self._stats["purged_events"] += 1
+            except Exception:
+                logger.exception("Falha ao excluir o evento %s em segundo plano", event_id)
+                with self._lock:
+                    self._stats["failed"] += 1
+            finally:
+                with self._lock:
+                    self._pending.discard(event_id)
+
+
+def build_event_purger(environ=None):
+    """Cria o executor conforme EVENT_PURGE_CHUNK_SIZE, EVENT_PURGE_PAUSE e EVENT_PURGE_THRESHOLD"""
+    environ = os.environ if environ is None else environ
+    return EventPurger(
+        chunk_size=int(environ.get("EVENT_PURGE_CHUNK_SIZE", 5000)),
+        pause=float(environ.get("EVENT_PURGE_PAUSE", 0)),
+        threshold=int(environ.get("EVENT_PURGE_THRESHOLD", 0)),
+    )
+
+
+event_purger = build_event_purger()
@@ -1,20 +1,38 @@
 # services/event_service.py
+import calendar
+from datetime import date
+
 from src.services.base_service import BaseService
-from src.repositories.event_repository import EventRepository
+from src.database.unit_of_work import on_commit, transactional
+from src.repositories.event_repository import CHILD_TABLES, EventRepository
+from src.repositories.budget_repository import BudgetRepository
 from src.factory.entity_factory import EntityFactory
-from src.notifications.notification_manager import notification_manager # Observer
+from src.services.event_purger import PURGE_SCHEDULED, event_purger
+from src.models.event import Event
+from src.notifications.outbox import publish # Observer, via outbox transacional
+from src.notifications.listeners import cache_listeners  # noqa: F401 - invalida o cache nas notificações
+from src.cache.cache_manager import cache_manager
+
+# Namespace do cache com as listagens e os eventos individuais
+CACHE_NAMESPACE = "events"
 
 class EventService(BaseService):
-    def __init__(self, event_repository=None):
+    def __init__(self, event_repository=None, budget_repository=None):
         self.repo = event_repository or EventRepository() # Injeção de depedência
+        self.budget_repo = budget_repository or BudgetRepository()
 
+    @transactional
     def create(self, name, date, budget):
         event = EntityFactory.create_event(name, date, budget)
         saved = self.repo.add(event)
-        
-        notification_manager.notify("event_created", event)  # Dispara notificação de evento criado
-        return saved.to_dict()
+        if saved.budget:
+            self.budget_repo.record(saved.id, "set", saved.budget, saved.budget)
+
+        publish("event_created", saved.to_dict(include_relations=False))  # Dispara notificação de evento criado
+        # Evento novo ainda não tem filhos: não há por que consultá-los
+        return {**saved.to_dict(include_relations=False), **{name: [] for name in CHILD_TABLES}}
 
+    @transactional
     def update(self, event_id, **data):
         event = self.repo.get_by_id(event_id)
         if not event:
@@ -23,47 +41,196 @@ class EventService(BaseService):
             event.name = data["name"]
         if "date" in data:
             event.date = data["date"]
-        if "budget" in data:
-            event.budget = int(data["budget"])
         updated = self.repo.add(event)
-        return updated.to_dict()
+        if "budget" in data:
+            # Mesmo UPDATE atômico de edit_budget: o lançamento usa o valor anterior lido sob lock
+            self.budget_repo.set(event.id, Event.validate_budget(float(data["budget"])))
+        publish("event_updated", updated.to_dict(include_relations=False))
+        # As relações da resposta vêm como colunas, sem carregar os objetos filhos
+        return {**updated.to_dict(include_relations=False), **self.repo.children(event_id)}
 
-    def delete(self, event_id):
-        event = self.repo.get_by_id(event_id)
-        if not event:
+    @transactional
+    def delete(self, event_id, background=None):
+        """Exclui o evento e, pelo ON DELETE CASCADE do banco, todos os filhos, sem carregá-los.
+
+        Com background=True a exclusão é agendada para depois do commit e feita em lotes
+        (ver EventPurger); com None, isso acontece quando o evento tem mais filhos que
+        EVENT_PURGE_THRESHOLD. Devolve True se o evento foi excluído, PURGE_SCHEDULED se a
+        exclusão foi agendada e False se o evento não existe.
+        """
+        if background is None:
+            background = event_purger.threshold > 0 and self._child_count(event_id) > event_purger.threshold
+        if background:
+            if not self.repo.exists(event_id):
+                return False
+            on_commit(lambda: event_purger.submit(event_id))
+            return PURGE_SCHEDULED
+        if not self.repo.delete_by_id(event_id):
             return False
-        self.repo.remove(event)
+        publish("event_deleted", {"id": event_id})
         return True
 
-    def list_events(self):
-        events = self.repo.list_all()
-        return [
-            {
-                "id": event.id,
-                "display_name": f"{event.id}: {event.name}",
-                "name": event.name,
-                "date": event.date,
-                "budget": event.budget
-            }
-            for event in events
-        ]
+    @transactional
+    def purge_chunk(self, event_id, chunk_size):
+        """Apaga um lote de filhos do evento na sua própria transação; devolve quantos"""
+        return self.repo.delete_children_chunk(event_id, chunk_size)
+
+    def _child_count(self, event_id):
+        stats = self.repo.stats([event_id]).get(event_id, {})
+        return sum(stats.get(name) or 0 for name in CHILD_TABLES)
 
+    @staticmethod
+    def _summary(event):
+        return {
+            "id": event.id,
+            "display_name": f"{event.id}: {event.name}",
+            "name": event.name,
+            "date": event.date.isoformat(),
+            "budget": event.budget
+        }
+
+    @transactional
+    def list_events(self, limit=None, after_id=None, start=None, end=None, after_date=None):
+        """Lista eventos em ordem de id; com limit/after_id retorna só uma página.
+
+        Com start/end (datas, inclusive) retorna só os eventos do intervalo, em ordem
+        de data; o cursor é então o par (after_date, after_id) do último evento da página.
+        Usada nos dropdowns de quase todas as páginas, por isso passa pelo cache.
+        """
+        if start is None and end is None:
+            return cache_manager.get_or_load(
+                CACHE_NAMESPACE, f"list:{limit}:{after_id}",
+                lambda: [self._summary(row) for row in self.repo.list_page(limit, after_id)]
+            )
+        start = Event.validate_date(start) if start is not None else None
+        end = Event.validate_date(end) if end is not None else None
+        after_date = Event.validate_date(after_date) if after_date is not None else None
+        return cache_manager.get_or_load(
+            CACHE_NAMESPACE, f"range:{start}:{end}:{limit}:{after_date}:{after_id}",
+            lambda: [self._summary(row) for row in self.repo.list_between(start, end, limit, after_id, after_date)]
+        )
+
+    def get_calendar(self, year, month):
+        """Eventos de um mês agrupados por dia: {"2025-06-01": [eventos], ...}"""
+        if not 1 <= month <= 12:
+            raise ValueError(f"Mês inválido: {month}")
+        first = date(year, month, 1)
+        last = date(year, month, calendar.monthrange(year, month)[1])
+        days = {}
+        for event in self.list_events(start=first, end=last):
+            days.setdefault(event["date"], []).append(event)
+        return {"year": year, "month": month, "start": first.isoformat(), "end": last.isoformat(), "days": days}
+
+    @transactional
+    def get_event(self, event_id):
+        """Dados básicos de um evento (sem relações), via cache"""
+        def load():
+            row = self.repo.get_row(event_id)
+            return None if row is None else self._summary(row)
+        return cache_manager.get_or_load(CACHE_NAMESPACE, f"event:{event_id}", load)
+
+    @transactional
+    def get_stats(self, event_ids):
+        """{id: {"participants", "speakers", "vendors", "feedbacks", "budget", ...}} dos eventos existentes"""
+        return self.repo.stats({int(event_id) for event_id in event_ids})
+
+    @transactional
+    def get_dashboard(self, limit=None, after_id=None):
+        """Página de eventos com as estatísticas de cada um, mais os totais da página"""
+        events = self.list_events(limit, after_id)
+        stats = self.get_stats([event["id"] for event in events])
+        rows = [{**event, **stats.get(event["id"], {})} for event in events]
+        totals = {
+            name: sum(row.get(name) or 0 for row in rows)
+            for name in ("participants", "speakers", "vendors", "feedbacks", "budget")
+        }
+        return {"events": rows, "totals": totals}
+
+    @transactional
     def update_budget(self, event_id, amount):
-        event = self.repo.get_by_id(event_id)
-        if not event:
-            return None
-        event.budget += amount
-        updated = self.repo.add(event)
-        return updated.to_dict()
+        """Soma amount ao orçamento num único UPDATE atômico e registra o lançamento no livro-razão"""
+        event = self.budget_repo.adjust(event_id, amount)
+        if event is None:
+            # Só no caminho de erro: distingue evento inexistente de saldo insuficiente
+            if not self.repo.exists(event_id):
+                return None
+            raise ValueError("O orçamento não pode ser negativo!")
+        publish("event_updated", event)
+        return event
 
+    @transactional
     def get_budget(self, event_id):
         event = self.repo.get_by_id(event_id)
         return None if not event else event.budget
 
+    @transactional
     def edit_budget(self, event_id, new_budget):
-        event = self.repo.get_by_id(event_id)
-        if not event:
+        event = self.budget_repo.set(event_id, Event.validate_budget(new_budget))
+        if event is None:
             return None
-        event.budget = new_budget
-        updated = self.repo.add(event)
-        return updated.to_dict()
+        publish("event_updated", event)
+        return event
+
+    @transactional
+    def get_budget_history(self, event_id, limit=None, after_id=None):
+        """Lançamentos do livro-razão de um evento, do mais antigo ao mais recente"""
+        if not self.repo.exists(event_id):
+            return None
+        return [entry.to_dict() for entry in self.budget_repo.list_by_event(event_id, limit, after_id)]
+
+    @transactional
+    def get_budget_totals(self, event_id):
+        """Orçamento atual e totais de créditos, débitos e saldo do livro-razão"""
+        budget = self.get_budget(event_id)
+        if budget is None:
+            return None
+        return {"budget": budget, **self.budget_repo.totals(event_id)}
+
+    # As operações em lote não passam pelo ORM; avisam uma vez por lote para invalidar o cache.
+    # transactional aqui também, para a mensagem do outbox entrar na mesma transação do lote
+
+    # O orçamento gravado em lote também entra no livro-razão, com um lançamento "set" por evento
+
+    @transactional
+    def bulk_create(self, items):
+        created = super().bulk_create(items)
+        self.budget_repo.record_many([
+            {"event_id": row["id"], "kind": "set", "amount": row["budget"], "balance": row["budget"]}
+            for row in created if row["budget"]
+        ])
+        publish("events_bulk_changed", {"created": [row["id"] for row in created]})
+        return [dict(row, date=row["date"].isoformat()) for row in created]
+
+    @transactional
+    def bulk_update(self, items):
+        rows = self._rows(items, partial=True)
+        self._check_references(rows)
+        # Lê os valores anteriores com lock, para que ajustes simultâneos não escapem ao livro-razão
+        budgets = self.budget_repo.budgets_for_update(row["id"] for row in rows if "budget" in row)
+        updated = self.repo.update_many(rows)
+        ledger = []
+        for row in rows:
+            # Na ordem do lote: o mesmo id duas vezes gera dois lançamentos encadeados
+            if "budget" in row and row["id"] in budgets and row["budget"] != budgets[row["id"]]:
+                ledger.append({"event_id": row["id"], "kind": "set", "amount": row["budget"] - budgets[row["id"]],
+                               "balance": row["budget"]})
+                budgets[row["id"]] = row["budget"]
+        self.budget_repo.record_many(ledger)
+        publish("events_bulk_changed", {"updated": updated})
+        return updated
+
+    @transactional
+    def bulk_delete(self, ids):
+        deleted = super().bulk_delete(ids)
+        publish("events_bulk_changed", {"deleted": deleted})
+        return deleted
+
+    def _to_row(self, item, partial=False):
+        row = {}
+        if not partial or "name" in item:
+            row["name"] = Event.validate_name(item.get("name"))
+        if not partial or "date" in item:
+            row["date"] = Event.validate_date(item.get("date"))
+        if not partial or "budget" in item:
+            row["budget"] = Event.validate_budget(float(item.get("budget", 0)))
+        return row
@@ -0,0 +1,86 @@
+# services/export_service.py
+import csv
+import io
+import json
+
+from sqlalchemy import select
+
+from src.database.db import engine
+from src.database.unit_of_work import transactional
+from src.models.event import Event
+from src.models.feedback import Feedback
+from src.models.participant import Participant
+from src.models.speaker import Speaker
+from src.models.vendor import Vendor
+from src.repositories.event_repository import EventRepository
+
+FORMATS = {"csv": "text/csv", "jsonl": "application/x-ndjson"}
+
+# entidade -> (tabela, colunas exportadas)
+ENTITIES = {
+    "participants": (Participant.__table__, ("id", "name", "event_id")),
+    "speakers": (Speaker.__table__, ("id", "name", "description", "event_id")),
+    "vendors": (Vendor.__table__, ("id", "name", "services", "event_id")),
+    "feedbacks": (Feedback.__table__, ("id", "content", "event_id")),
+}
+
+class ExportService:
+    """Exportação em fluxo (CSV ou JSON Lines) de participantes, palestrantes, fornecedores e feedbacks.
+
+    As linhas vêm de um cursor do lado do servidor (stream_results/yield_per) em
+    uma conexão própria, fora da unidade de trabalho da requisição: a memória
+    usada não depende do tamanho da tabela e o primeiro byte sai logo após a consulta.
+    """
+
+    YIELD_PER = 2000
+
+    def __init__(self, event_repository=None, bind=None, yield_per=YIELD_PER):
+        self.event_repo = event_repository or EventRepository()
+        self.bind = bind or engine
+        self.yield_per = yield_per
+
+    @transactional
+    def validate(self, entity, fmt, event_id=None):
+        """Confere os parâmetros antes de a resposta começar; retorna False se o evento não existe"""
+        if entity not in ENTITIES:
+            raise ValueError(f"Entidade desconhecida: {entity}. Use {', '.join(ENTITIES)}.")
+        if fmt not in FORMATS:
+            raise ValueError(f"Formato não suportado: {fmt}. Use {', '.join(FORMATS)}.")
+        return event_id is None or self.event_repo.exists(event_id)
+
+    def stream(self, entity, fmt, event_id=None):
+        """Gera o arquivo em pedaços de texto, um por lote de yield_per linhas"""
+        table, columns = ENTITIES[entity]
+        events = Event.__table__
+        query = (
+            select(*(table.c[name] for name in columns), events.c.name.label("event_name"))
+            .join(events, events.c.id == table.c.event_id)
+            .order_by(table.c.id)
+        )
+        if event_id is not None:
+            query = query.where(table.c.event_id == event_id)
+        fields = (*columns, "event_name")
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer) if fmt == "csv" else None
+        if writer:
+            writer.writerow(fields)
+            yield self._drain(buffer)
+
+        with self.bind.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=self.yield_per).execute(query)
+            for partition in result.partitions():
+                for row in partition:
+                    if writer:
+                        writer.writerow(row)
+                    else:
+                        buffer.write(json.dumps(dict(zip(fields, row)), ensure_ascii=False))
+                        buffer.write("\n")
+                yield self._drain(buffer)
+
+    @staticmethod
+    def _drain(buffer):
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
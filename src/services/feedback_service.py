@@ -1,22 +1,25 @@
 # services/feedback_service.py
-from src.services.base_service import BaseService
+from src.services.base_service import EventChildService
+from src.database.unit_of_work import transactional
 from src.repositories.feedback_repository import FeedbackRepository
 from src.repositories.event_repository import EventRepository
 from src.factory.entity_factory import EntityFactory
+from src.models.feedback import Feedback
 
-class FeedbackService(BaseService):
+class FeedbackService(EventChildService):
     def __init__(self, feedback_repository=None, event_repository=None):
         self.repo = feedback_repository or FeedbackRepository()
         self.event_repo = event_repository or EventRepository()
 
+    @transactional
     def create(self, content, event_id):
-        event = self.event_repo.get_by_id(event_id)
-        if not event:
+        if not self.event_repo.exists(event_id):
             return None
         fb = EntityFactory.create_feedback(content, event_id)
         saved = self.repo.add(fb)
         return saved.to_dict()
 
+    @transactional
     def update(self, feedback_id, content):
         fb = self.repo.get_by_id(feedback_id)
         if not fb:
@@ -25,6 +28,7 @@ class FeedbackService(BaseService):
         updated = self.repo.add(fb)
         return updated.to_dict()
 
+    @transactional
     def delete(self, feedback_id):
         fb = self.repo.get_by_id(feedback_id)
         if not fb:
@@ -32,18 +36,27 @@ class FeedbackService(BaseService):
         self.repo.remove(fb)
         return True
 
-    def get_feedback(self, event_id):
-        event = self.event_repo.get_by_id(event_id)
-        if not event:
+    @transactional
+    def get_feedback(self, event_id, limit=None, after_id=None):
+        event_name = self.event_repo.names_by_id([event_id]).get(event_id)
+        if event_name is None:
             return None
-        
-        return [
-            {
-                "id": f.id,
-                "display_name": f"Feedback {f.id}",
-                "content": f.content,
-                "event_id": f.event_id,
-                "event_name": event.name
-            }
-            for f in event.feedbacks
-        ]
\ No newline at end of file
+        return [self._listing(f, event_name) for f in self.repo.list_rows_by_event(event_id, limit, after_id)]
+
+    @staticmethod
+    def _listing(f, event_name):
+        return {
+            "id": f.id,
+            "display_name": f"Feedback {f.id}",
+            "content": f.content,
+            "event_id": f.event_id,
+            "event_name": event_name
+        }
+
+    def _to_row(self, item, partial=False):
+        row = {}
+        if not partial or "content" in item:
+            row["content"] = Feedback.validate_content(item.get("content"))
+        if not partial or "event_id" in item:
+            row["event_id"] = int(item.get("event_id"))
+        return row
@@ -0,0 +1,164 @@
+# services/participant_import_service.py
+import csv
+import io
+import json
+import time
+
+from src.database.unit_of_work import transactional
+from src.models.participant import Participant
+from src.repositories.participant_repository import ParticipantRepository
+from src.repositories.event_repository import EventRepository
+
+FORMATS = ("csv", "jsonl")
+
+
+class ImportReport:
+    """Resultado de uma importação: contagens, vazão e os erros por linha (limitados a max_errors)"""
+
+    def __init__(self, max_errors=1000):
+        self.max_errors = max_errors
+        self.rows_read = 0
+        self.rows_imported = 0
+        self.error_count = 0
+        self.errors = []
+        self.elapsed_seconds = 0.0
+
+    def add_error(self, line, message):
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "error": message})
+
+    @property
+    def rows_per_second(self):
+        return self.rows_imported / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def to_dict(self):
+        return {
+            "rows_read": self.rows_read,
+            "rows_imported": self.rows_imported,
+            "error_count": self.error_count,
+            "errors": self.errors,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+def detect_format(filename, default="csv"):
+    """Deduz o formato pela extensão do arquivo (.csv, .jsonl/.ndjson)"""
+    name = (filename or "").lower()
+    if name.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    if name.endswith(".csv"):
+        return "csv"
+    return default
+
+
+class ParticipantImportService:
+    """Importação em lote de participantes a partir de CSV ou JSON Lines.
+
+    O arquivo é lido como fluxo, linha a linha; apenas um lote de ``batch_size``
+    linhas válidas fica em memória antes de ser gravado pelo repositório (COPY no
+    PostgreSQL). Colunas esperadas: ``name`` e ``event_id`` (este pode ser omitido
+    quando ``event_id`` é passado para toda a importação).
+    """
+
+    BATCH_SIZE = 5000
+
+    def __init__(self, participant_repository=None, event_repository=None,
+                 batch_size=BATCH_SIZE, max_errors=1000):
+        self.repo = participant_repository or ParticipantRepository()
+        self.event_repo = event_repository or EventRepository()
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+
+    @transactional
+    def import_stream(self, stream, fmt="csv", event_id=None):
+        if fmt not in FORMATS:
+            raise ValueError(f"Formato não suportado: {fmt}")
+
+        report = ImportReport(self.max_errors)
+        known_events, missing_events = set(), set()
+        batch = []
+        start = time.perf_counter()
+
+        for line, record in self._records(stream, fmt, report):
+            report.rows_read += 1
+            try:
+                batch.append((line, self._validate(record, event_id)))
+            except ValueError as e:
+                report.add_error(line, str(e))
+                continue
+            if len(batch) >= self.batch_size:
+                self._flush(batch, report, known_events, missing_events)
+                batch = []
+
+        self._flush(batch, report, known_events, missing_events)
+        report.elapsed_seconds = time.perf_counter() - start
+        return report
+
+    def _records(self, stream, fmt, report):
+        """Gera (número da linha, registro) sem ler o arquivo inteiro"""
+        text = stream if isinstance(stream, io.TextIOBase) else \
+            io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        if fmt == "csv":
+            reader = csv.DictReader(text)
+            try:
+                reader.fieldnames
+            except csv.Error as e:
+                raise ValueError(f"Cabeçalho CSV inválido: {e}")
+            while True:
+                try:
+                    record = next(reader)
+                except StopIteration:
+                    return
+                except csv.Error as e:
+                    # Linha física do leitor csv subjacente: o DictReader só a copia em registros válidos
+                    report.rows_read += 1
+                    report.add_error(reader.reader.line_num, f"CSV inválido: {e}")
+                    continue
+                yield reader.line_num, record
+        for line, raw in enumerate(text, start=1):
+            if not raw.strip():
+                continue
+            try:
+                record = json.loads(raw)
+            except json.JSONDecodeError as e:
+                report.rows_read += 1
+                report.add_error(line, f"JSON inválido: {e.msg}")
+                continue
+            if not isinstance(record, dict):
+                report.rows_read += 1
+                report.add_error(line, "Cada linha deve ser um objeto JSON")
+                continue
+            yield line, record
+
+    @staticmethod
+    def _validate(record, default_event_id):
+        name = record.get("name")
+        if name is not None and not isinstance(name, str):
+            raise ValueError("O nome do participante deve ser um texto")
+        name = Participant.validate_name((name or "").strip())
+        raw_event_id = record.get("event_id") or default_event_id
+        try:
+            event_id = int(raw_event_id)
+        except (TypeError, ValueError):
+            raise ValueError(f"ID de evento inválido: {raw_event_id!r}")
+        return {"name": name, "event_id": event_id}
+
+    def _flush(self, batch, report, known_events, missing_events):
+        if not batch:
+            return
+        # Confere de uma vez os eventos ainda não vistos nesta importação
+        unseen = {row["event_id"] for _, row in batch} - known_events - missing_events
+        if unseen:
+            found = self.event_repo.existing_ids(unseen)
+            known_events.update(found)
+            missing_events.update(unseen - found)
+
+        rows = []
+        for line, row in batch:
+            if row["event_id"] in known_events:
+                rows.append(row)
+            else:
+                report.add_error(line, f"Evento não encontrado: {row['event_id']}")
+        report.rows_imported += self.repo.bulk_insert(rows)
@@ -1,25 +1,28 @@
 # services/participant_service.py
-from src.services.base_service import BaseService
+from src.services.base_service import EventChildService
+from src.database.unit_of_work import transactional
 from src.repositories.participant_repository import ParticipantRepository
 from src.repositories.event_repository import EventRepository
 from src.factory.entity_factory import EntityFactory
+from src.models.participant import Participant
 
-class ParticipantService(BaseService):
+class ParticipantService(EventChildService):
     def __init__(self, participant_repository=None, event_repository=None):
         self.repo = participant_repository or ParticipantRepository()
         self.event_repo = event_repository or EventRepository()
 
+    @transactional
     def create(self, event_id, name):  
         if event_id is None:
             raise ValueError("ID de evento inválido")
             
-        event = self.event_repo.get_by_id(event_id)
-        if not event:
+        if not self.event_repo.exists(event_id):
             raise ValueError("Evento não encontrado")
         p = EntityFactory.create_participant(name, event_id)  
         saved = self.repo.add(p)
         return saved.to_dict()
 
+    @transactional
     def update(self, participant_id, new_name):
         p = self.repo.get_by_id(participant_id)
         if not p:
@@ -28,6 +31,7 @@ class ParticipantService(BaseService):
         updated = self.repo.add(p)
         return updated.to_dict()
 
+    @transactional
     def delete(self, participant_id):
         p = self.repo.get_by_id(participant_id)
         if not p:
@@ -35,18 +39,27 @@ class ParticipantService(BaseService):
         self.repo.remove(p)
         return True
 
-    def get_attendees(self, event_id):
-        event = self.event_repo.get_by_id(event_id)
-        if not event:
+    @transactional
+    def get_attendees(self, event_id, limit=None, after_id=None):
+        event_name = self.event_repo.names_by_id([event_id]).get(event_id)
+        if event_name is None:
             return None
-        
-        return [
-            {
-                "id": p.id,
-                "display_name": f"{p.id}: {p.name}",
-                "name": p.name,
-                "event_id": p.event_id,
-                "event_name": event.name
-            }
-            for p in event.participants
-        ]
\ No newline at end of file
+        return [self._listing(p, event_name) for p in self.repo.list_rows_by_event(event_id, limit, after_id)]
+
+    @staticmethod
+    def _listing(p, event_name):
+        return {
+            "id": p.id,
+            "display_name": f"{p.id}: {p.name}",
+            "name": p.name,
+            "event_id": p.event_id,
+            "event_name": event_name
+        }
+
+    def _to_row(self, item, partial=False):
+        row = {}
+        if not partial or "name" in item:
+            row["name"] = Participant.validate_name(item.get("name"))
+        if not partial or "event_id" in item:
+            row["event_id"] = int(item.get("event_id"))
+        return row
@@ -0,0 +1,49 @@
+# services/search_service.py
+from src.database.unit_of_work import transactional
+from src.repositories.event_repository import EventRepository
+from src.repositories.pagination import clamp_limit
+from src.repositories.search_repository import SOURCES, SearchRepository
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_QUERY_LENGTH = 200
+# Resultados ordenados por relevância não têm cursor por id; o deslocamento é limitado
+MAX_OFFSET = 1000
+
+class SearchService:
+    def __init__(self, search_repository=None, event_repository=None):
+        self.repo = search_repository or SearchRepository()
+        self.event_repo = event_repository or EventRepository()
+
+    @transactional
+    def search(self, text, kinds=None, event_id=None, limit=None, offset=0):
+        """Busca em eventos, palestrantes, fornecedores e feedbacks, da mais para a menos relevante.
+
+        Retorna {"results": [...], "limit", "offset", "next_offset"}; next_offset é None na última página.
+        """
+        text = (text or "").strip()
+        if not text:
+            raise ValueError("Informe um termo de busca.")
+        if len(text) > MAX_QUERY_LENGTH:
+            raise ValueError(f"O termo de busca deve ter no máximo {MAX_QUERY_LENGTH} caracteres.")
+        unknown = set(kinds or ()) - set(SOURCES)
+        if unknown:
+            raise ValueError(f"Tipos de busca desconhecidos: {', '.join(sorted(unknown))}")
+        limit = clamp_limit(limit, DEFAULT_SEARCH_LIMIT)
+        offset = min(max(int(offset or 0), 0), MAX_OFFSET)
+
+        # Uma linha a mais indica se existe próxima página
+        rows = self.repo.search(text, kinds, event_id, limit + 1, offset)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        names = self.event_repo.names_by_id({row["event_id"] for row in rows})
+        for row in rows:
+            row["event_name"] = names.get(row["event_id"])
+            if row["title"] is None:
+                row["title"] = f"Feedback {row['id']}"
+        return {
+            "results": rows,
+            "limit": limit,
+            "offset": offset,
+            "next_offset": offset + limit if has_more and offset + limit <= MAX_OFFSET else None,
+        }
@@ -1,23 +1,26 @@
 # services/speaker_service.py
 
-from src.services.base_service import BaseService
+from src.services.base_service import EventChildService
+from src.database.unit_of_work import transactional
 from src.repositories.speaker_repository import SpeakerRepository
 from src.repositories.event_repository import EventRepository
 from src.factory.entity_factory import EntityFactory
+from src.models.speaker import Speaker
 
-class SpeakerService(BaseService):
+class SpeakerService(EventChildService):
     def __init__(self, speaker_repository=None, event_repository=None):
         self.repo = speaker_repository or SpeakerRepository()
         self.event_repo = event_repository or EventRepository()
 
+    @transactional
     def create(self, name, description, event_id):
-        event = self.event_repo.get_by_id(event_id)
-        if not event:
+        if not self.event_repo.exists(event_id):
             return None
         s = EntityFactory.create_speaker(name, description, event_id)
         saved = self.repo.add(s)
         return saved.to_dict()
 
+    @transactional
     def update(self, speaker_id, new_name=None, new_description=None):
         s = self.repo.get_by_id(speaker_id)
         if not s:
@@ -29,6 +32,7 @@ class SpeakerService(BaseService):
         updated = self.repo.add(s)
         return updated.to_dict()
 
+    @transactional
     def delete(self, speaker_id):
         s = self.repo.get_by_id(speaker_id)
         if not s:
@@ -36,19 +40,30 @@ class SpeakerService(BaseService):
         self.repo.remove(s)
         return True
 
-    def list_speakers(self, event_id):
-        event = self.event_repo.get_by_id(event_id)
-        if not event:
+    @transactional
+    def list_speakers(self, event_id, limit=None, after_id=None):
+        event_name = self.event_repo.names_by_id([event_id]).get(event_id)
+        if event_name is None:
             return None
-        
-        return [
-            {
-                "id": s.id,
-                "display_name": f"{s.id}: {s.name}",
-                "name": s.name,
-                "description": s.description,
-                "event_id": s.event_id,
-                "event_name": event.name
-            }
-            for s in event.speakers
-        ]
+        return [self._listing(s, event_name) for s in self.repo.list_rows_by_event(event_id, limit, after_id)]
+
+    @staticmethod
+    def _listing(s, event_name):
+        return {
+            "id": s.id,
+            "display_name": f"{s.id}: {s.name}",
+            "name": s.name,
+            "description": s.description,
+            "event_id": s.event_id,
+            "event_name": event_name
+        }
+
+    def _to_row(self, item, partial=False):
+        row = {}
+        if not partial or "name" in item:
+            row["name"] = Speaker.validate_name(item.get("name"))
+        if not partial or "description" in item:
+            row["description"] = item.get("description")
+        if not partial or "event_id" in item:
+            row["event_id"] = int(item.get("event_id"))
+        return row
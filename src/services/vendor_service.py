@@ -1,22 +1,25 @@
 # services/vendor_service.py
-from src.services.base_service import BaseService
+from src.services.base_service import EventChildService
+from src.database.unit_of_work import transactional
 from src.repositories.vendor_repository import VendorRepository
 from src.repositories.event_repository import EventRepository
 from src.factory.entity_factory import EntityFactory
+from src.models.vendor import Vendor
 
-class VendorService(BaseService):
+class VendorService(EventChildService):
     def __init__(self, vendor_repository=None, event_repository=None):
         self.repo = vendor_repository or VendorRepository()
         self.event_repo = event_repository or EventRepository()
 
+    @transactional
     def create(self, name, services_offered, event_id):
-        event = self.event_repo.get_by_id(event_id)
-        if not event:
+        if not self.event_repo.exists(event_id):
             return None
         v = EntityFactory.create_vendor(name, services_offered, event_id)
         saved = self.repo.add(v)
         return saved.to_dict()
 
+    @transactional
     def update(self, vendor_id, new_name=None, new_services=None):
         v = self.repo.get_by_id(vendor_id)
         if not v:
@@ -28,6 +31,7 @@ class VendorService(BaseService):
         updated = self.repo.add(v)
         return updated.to_dict()
 
+    @transactional
     def delete(self, vendor_id):
         v = self.repo.get_by_id(vendor_id)
         if not v:
@@ -35,19 +39,30 @@ class VendorService(BaseService):
         self.repo.remove(v)
         return True
 
-    def list_vendors(self, event_id):
-        event = self.event_repo.get_by_id(event_id)
-        if not event:
+    @transactional
+    def list_vendors(self, event_id, limit=None, after_id=None):
+        event_name = self.event_repo.names_by_id([event_id]).get(event_id)
+        if event_name is None:
             return None
-        
-        return [
-            {
-                "id": v.id,
-                "display_name": f"{v.id}: {v.name}",
-                "name": v.name,
-                "services": v.services,
-                "event_id": v.event_id,
-                "event_name": event.name
-            }
-            for v in event.vendors
-        ]
\ No newline at end of file
+        return [self._listing(v, event_name) for v in self.repo.list_rows_by_event(event_id, limit, after_id)]
+
+    @staticmethod
+    def _listing(v, event_name):
+        return {
+            "id": v.id,
+            "display_name": f"{v.id}: {v.name}",
+            "name": v.name,
+            "services": v.services,
+            "event_id": v.event_id,
+            "event_name": event_name
+        }
+
+    def _to_row(self, item, partial=False):
+        row = {}
+        if not partial or "name" in item:
+            row["name"] = Vendor.validate_name(item.get("name"))
+        if not partial or "services" in item:
+            row["services"] = item.get("services")
+        if not partial or "event_id" in item:
+            row["event_id"] = int(item.get("event_id"))
+        return row
@@ -0,0 +1,41 @@
+# tests/conftest.py
+"""Testes contra o SQLite em memória: nenhum serviço externo é necessário.
+
+As variáveis de ambiente precisam estar definidas antes do primeiro import de
+src, que cria o engine, o cache e o relay do outbox na importação.
+"""
+import os
+
+os.environ["DATABASE_URL"] = "sqlite://"
+os.environ["OUTBOX_RELAY_ENABLED"] = "0"
+os.environ["CACHE_BACKEND"] = "memory"
+os.environ["NOTIFICATIONS_MODE"] = "sync"
+
+import pytest
+
+from app import create_app
+from src.cache.backends import MemoryBackend
+from src.cache.cache_manager import cache_manager
+from src.database.db import Base, engine
+from src.database.schema import create_schema
+from src.notifications.outbox import outbox_relay
+
+
+@pytest.fixture(autouse=True)
+def database():
+    """Esquema novo e cache vazio em cada teste"""
+    Base.metadata.drop_all(engine)
+    create_schema(engine, log=lambda *args: None)
+    cache_manager.configure(backend=MemoryBackend())
+    outbox_relay.reset_stats()
+    yield engine
+
+
+@pytest.fixture
+def app():
+    return create_app()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,82 @@
+# tests/test_budget_ledger.py
+"""O orçamento de um evento é sempre igual ao saldo do seu livro-razão."""
+import pytest
+
+from src.services.event_service import EventService
+
+
+@pytest.fixture
+def service():
+    return EventService()
+
+
+def assert_balanced(service, event_id, budget):
+    totals = service.get_budget_totals(event_id)
+    assert totals["budget"] == budget
+    assert totals["net"] == budget
+
+
+def test_create_records_initial_budget(service):
+    event = service.create("Conferência", "2025-06-01", 100)
+    assert_balanced(service, event["id"], 100)
+    assert [entry["kind"] for entry in service.get_budget_history(event["id"])] == ["set"]
+
+
+def test_create_without_budget_records_nothing(service):
+    event = service.create("Conferência", "2025-06-01", 0)
+    assert service.get_budget_history(event["id"]) == []
+    assert_balanced(service, event["id"], 0)
+
+
+def test_adjust_and_edit(service):
+    event_id = service.create("Conferência", "2025-06-01", 100)["id"]
+    service.update_budget(event_id, 50)
+    service.update_budget(event_id, -30)
+    service.edit_budget(event_id, 200)
+    service.update(event_id, budget="150.5")
+    assert_balanced(service, event_id, 150.5)
+    history = service.get_budget_history(event_id)
+    assert [entry["amount"] for entry in history] == [100, 50, -30, 80, -49.5]
+    assert history[-1]["balance"] == 150.5
+
+
+def test_negative_balance_is_refused(service):
+    event_id = service.create("Conferência", "2025-06-01", 100)["id"]
+    with pytest.raises(ValueError):
+        service.update_budget(event_id, -101)
+    assert_balanced(service, event_id, 100)
+    assert len(service.get_budget_history(event_id)) == 1
+
+
+def test_unchanged_budget_adds_no_entry(service):
+    event_id = service.create("Conferência", "2025-06-01", 100)["id"]
+    service.edit_budget(event_id, 100)
+    service.update(event_id, name="Conferência 2025", budget=100)
+    assert len(service.get_budget_history(event_id)) == 1
+
+
+def test_missing_event(service):
+    assert service.update_budget(999, 10) is None
+    assert service.edit_budget(999, 10) is None
+    assert service.get_budget_totals(999) is None
+
+
+def test_bulk_create_and_update(service):
+    created = service.bulk_create([
+        {"name": "Conferência", "date": "2025-06-01", "budget": 100},
+        {"name": "Workshop", "date": "2025-06-02"},
+    ])
+    first, second = (row["id"] for row in created)
+    assert created[0]["date"] == "2025-06-01"
+    assert_balanced(service, first, 100)
+    assert_balanced(service, second, 0)
+
+    # O mesmo id duas vezes no lote gera dois lançamentos encadeados
+    service.bulk_update([
+        {"id": first, "budget": 60},
+        {"id": first, "budget": 80},
+        {"id": second, "budget": 25},
+    ])
+    assert_balanced(service, first, 80)
+    assert_balanced(service, second, 25)
+    assert [entry["amount"] for entry in service.get_budget_history(first)] == [100, -40, 20]
@@ -0,0 +1,36 @@
+# tests/test_cache.py
+import pytest
+
+from src.cache.cache_manager import cache_manager
+from src.database.unit_of_work import UnitOfWork
+from src.services.event_service import CACHE_NAMESPACE, EventService
+
+
+def test_listing_is_cached_and_invalidated_on_change():
+    service = EventService()
+    service.create("Conferência", "2025-06-01", 0)
+    assert len(service.list_events()) == 1
+    assert len(service.list_events()) == 1
+    assert cache_manager.stats()[CACHE_NAMESPACE]["hits"] == 1
+
+    service.create("Workshop", "2025-06-02", 0)
+    assert [event["name"] for event in service.list_events()] == ["Conferência", "Workshop"]
+
+
+def test_read_after_write_is_not_cached_when_transaction_rolls_back():
+    service = EventService()
+    with pytest.raises(RuntimeError):
+        with UnitOfWork():
+            service.create("Conferência", "2025-06-01", 0)
+            # Esta leitura enxerga o evento ainda não confirmado
+            assert len(service.list_events()) == 1
+            raise RuntimeError
+    assert service.list_events() == []
+
+
+def test_get_event_reflects_update():
+    service = EventService()
+    event = service.create("Conferência", "2025-06-01", 0)
+    assert service.get_event(event["id"])["name"] == "Conferência"
+    service.update(event["id"], name="Conferência 2025")
+    assert service.get_event(event["id"])["name"] == "Conferência 2025"
@@ -0,0 +1,66 @@
+# tests/test_outbox.py
+import pytest
+from sqlalchemy import select
+
+from src.database.unit_of_work import UnitOfWork
+from src.models.outbox_message import OutboxMessage
+from src.notifications.notification_manager import NotificationManager
+from src.notifications.outbox import OutboxRelay, publish
+
+
+@pytest.fixture
+def manager():
+    return NotificationManager(mode="sync")
+
+
+def test_publish_is_discarded_with_rollback(manager):
+    relay = OutboxRelay(manager, enabled=False)
+    with pytest.raises(RuntimeError):
+        with UnitOfWork():
+            publish("event_created", {"id": 1})
+            raise RuntimeError
+    assert relay.pending() == 0
+
+
+def test_drain_delivers_and_deletes(manager):
+    received = []
+    manager.subscribe("event_created", received.append)
+    relay = OutboxRelay(manager, enabled=False)
+    with UnitOfWork():
+        publish("event_created", {"id": 1})
+        publish("event_created", {"id": 2})
+
+    assert relay.drain() == 2
+    assert received == [{"id": 1}, {"id": 2}]
+    assert relay.pending() == 0
+    assert relay.stats()["delivered"] == 2
+
+
+def test_failed_delivery_is_rescheduled(manager):
+    def failing(data):
+        raise RuntimeError("smtp fora do ar")
+
+    manager.subscribe("event_created", failing)
+    relay = OutboxRelay(manager, enabled=False)
+    with UnitOfWork():
+        publish("event_created", {"id": 1})
+
+    assert relay.drain() == 1
+    # Reagendada com backoff: ainda não está disponível para o próximo lote
+    assert relay.drain() == 0
+    with UnitOfWork() as uow:
+        message = uow.session.scalars(select(OutboxMessage)).one()
+        assert message.attempts == 1
+        assert message.last_error == "RuntimeError: smtp fora do ar"
+    assert relay.stats()["failed"] == 1
+
+
+def test_claim_leases_messages(manager):
+    relay = OutboxRelay(manager, enabled=False)
+    with UnitOfWork():
+        publish("event_created", {"id": 1})
+
+    assert len(relay._claim()) == 1
+    # Reservada: outro relay não a recebe enquanto a reserva não expirar
+    assert relay._claim() == []
+    assert relay.pending() == 1
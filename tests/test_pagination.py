@@ -0,0 +1,85 @@
+# tests/test_pagination.py
+import pytest
+
+from src.services.event_service import EventService
+from src.services.participant_service import ParticipantService
+
+
+def pages(client, path, **params):
+    """Percorre a listagem pelo cabeçalho X-Next-After-Id; devolve as páginas"""
+    result = []
+    while True:
+        response = client.get(path, query_string=params)
+        assert response.status_code == 200
+        result.append(response.get_json())
+        cursor = response.headers.get("X-Next-After-Id")
+        if cursor is None:
+            return result
+        params["after_id"] = cursor
+        if "X-Next-After-Date" in response.headers:
+            params["after_date"] = response.headers["X-Next-After-Date"]
+
+
+@pytest.fixture
+def event_ids():
+    return [row["id"] for row in EventService().bulk_create([
+        {"name": f"Evento {i}", "date": f"2025-06-{30 - i:02d}"} for i in range(7)
+    ])]
+
+
+def test_events_keyset(client, event_ids):
+    result = pages(client, "/api/v1/events", limit=3)
+    assert [len(page) for page in result] == [3, 3, 1]
+    assert [event["id"] for page in result for event in page] == event_ids
+
+
+def test_full_last_page_ends_with_empty_page(client, event_ids):
+    result = pages(client, "/api/v1/events", limit=7)
+    assert [len(page) for page in result] == [7, 0]
+
+
+def test_events_by_date(client, event_ids):
+    result = pages(client, "/api/v1/events", limit=2, start="2025-06-25", end="2025-06-30")
+    dates = [event["date"] for page in result for event in page]
+    assert dates == sorted(dates)
+    assert len(dates) == 6
+
+
+def test_date_cursor_survives_deleted_event(client, event_ids):
+    response = client.get("/api/v1/events", query_string={"limit": 2, "start": "2025-06-01"})
+    last = response.get_json()[-1]
+    EventService().delete(last["id"])
+    # O cursor traz a data junto com o id: a próxima página não depende do evento ainda existir
+    response = client.get("/api/v1/events", query_string={
+        "limit": 2, "start": "2025-06-01",
+        "after_id": response.headers["X-Next-After-Id"], "after_date": response.headers["X-Next-After-Date"],
+    })
+    assert [event["date"] for event in response.get_json()] == ["2025-06-26", "2025-06-27"]
+
+
+def test_attendees_keyset(client, event_ids):
+    service = ParticipantService()
+    ids = [service.create(event_ids[0], f"Participante {i}")["id"] for i in range(5)]
+    service.create(event_ids[1], "De outro evento")
+    result = pages(client, "/api/v1/attendees", event_id=event_ids[0], limit=2)
+    assert [p["id"] for page in result for p in page["participants"]] == ids
+
+
+def test_attendees_of_missing_event(client):
+    assert client.get("/api/v1/attendees", query_string={"event_id": 999}).status_code == 404
+
+
+@pytest.mark.parametrize("method, path", [
+    ("get", "/api/v1/get_budget"),
+    ("get", "/api/v1/budget_history"),
+    ("get", "/api/v1/budget_totals"),
+    ("post", "/api/v1/update_budget"),
+    ("post", "/api/v1/edit_budget"),
+])
+def test_budget_routes_reject_invalid_event_id(client, method, path):
+    if method == "get":
+        response = client.get(path, query_string={"event_id": "abc"})
+    else:
+        response = client.post(path, json={"event_id": "abc", "amount": 1, "new_budget": 1})
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "event_id must be an integer"}
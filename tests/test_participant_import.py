@@ -0,0 +1,102 @@
+# tests/test_participant_import.py
+import csv
+import io
+
+import pytest
+
+from src.services.event_service import EventService
+from src.services.participant_import_service import ParticipantImportService
+
+
+@pytest.fixture
+def event_id():
+    return EventService().create("Conferência", "2025-06-01", 0)["id"]
+
+
+def run(text, fmt, event_id=None):
+    stream = io.BytesIO(text.encode("utf-8"))
+    return ParticipantImportService(batch_size=2).import_stream(stream, fmt, event_id).to_dict()
+
+
+def test_csv_import(event_id):
+    report = run(f"name,event_id\nAna,{event_id}\nBeto,{event_id}\nCaio,{event_id}\n", "csv")
+    assert report["rows_read"] == 3
+    assert report["rows_imported"] == 3
+    assert report["errors"] == []
+
+
+def test_csv_errors_report_physical_line(event_id):
+    text = (
+        "name,event_id\n"
+        '"Ana\nde Souza",\n'       # linhas 2-3: registro com quebra de linha dentro das aspas
+        ",\n"                      # linha 4: nome vazio
+        "Beto,999\n"               # linha 5: evento inexistente
+        "Caio,\n"                  # linha 6
+    )
+    report = run(text, "csv", event_id)
+    assert report["rows_imported"] == 2
+    assert [error["line"] for error in report["errors"]] == [4, 5]
+    assert report["errors"][1]["error"] == "Evento não encontrado: 999"
+
+
+def test_csv_malformed_row(event_id):
+    limit = csv.field_size_limit()
+    csv.field_size_limit(10)
+    try:
+        report = run("name\nAna\n" + "x" * 20 + "\nBeto\n", "csv", event_id)
+    finally:
+        csv.field_size_limit(limit)
+    assert report["rows_read"] == 3
+    assert report["rows_imported"] == 2
+    assert [error["line"] for error in report["errors"]] == [3]
+    assert report["errors"][0]["error"].startswith("CSV inválido")
+
+
+def test_csv_invalid_header():
+    limit = csv.field_size_limit()
+    csv.field_size_limit(10)
+    try:
+        with pytest.raises(ValueError, match="Cabeçalho CSV inválido"):
+            run("x" * 20 + "\nAna\n", "csv", 1)
+    finally:
+        csv.field_size_limit(limit)
+
+
+def test_jsonl_errors(event_id):
+    text = (
+        '{"name": "Ana"}\n'
+        "\n"
+        "{invalido\n"
+        "[1, 2]\n"
+        '{"name": 42}\n'
+        '{"name": "Beto"}\n'
+    )
+    report = run(text, "jsonl", event_id)
+    assert report["rows_imported"] == 2
+    assert [(error["line"], error["error"].split(":")[0]) for error in report["errors"]] == [
+        (3, "JSON inválido"),
+        (4, "Cada linha deve ser um objeto JSON"),
+        (5, "O nome do participante deve ser um texto"),
+    ]
+
+
+def test_unsupported_format():
+    with pytest.raises(ValueError):
+        run("", "xml")
+
+
+def test_import_endpoint(client, event_id):
+    response = client.post(f"/api/v1/import_participants?format=jsonl&event_id={event_id}",
+                           data=b'{"name": "Ana"}\n{"name": ""}\n')
+    assert response.status_code == 200
+    report = response.get_json()["report"]
+    assert report["rows_imported"] == 1
+    assert report["error_count"] == 1
+
+    attendees = client.get("/api/v1/attendees", query_string={"event_id": event_id}).get_json()
+    assert [p["name"] for p in attendees["participants"]] == ["Ana"]
+
+
+def test_import_endpoint_rejects_unknown_format(client):
+    response = client.post("/api/v1/import_participants?format=xml", data=b"")
+    assert response.status_code == 400
@@ -0,0 +1,82 @@
+# tests/test_unit_of_work.py
+import pytest
+from sqlalchemy import func, select
+
+from src.database.unit_of_work import UnitOfWork, has_uncommitted_writes, on_commit
+from src.models.event import Event
+from src.services.event_service import EventService
+
+
+def count_events():
+    with UnitOfWork() as uow:
+        return uow.session.scalar(select(func.count()).select_from(Event))
+
+
+def test_commit_on_success():
+    with UnitOfWork():
+        EventService().create("Conferência", "2025-06-01", 100)
+    assert count_events() == 1
+
+
+def test_rollback_on_exception():
+    with pytest.raises(RuntimeError):
+        with UnitOfWork():
+            EventService().create("Conferência", "2025-06-01", 100)
+            raise RuntimeError("falha depois da gravação")
+    assert count_events() == 0
+
+
+def test_transactional_failure_discards_outer_work():
+    service = EventService()
+    with UnitOfWork():
+        service.create("Conferência", "2025-06-01", 100)
+        # O segundo item é inválido: o lote inteiro e o que veio antes na transação são desfeitos
+        with pytest.raises(ValueError):
+            service.bulk_create([{"name": "Workshop", "date": "2025-06-02"}, {"name": "", "date": "x"}])
+    assert count_events() == 0
+
+
+def test_on_commit_runs_only_after_commit():
+    calls = []
+    with UnitOfWork():
+        on_commit(lambda: calls.append("commit"))
+        assert calls == []
+    assert calls == ["commit"]
+
+    with pytest.raises(RuntimeError):
+        with UnitOfWork():
+            on_commit(lambda: calls.append("rollback"))
+            raise RuntimeError
+    assert calls == ["commit"]
+
+
+def test_on_commit_without_unit_of_work_runs_immediately():
+    calls = []
+    on_commit(lambda: calls.append(1))
+    assert calls == [1]
+
+
+def test_has_uncommitted_writes():
+    with UnitOfWork() as uow:
+        EventService().list_events()
+        assert not has_uncommitted_writes()
+        EventService().create("Conferência", "2025-06-01", 0)
+        assert has_uncommitted_writes()
+        uow.commit()
+        assert not has_uncommitted_writes()
+    assert not has_uncommitted_writes()
+
+
+def test_error_response_is_not_committed(client):
+    response = client.post("/api/v1/bulk_create_events", json={"events": [
+        {"name": "Conferência", "date": "2025-06-01"},
+        {"name": "Workshop", "date": "data inválida"},
+    ]})
+    assert response.status_code == 400
+    assert count_events() == 0
+
+
+def test_request_commits_once_at_the_end(client):
+    response = client.post("/api/v1/create_event", json={"name": "Conferência", "date": "2025-06-01", "budget": 10})
+    assert response.status_code == 201
+    assert count_events() == 1
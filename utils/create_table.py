@@ -1,19 +1,36 @@
-import psycopg2
-from psycopg2 import sql
+import os
+import sys
 
-# Dados de acesso
-HOST = "localhost"
-USER = "postgres"
-PASSWORD = "123456"
-DB_NAME = "postgres"
+from sqlalchemy.engine import make_url
+
+# Permite executar o script diretamente (python utils/create_table.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database.db import DATABASE_URL, is_memory_database
+from src.database.migrations import migrate
+from src.database.schema import create_schema
+
+# Dados de acesso: os mesmos do engine (DATABASE_URL / src/database/config.py)
+URL = make_url(DATABASE_URL)
+DB_NAME = URL.database
 
 # Conecta ao banco default para criar o novo banco
 def criar_banco():
-    conn = psycopg2.connect(host=HOST, user=USER, password=PASSWORD, dbname="postgres")
+    if URL.get_backend_name() != "postgresql":
+        # SQLite: o arquivo é criado na primeira conexão (e :memory: não tem arquivo)
+        if not is_memory_database(URL) and os.path.dirname(DB_NAME):
+            os.makedirs(os.path.dirname(DB_NAME), exist_ok=True)
+        return
+
+    import psycopg2
+    from psycopg2 import sql
+
+    conn = psycopg2.connect(host=URL.host, port=URL.port, user=URL.username, password=URL.password,
+                            dbname="postgres")
     conn.autocommit = True
     cursor = conn.cursor()
 
-    cursor.execute(f"SELECT 1 FROM pg_database WHERE datname = '{DB_NAME}'")
+    cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", (DB_NAME,))
     exists = cursor.fetchone()
 
     if not exists:
@@ -25,69 +42,18 @@ def criar_banco():
     cursor.close()
     conn.close()
 
-# Cria as tabelas no novo banco
-def criar_tabelas():
-    conn = psycopg2.connect(host=HOST, user=USER, password=PASSWORD, dbname=DB_NAME)
-    cursor = conn.cursor()
-
-    comandos = [
-        """
-        CREATE TABLE IF NOT EXISTS public.events (
-            id serial4 NOT NULL,
-            "name" varchar NOT NULL,
-            "date" varchar NOT NULL,
-            budget int4 NULL,
-            CONSTRAINT events_pkey PRIMARY KEY (id)
-        );
-        CREATE INDEX IF NOT EXISTS ix_events_id ON public.events USING btree (id);
-        """,
-        """
-        CREATE TABLE IF NOT EXISTS public.feedbacks (
-            id serial4 NOT NULL,
-            "content" text NOT NULL,
-            event_id int4 NOT NULL,
-            CONSTRAINT feedbacks_pkey PRIMARY KEY (id),
-            CONSTRAINT fk_feedback_event FOREIGN KEY (event_id) REFERENCES public.events(id) ON DELETE CASCADE
-        );
-        """,
-        """
-        CREATE TABLE IF NOT EXISTS public.participants (
-            id serial4 NOT NULL,
-            "name" varchar(255) NOT NULL,
-            event_id int4 NOT NULL,
-            CONSTRAINT participants_pkey PRIMARY KEY (id),
-            CONSTRAINT fk_participant_event FOREIGN KEY (event_id) REFERENCES public.events(id) ON DELETE CASCADE
-        );
-        """,
-        """
-        CREATE TABLE IF NOT EXISTS public.speakers (
-            id serial4 NOT NULL,
-            "name" varchar(255) NOT NULL,
-            description varchar(255) NULL,
-            event_id int4 NOT NULL,
-            CONSTRAINT speakers_pkey PRIMARY KEY (id),
-            CONSTRAINT fk_speaker_event FOREIGN KEY (event_id) REFERENCES public.events(id) ON DELETE CASCADE
-        );
-        """,
-        """
-        CREATE TABLE IF NOT EXISTS public.vendors (
-            id serial4 NOT NULL,
-            "name" varchar(255) NOT NULL,
-            services varchar(255) NULL,
-            event_id int4 NOT NULL,
-            CONSTRAINT vendors_pkey PRIMARY KEY (id),
-            CONSTRAINT fk_vendor_event FOREIGN KEY (event_id) REFERENCES public.events(id) ON DELETE CASCADE
-        );
-        """
-    ]
-
-    for comando in comandos:
-        cursor.execute(comando)
-
-    conn.commit()
-    cursor.close()
-    conn.close()
-    print("Tabelas criadas com sucesso!")
+# Cria ou atualiza as tabelas: migrações pendentes no PostgreSQL, modelos nos demais bancos
+def criar_tabelas(dry_run=False):
+    if URL.get_backend_name() != "postgresql":
+        if dry_run:
+            print("[dry-run] As tabelas seriam criadas a partir dos modelos.")
+        else:
+            create_schema()
+            print("Tabelas criadas a partir dos modelos.")
+        return
+    aplicadas = migrate(dry_run=dry_run)
+    if not dry_run:
+        print(f"Tabelas atualizadas ({len(aplicadas)} migração(ões) aplicada(s)).")
 
 if __name__ == "__main__":
     criar_banco()
@@ -0,0 +1,45 @@
+"""
+Confere ou reconstrói a tabela event_summary (contadores por evento mantidos por triggers).
+
+Uso:
+    python utils/event_summary.py            # confere e lista as divergências
+    python utils/event_summary.py --rebuild  # recalcula todos os contadores
+"""
+import argparse
+import os
+import sys
+
+# Permite executar o script diretamente (python utils/event_summary.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database.unit_of_work import UnitOfWork
+from src.repositories.event_summary_repository import EventSummaryRepository
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Confere ou reconstrói os contadores de event_summary.")
+    parser.add_argument("--rebuild", action="store_true", help="Recalcula todos os contadores")
+    parser.add_argument("--max-errors", type=int, default=50, help="Quantidade de divergências exibidas")
+    args = parser.parse_args(argv)
+
+    repo = EventSummaryRepository()
+    with UnitOfWork():
+        if args.rebuild:
+            print(f"Contadores recalculados para {repo.rebuild()} evento(s).")
+            return 0
+        mismatches = repo.verify()
+
+    for mismatch in mismatches[:args.max_errors]:
+        print(f"Evento {mismatch['event_id']}: {mismatch['column']} = {mismatch['stored']}, "
+              f"contagem real = {mismatch['actual']}")
+    if len(mismatches) > args.max_errors:
+        print(f"... e mais {len(mismatches) - args.max_errors} divergências.")
+    if mismatches:
+        print("Execute com --rebuild para corrigir.")
+        return 1
+    print("event_summary confere com as tabelas.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
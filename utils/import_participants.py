@@ -0,0 +1,48 @@
+"""
+Importação em lote de participantes a partir de um arquivo CSV ou JSON Lines.
+
+Uso:
+    python utils/import_participants.py participantes.csv
+    python utils/import_participants.py inscricoes.jsonl --event-id 3 --batch-size 10000
+"""
+import argparse
+import os
+import sys
+
+# Permite executar o script diretamente (python utils/import_participants.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database.unit_of_work import UnitOfWork
+from src.services.participant_import_service import FORMATS, ParticipantImportService, detect_format
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Importa participantes em lote (CSV ou JSONL).")
+    parser.add_argument("arquivo", help="Caminho do arquivo (.csv, .jsonl ou .ndjson)")
+    parser.add_argument("--format", choices=FORMATS, help="Formato do arquivo (padrão: pela extensão)")
+    parser.add_argument("--event-id", type=int, help="Evento usado nas linhas sem a coluna event_id")
+    parser.add_argument("--batch-size", type=int, default=ParticipantImportService.BATCH_SIZE,
+                        help="Linhas por lote enviado ao banco")
+    parser.add_argument("--max-errors", type=int, default=50, help="Quantidade de erros exibidos")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or detect_format(args.arquivo)
+    service = ParticipantImportService(batch_size=args.batch_size, max_errors=args.max_errors)
+
+    print(f"Importando {args.arquivo} ({fmt})...")
+    with open(args.arquivo, "rb") as fh, UnitOfWork():
+        report = service.import_stream(fh, fmt, args.event_id)
+
+    print(f"Linhas lidas:    {report.rows_read}")
+    print(f"Importadas:      {report.rows_imported}")
+    print(f"Com erro:        {report.error_count}")
+    print(f"Tempo:           {report.elapsed_seconds:.2f} s ({report.rows_per_second:.0f} linhas/s)")
+    for error in report.errors:
+        print(f"  linha {error['line']}: {error['error']}")
+    if report.error_count > len(report.errors):
+        print(f"  ... e mais {report.error_count - len(report.errors)} erros")
+    return 0 if report.error_count == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""
+Aplica as migrações do esquema (src/database/migrations) no banco de DATABASE_URL.
+
+Uso:
+    python utils/migrate.py              # aplica todas as pendentes
+    python utils/migrate.py --dry-run    # mostra o SQL sem executar
+    python utils/migrate.py --target 2   # aplica até a versão 0002
+    python utils/migrate.py --status     # lista aplicadas e pendentes
+"""
+import argparse
+import os
+import sys
+
+# Permite executar o script diretamente (python utils/migrate.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database.migrations import migrate, status
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aplica as migrações pendentes do esquema.")
+    parser.add_argument("--dry-run", action="store_true", help="Mostra os comandos sem executá-los")
+    parser.add_argument("--target", type=int, help="Última versão a aplicar (padrão: todas)")
+    parser.add_argument("--status", action="store_true", help="Lista as migrações e a situação de cada uma")
+    args = parser.parse_args(argv)
+
+    if args.status:
+        changed = False
+        for migration, situation in status():
+            print(f"{migration!r:40} {situation}")
+            changed = changed or situation == "alterada"
+        # Uma migração editada depois de aplicada não é reaplicada; sinaliza para o operador
+        return 1 if changed else 0
+
+    migrate(target=args.target, dry_run=args.dry_run)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,45 +1,69 @@
-import psycopg2
-from psycopg2 import sql
+import os
+import sys
 
-# Dados de acesso
-HOST = "localhost"
-USER = "postgres"
-PASSWORD = "123456"
-DB_NAME = "postgres"
+from sqlalchemy.engine import make_url
+
+# Permite executar o script diretamente (python utils/reset_db.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database.config import load_database_config
+
+# Dados de acesso: os mesmos do engine (DATABASE_URL / src/database/config.py)
+URL = make_url(load_database_config()["url"])
+DB_NAME = URL.database
+
+def reset_sqlite():
+    # Em memória não há nada a apagar; em arquivo remove também o WAL e a memória compartilhada
+    if DB_NAME in (None, "", ":memory:"):
+        print("Banco SQLite em memória: nada a remover.")
+        return
+    for path in (DB_NAME, f"{DB_NAME}-wal", f"{DB_NAME}-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+            print(f"Removido: {path}")
+    print("Execute 'python main.py setup' para recriar as tabelas.")
 
 def reset_database():
+    if URL.get_backend_name() == "sqlite":
+        reset_sqlite()
+        return
+
+    import psycopg2
+    from psycopg2 import sql
+
     # Conecta ao banco postgres (serve como fallback caso nosso banco seja apagado)
-    conn = psycopg2.connect(host=HOST, user=USER, password=PASSWORD, dbname="postgres")
+    conn = psycopg2.connect(host=URL.host, port=URL.port, user=URL.username, password=URL.password,
+                            dbname="postgres")
     conn.autocommit = True
     cursor = conn.cursor()
     
     print("Encerrando conexões ativas...")
     try:
         # Encerra todas as conexões existentes ao banco
-        cursor.execute(f"""
+        cursor.execute("""
             SELECT pg_terminate_backend(pg_stat_activity.pid)
             FROM pg_stat_activity 
-            WHERE pg_stat_activity.datname = '{DB_NAME}'
+            WHERE pg_stat_activity.datname = %s
             AND pid <> pg_backend_pid()
-        """)
+        """, (DB_NAME,))
     except Exception as e:
         print(f"Aviso ao encerrar conexões: {e}")
     
     # Verifica se o banco existe
-    cursor.execute(f"SELECT 1 FROM pg_database WHERE datname = '{DB_NAME}'")
+    cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", (DB_NAME,))
     exists = cursor.fetchone()
     
     if exists:
         print(f"Removendo banco de dados '{DB_NAME}'...")
         try:
-            cursor.execute(f"DROP DATABASE {DB_NAME}")
+            cursor.execute(sql.SQL("DROP DATABASE {}").format(sql.Identifier(DB_NAME)))
             print(f"Banco de dados '{DB_NAME}' removido com sucesso!")
         except Exception as e:
             print(f"Erro ao remover banco: {e}")
     else:
         print(f"Banco de dados '{DB_NAME}' não existe ou já foi removido.")
     
-    print("Banco será recriado automaticamente ao iniciar a aplicação.")
+    print("Execute 'python main.py setup' para recriar o banco.")
     cursor.close()
     conn.close()
 
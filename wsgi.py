@@ -0,0 +1,24 @@
+"""
+Ponto de entrada WSGI para produção (gunicorn -c gunicorn.conf.py wsgi:app).
+
+Com preload_app o módulo é importado uma vez no processo mestre e os workers
+herdam o resultado pelo fork: por isso o aquecimento abaixo é feito aqui, e
+não no primeiro request de cada worker. Nenhuma conexão com o banco é aberta
+na importação (a unidade de trabalho só abre a sessão na primeira consulta).
+"""
+from sqlalchemy.orm import configure_mappers
+
+from app import create_app
+
+
+def warm_up(app):
+    """Faz antes do fork o trabalho que cada worker faria no primeiro request"""
+    # Configuração dos mapeamentos do SQLAlchemy (relacionamentos, colunas)
+    configure_mappers()
+    # Compilação de todos os templates Jinja (ficam no cache do ambiente)
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
+
+
+app = create_app()
+warm_up(app)